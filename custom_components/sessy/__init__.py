@@ -1,5 +1,6 @@
 """The Sessy integration."""
 from __future__ import annotations
+from functools import partial
 import logging
 
 from homeassistant.const import (
@@ -7,30 +8,77 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from sessypy.devices import get_sessy_device
 from sessypy.util import SessyLoginException, SessyConnectionException, SessyNotSupportedException
 
-from .coordinator import refresh_coordinators, setup_coordinators, update_coordinator_options
-from .models import SessyConfigEntry, SessyRuntimeData
-from .device import generate_device_info
+from .archive import archive_raw_retention, async_setup_archive
+from .const import (
+    CONF_ARCHIVE,
+    CONF_ENTITY_PROFILE,
+    CONF_STATISTICS_MODE,
+    CONF_TELEMETRY_HOURS,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_TELEMETRY_HOURS,
+    DOMAIN,
+)
+from .coordinator import (
+    async_save_endpoints,
+    refresh_coordinators,
+    setup_coordinators,
+    update_coordinator_options,
+)
+from .metrics import SessyStartupTimeline
+from .models import SessyConfigEntry, SessyEntityProfile, SessyRuntimeData
+from .ota import async_get_ota_tracker
+from .device import (
+    async_pop_validated_device,
+    async_set_device_host,
+    create_sessy_device,
+    generate_device_info,
+)
+from .services import async_setup_services
+from .statistics import async_setup_statistics
+from .supervisor import SessySupervisor
+from .telemetry import async_setup_telemetry, update_telemetry_options
+from .view import SessyPayloadView
+from .websocket_api import async_end_streams, async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.BUTTON, Platform.SENSOR, Platform.SELECT, Platform.NUMBER, Platform.SWITCH, Platform.TIME, Platform.UPDATE]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Sessy integration."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    hass.http.register_view(SessyPayloadView())
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: SessyConfigEntry) -> bool:
     """Set up Sessy from a config entry."""
    
     host = config_entry.data.get(CONF_HOST)
+    timeline = SessyStartupTimeline()
 
     _LOGGER.debug(f"Connecting to Sessy device at {host}")
     try:
-        device = await get_sessy_device(
-            host = host,
-            username = config_entry.data.get(CONF_USERNAME),
-            password = config_entry.data.get(CONF_PASSWORD),
-        )
+        with timeline.phase("discovery"):
+            # Reuse the connection of the config flow if the entry was just added or reconfigured
+            device = async_pop_validated_device(hass, config_entry.data)
+            if device is None:
+                # Known devices are created from their serial number, errors surface on the first refresh
+                device = create_sessy_device(config_entry)
+            if device is None:
+                device = await get_sessy_device(
+                    host = host,
+                    username = config_entry.data.get(CONF_USERNAME),
+                    password = config_entry.data.get(CONF_PASSWORD),
+                )
 
         # Prevent duplicate entries in older setups
         if not config_entry.unique_id:
@@ -48,28 +96,100 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SessyConfigEntry)
     else:
         _LOGGER.info(f"Connection to {device.__class__} at {device.host} successful")
 
-    coordinators = await setup_coordinators(hass, config_entry, device)
+    supervisor = SessySupervisor(hass, config_entry, device)
+    try:
+        coordinators = await setup_coordinators(hass, config_entry, device, timeline, supervisor)
+    except SessyLoginException as e:
+        await device.close()
+        raise ConfigEntryAuthFailed(f"Failed to connect to Sessy device at {host}: Authentication failed") from e
+    except SessyConnectionException as e:
+        await device.close()
+        raise ConfigEntryNotReady(f"Failed to connect to Sessy device at {host}: Network error") from e
+    except Exception:
+        # First refresh failed, the setup is retried with a new session
+        await device.close()
+        raise
+
+    with timeline.phase("device_info"):
+        device_info = await generate_device_info(hass, config_entry, device, coordinators)
 
     config_entry.runtime_data = SessyRuntimeData(
         device = device, 
         coordinators = coordinators,
-        device_info = await generate_device_info(hass, config_entry, device, coordinators)
+        device_info = device_info,
+        timeline = timeline,
+        supervisor = supervisor,
+        ota_tracker = await async_get_ota_tracker(hass),
+        entity_profile = SessyEntityProfile(
+            config_entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+        ),
+    )
+    config_entry.async_on_unload(
+        config_entry.runtime_data.ota_tracker.async_register(config_entry)
     )
+    config_entry.async_on_unload(partial(async_end_streams, config_entry))
 
-    config_entry.add_update_listener(
-        listener=update_coordinator_options
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(
+            listener=async_update_options
+        )
     )
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    with timeline.phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+
+    # Endpoints whose entities are all disabled are not fetched on the next start.
+    # Enabling an entity reloads the entry, which fetches its endpoint again.
+    await async_save_endpoints(hass, config_entry)
 
     # Refresh data once more to populate flattened data
-    await refresh_coordinators(config_entry)
+    with timeline.phase("refresh"):
+        await refresh_coordinators(config_entry)
+
+    if config_entry.options.get(CONF_STATISTICS_MODE, False):
+        config_entry.runtime_data.statistics = await async_setup_statistics(hass, config_entry)
+
+    config_entry.runtime_data.telemetry = async_setup_telemetry(config_entry)
+
+    if config_entry.options.get(CONF_ARCHIVE, False):
+        config_entry.runtime_data.archive = await async_setup_archive(hass, config_entry)
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, config_entry: SessyConfigEntry):
+    """Apply changed options and host, reloading the entry if an option cannot be applied live."""
+    runtime_data = config_entry.runtime_data
+
+    # Zeroconf announcements update the host without reloading
+    host = config_entry.data.get(CONF_HOST)
+    if host != runtime_data.device.host:
+        _LOGGER.info(f"{runtime_data.device.name} moved to {host}")
+        async_set_device_host(runtime_data.device, host)
+
+    statistics_mode = config_entry.options.get(CONF_STATISTICS_MODE, False)
+    archive = config_entry.options.get(CONF_ARCHIVE, False)
+    telemetry = config_entry.options.get(CONF_TELEMETRY_HOURS, DEFAULT_TELEMETRY_HOURS) != 0
+    entity_profile = config_entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+    if (
+        statistics_mode != (runtime_data.statistics is not None)
+        or archive != (runtime_data.archive is not None)
+        or telemetry != (runtime_data.telemetry is not None)
+        or entity_profile != runtime_data.entity_profile
+    ):
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    await update_coordinator_options(hass, config_entry)
+    update_telemetry_options(config_entry)
+    if runtime_data.archive is not None:
+        runtime_data.archive.raw_retention = archive_raw_retention(config_entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: SessyConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if config_entry.runtime_data.turbo is not None:
+        config_entry.runtime_data.turbo.async_stop()
     await config_entry.runtime_data.device.close()
     return unload_ok
@@ -0,0 +1,80 @@
+"""Aggregation of fast samples into published windows for Sessy"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class SessyWindowAggregate:
+    """Time-weighted mean, minimum and maximum of a single value over a publish window"""
+
+    __slots__ = (
+        "start",
+        "last_value",
+        "last_time",
+        "weighted_sum",
+        "minimum",
+        "maximum",
+    )
+
+    def __init__(self, value: float, timestamp: float):
+        self.start = timestamp
+        self.last_value = value
+        self.last_time = timestamp
+        self.weighted_sum = 0.0
+        self.minimum = value
+        self.maximum = value
+
+    def add(self, value: float, timestamp: float):
+        # Each sample holds until the next one arrives
+        self.weighted_sum += self.last_value * (timestamp - self.last_time)
+        self.last_value = value
+        self.last_time = timestamp
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def result(self, timestamp: float) -> tuple[float, float, float]:
+        """Return (mean, minimum, maximum) of the window ending at timestamp"""
+        duration = timestamp - self.start
+        if duration <= 0:
+            return self.last_value, self.minimum, self.maximum
+
+        weighted_sum = self.weighted_sum + self.last_value * (timestamp - self.last_time)
+        return weighted_sum / duration, self.minimum, self.maximum
+
+
+class SessyWindowAggregator:
+    """Aggregates the numeric values of flattened coordinator data per entity context"""
+
+    def __init__(self):
+        self._aggregates: dict[Any, SessyWindowAggregate] = dict()
+
+    def add(self, flattened_data: dict[Any, tuple[Any, bool]], timestamp: float):
+        for context, (value, available) in flattened_data.items():
+            if not context.aggregate or not available:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+
+            aggregate = self._aggregates.get(context)
+            if aggregate is None:
+                self._aggregates[context] = SessyWindowAggregate(value, timestamp)
+            else:
+                aggregate.add(value, timestamp)
+
+    def publish(self, timestamp: float) -> dict[Any, tuple[float, float, float]]:
+        """Close the current window, returning (mean, minimum, maximum) per context.
+
+        The next window starts with the last known value of each context."""
+        results = dict()
+        next_aggregates = dict()
+        for context, aggregate in self._aggregates.items():
+            results[context] = aggregate.result(timestamp)
+            next_aggregates[context] = SessyWindowAggregate(
+                aggregate.last_value, timestamp
+            )
+
+        self._aggregates = next_aggregates
+        return results
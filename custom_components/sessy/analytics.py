@@ -0,0 +1,190 @@
+"""Incremental battery analytics, fed by the power and energy status coordinators"""
+
+from __future__ import annotations
+
+from math import exp
+from time import monotonic
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    ANALYTICS_MIN_SOC_SLOPE,
+    ANALYTICS_POWER_TIME_CONSTANT,
+    ANALYTICS_PUBLISH_INTERVAL,
+    ANALYTICS_SOC_TIME_CONSTANT,
+    SESSY_BATTERY_CAPACITY_WH,
+)
+from .coordinator import SessyCoordinator
+from .util import get_nested_key
+
+
+def _numeric(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class SessyEwma:
+    """Exponentially weighted moving average over irregularly spaced samples"""
+
+    __slots__ = ("time_constant", "value")
+
+    def __init__(self, time_constant: float):
+        self.time_constant = time_constant
+        self.value: float = None
+
+    def add(self, value: float, elapsed: float):
+        if self.value is None:
+            self.value = value
+            return
+        alpha = 1 - exp(-elapsed / self.time_constant)
+        self.value += alpha * (value - self.value)
+
+
+class SessyBatteryAnalytics:
+    """Running battery statistics with constant memory.
+
+    Samples are taken from the coordinators while any analytics sensor listens,
+    and published to the listeners at ANALYTICS_PUBLISH_INTERVAL."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        power_status_coordinator: SessyCoordinator,
+        energy_status_coordinator: SessyCoordinator | None,
+    ):
+        self.hass = hass
+        self.power_status_coordinator = power_status_coordinator
+        self.energy_status_coordinator = energy_status_coordinator
+
+        # Power in W, ramp rate in W/s, state of charge slope in fraction per second
+        self.power = SessyEwma(ANALYTICS_POWER_TIME_CONSTANT)
+        self.ramp = SessyEwma(ANALYTICS_POWER_TIME_CONSTANT)
+        self.soc_slope = SessyEwma(ANALYTICS_SOC_TIME_CONSTANT)
+        self.state_of_charge: float = None
+        self.charged_wh: float = None
+        self.discharged_wh: float = None
+
+        self._last_power: tuple[float, float] = None
+        self._last_soc: tuple[float, float] = None
+
+        self._listeners: list[Callable[[], None]] = list()
+        self._unsubscribers: list[Callable[[], None]] = list()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for published analytics, sampling the coordinators while listened to"""
+        if len(self._listeners) == 0:
+            self._async_start()
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(update_callback)
+            if len(self._listeners) == 0:
+                self._async_stop()
+
+        return remove_listener
+
+    @callback
+    def _async_start(self):
+        self._unsubscribers.append(
+            self.power_status_coordinator.async_add_sample_listener(self.async_handle_power_status)
+        )
+        if self.energy_status_coordinator is not None:
+            self._unsubscribers.append(
+                self.energy_status_coordinator.async_add_sample_listener(self.async_handle_energy_status)
+            )
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self.hass,
+                self._async_publish,
+                ANALYTICS_PUBLISH_INTERVAL,
+                name="Sessy battery analytics",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_stop(self):
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+
+    @callback
+    def _async_publish(self, now=None):
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_handle_power_status(self, data: dict):
+        now = monotonic()
+
+        power = get_nested_key(data, "sessy.power")
+        if _numeric(power):
+            if self._last_power is not None:
+                last_time, last_power = self._last_power
+                elapsed = now - last_time
+                if elapsed > 0:
+                    self.ramp.add((power - last_power) / elapsed, elapsed)
+                    self.power.add(power, elapsed)
+            else:
+                self.power.add(power, 0)
+            self._last_power = (now, power)
+
+        state_of_charge = get_nested_key(data, "sessy.state_of_charge")
+        if _numeric(state_of_charge):
+            if self._last_soc is not None:
+                last_time, last_soc = self._last_soc
+                elapsed = now - last_time
+                if elapsed > 0:
+                    self.soc_slope.add((state_of_charge - last_soc) / elapsed, elapsed)
+            self._last_soc = (now, state_of_charge)
+            self.state_of_charge = state_of_charge
+
+    @callback
+    def async_handle_energy_status(self, data: dict):
+        charged_wh = get_nested_key(data, "sessy_energy.import_wh")
+        discharged_wh = get_nested_key(data, "sessy_energy.export_wh")
+        if _numeric(charged_wh):
+            self.charged_wh = charged_wh
+        if _numeric(discharged_wh):
+            self.discharged_wh = discharged_wh
+
+    @property
+    def power_trend(self) -> float | None:
+        return self.power.value
+
+    @property
+    def ramp_rate(self) -> float | None:
+        """Power ramp rate in W/min"""
+        return self.ramp.value * 60 if self.ramp.value is not None else None
+
+    @property
+    def time_to_full(self) -> float | None:
+        """Minutes until full at the current charge rate"""
+        slope = self.soc_slope.value
+        if slope is None or self.state_of_charge is None or slope < ANALYTICS_MIN_SOC_SLOPE:
+            return None
+        return (1 - self.state_of_charge) / slope / 60
+
+    @property
+    def time_to_empty(self) -> float | None:
+        """Minutes until empty at the current discharge rate"""
+        slope = self.soc_slope.value
+        if slope is None or self.state_of_charge is None or slope > -ANALYTICS_MIN_SOC_SLOPE:
+            return None
+        return self.state_of_charge / -slope / 60
+
+    @property
+    def equivalent_full_cycles(self) -> float | None:
+        """Discharged energy in multiples of the nominal capacity"""
+        if self.discharged_wh is None:
+            return None
+        return self.discharged_wh / SESSY_BATTERY_CAPACITY_WH
+
+    @property
+    def round_trip_efficiency(self) -> float | None:
+        """Discharged energy as a percentage of the charged energy"""
+        if not self.charged_wh or self.discharged_wh is None:
+            return None
+        return self.discharged_wh / self.charged_wh * 100
@@ -0,0 +1,375 @@
+"""Persistent compact archive of Sessy telemetry, outside the recorder"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta
+import json
+import logging
+from math import floor, isnan, nan
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Any, Callable
+import zlib
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    ARCHIVE_COMPACT_INTERVAL,
+    ARCHIVE_COMPACTED_RESOLUTION,
+    ARCHIVE_COMPACTED_RETENTION,
+    ARCHIVE_FLUSH_INTERVAL,
+    ARCHIVE_QUERY_LIMIT,
+    ARCHIVE_VALUE_SCALE,
+    CONF_ARCHIVE_RAW_DAYS,
+    DEFAULT_ARCHIVE_RAW_DAYS,
+)
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .telemetry import TELEMETRY_FIELDS
+from .util import get_nested_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# Encoded value of a missing sample, chosen so deltas of scaled values still fit in 64 bits
+MISSING = -(2**62)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    endpoint TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    count INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_range ON chunks (endpoint, resolution, start);
+"""
+
+
+def encode_chunk(timestamps: list[float], columns: list[list[float]]) -> bytes:
+    """Encode timestamps (as milliseconds) and columns (as scaled integers) as compressed deltas"""
+    encoded = bytearray()
+    for values, scale in [(timestamps, 1000)] + [(column, ARCHIVE_VALUE_SCALE) for column in columns]:
+        deltas = array("q")
+        previous = 0
+        for value in values:
+            current = MISSING if isnan(value) else round(value * scale)
+            deltas.append(current - previous)
+            previous = current
+        encoded += deltas.tobytes()
+    return zlib.compress(bytes(encoded))
+
+
+def decode_chunk(data: bytes, count: int, field_count: int) -> tuple[list[float], list[list[float]]]:
+    """Decode a chunk into timestamps (seconds) and columns"""
+    deltas = array("q")
+    deltas.frombytes(zlib.decompress(data))
+
+    decoded = list()
+    for index in range(field_count + 1):
+        scale = 1000 if index == 0 else ARCHIVE_VALUE_SCALE
+        values = list()
+        current = 0
+        for delta in deltas[index * count : (index + 1) * count]:
+            current += delta
+            values.append(nan if current == MISSING else current / scale)
+        decoded.append(values)
+
+    return decoded[0], decoded[1:]
+
+
+def append_chunk(
+    endpoint_result: dict[str, Any],
+    start: float,
+    end: float,
+    fields: list[str] | None,
+    limit: int,
+    resolution: int,
+    count: int,
+    chunk_fields: list[str],
+    data: bytes,
+):
+    """Append the samples of a chunk between start and end to a query result, up to limit rows"""
+    timestamps, columns = decode_chunk(data, count, len(chunk_fields))
+    selected = [
+        (field, column)
+        for field, column in zip(chunk_fields, columns)
+        if fields is None or field in fields
+    ]
+    for row, timestamp in enumerate(timestamps):
+        if timestamp < start or timestamp > end:
+            continue
+        if len(endpoint_result["timestamps"]) >= limit:
+            endpoint_result["next_start"] = timestamp
+            break
+
+        endpoint_result["timestamps"].append(timestamp)
+        endpoint_result["resolution"].append(resolution)
+        for field, column in selected:
+            values = endpoint_result["values"].setdefault(
+                field, [None] * (len(endpoint_result["timestamps"]) - 1)
+            )
+            values.append(None if isnan(column[row]) else column[row])
+
+    # Pad fields missing from this chunk, so all columns keep the same length
+    for values in endpoint_result["values"].values():
+        values.extend([None] * (len(endpoint_result["timestamps"]) - len(values)))
+
+
+def downsample_rows(
+    timestamps: list[float], columns: list[list[float]], resolution: int
+) -> tuple[list[float], list[list[float]]]:
+    """Average rows per bucket of resolution seconds, ignoring missing values"""
+    buckets: dict[float, list[list[float]]] = dict()
+    for row, timestamp in enumerate(timestamps):
+        bucket = buckets.setdefault(
+            floor(timestamp / resolution) * resolution, [list() for _ in columns]
+        )
+        for values, column in zip(bucket, columns):
+            if not isnan(column[row]):
+                values.append(column[row])
+
+    bucket_timestamps = sorted(buckets)
+    bucket_columns = [
+        [
+            sum(values) / len(values) if (values := buckets[timestamp][index]) else nan
+            for timestamp in bucket_timestamps
+        ]
+        for index in range(len(columns))
+    ]
+    return bucket_timestamps, bucket_columns
+
+
+def archive_raw_retention(config_entry: SessyConfigEntry) -> timedelta:
+    return timedelta(
+        days=config_entry.options.get(CONF_ARCHIVE_RAW_DAYS, DEFAULT_ARCHIVE_RAW_DAYS)
+    )
+
+
+async def async_setup_archive(hass: HomeAssistant, config_entry: SessyConfigEntry) -> SessyArchive:
+    """Start archiving the telemetry of all coordinators with telemetry fields"""
+    serial_number = config_entry.runtime_data.device.serial_number.lower()
+    archive = SessyArchive(
+        hass,
+        hass.config.path(f"sessy_archive_{serial_number}.db"),
+        archive_raw_retention(config_entry),
+    )
+    await hass.async_add_executor_job(archive.open)
+
+    coordinators: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+    for coordinator in coordinators.values():
+        fields = TELEMETRY_FIELDS.get(coordinator.name)
+        if fields is not None:
+            archive.add_coordinator(coordinator, fields)
+
+    archive.async_start()
+    config_entry.async_on_unload(archive.async_stop)
+    return archive
+
+
+class SessyArchive:
+    """Append-only archive of coordinator samples in a dedicated SQLite database
+
+    Samples are collected in memory and written in batches from an executor thread as
+    compressed chunks of delta-encoded integers. Raw chunks older than raw_retention
+    are compacted into chunks of one minute averages.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, raw_retention: timedelta):
+        self.hass = hass
+        self.path = path
+        # Changed live from the options
+        self.raw_retention = raw_retention
+        self._connection: sqlite3.Connection = None
+        # Serializes access to the connection across executor threads
+        self._lock = Lock()
+        self._fields: dict[str, list[str]] = dict()
+        self._pending: dict[str, list[tuple[float, list[float]]]] = dict()
+        self._unsubscribers: list[Callable] = list()
+        self._unsub_final_write: Callable = None
+
+    def open(self):
+        with self._lock:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def add_coordinator(self, coordinator: SessyCoordinator, fields: list[str]):
+        self._fields[coordinator.name] = fields
+        self._pending[coordinator.name] = list()
+
+        @callback
+        def handle_sample(data: dict):
+            self._pending[coordinator.name].append((time(), self._row(fields, data)))
+
+        self._unsubscribers.append(coordinator.async_add_sample_listener(handle_sample))
+
+    @staticmethod
+    def _row(fields: list[str], data: dict) -> list[float]:
+        row = list()
+        for field in fields:
+            value = get_nested_key(data, field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                value = nan
+            row.append(value)
+        return row
+
+    @callback
+    def async_start(self):
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self.hass, self._async_flush, ARCHIVE_FLUSH_INTERVAL, name="Sessy archive flush"
+            )
+        )
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self.hass, self._async_compact, ARCHIVE_COMPACT_INTERVAL, name="Sessy archive compaction"
+            )
+        )
+        self._unsub_final_write = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+
+    async def async_stop(self):
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+
+        await self._async_flush()
+        await self.hass.async_add_executor_job(self.close)
+
+    async def _async_final_write(self, event: Event):
+        # Listeners registered with async_listen_once are removed when they fire
+        self._unsub_final_write = None
+        await self._async_flush()
+
+    async def _async_flush(self, now: datetime = None):
+        """Hand the pending samples over to an executor thread"""
+        chunks = list()
+        for endpoint, samples in self._pending.items():
+            if samples:
+                chunks.append((endpoint, self._fields[endpoint], samples))
+                self._pending[endpoint] = list()
+
+        if chunks:
+            await self.hass.async_add_executor_job(self.write, chunks)
+
+    async def _async_compact(self, now: datetime = None):
+        await self.hass.async_add_executor_job(self.compact, time())
+
+    def write(self, chunks: list[tuple[str, list[str], list[tuple[float, list[float]]]]]):
+        """Write batches of samples as raw chunks. Blocking, run in an executor."""
+        rows = list()
+        for endpoint, fields, samples in chunks:
+            timestamps = [timestamp for timestamp, _ in samples]
+            columns = [list(column) for column in zip(*[row for _, row in samples])]
+            rows.append(self._chunk_row(endpoint, 0, fields, timestamps, columns))
+
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+
+    @staticmethod
+    def _chunk_row(endpoint: str, resolution: int, fields: list[str], timestamps: list[float], columns: list[list[float]]) -> tuple:
+        return (
+            endpoint,
+            resolution,
+            timestamps[0],
+            timestamps[-1],
+            len(timestamps),
+            json.dumps(fields),
+            encode_chunk(timestamps, columns),
+        )
+
+    def compact(self, now: float):
+        """Downsample old raw chunks and drop expired compacted chunks. Blocking, run in an executor."""
+        with self._lock:
+            if self._connection is None:
+                return
+
+            raw_cutoff = now - self.raw_retention.total_seconds()
+            chunks = self._connection.execute(
+                "SELECT rowid, endpoint, count, fields, data FROM chunks "
+                "WHERE resolution = 0 AND end < ? ORDER BY endpoint, start",
+                (raw_cutoff,),
+            ).fetchall()
+
+            # Merge the raw chunks per endpoint, day and field set
+            groups: dict[tuple, tuple[list, list, list]] = dict()
+            for rowid, endpoint, count, fields, data in chunks:
+                timestamps, columns = decode_chunk(data, count, len(json.loads(fields)))
+                day = floor(timestamps[0] / 86400)
+                rowids, group_timestamps, group_columns = groups.setdefault(
+                    (endpoint, day, fields), (list(), list(), [list() for _ in columns])
+                )
+                rowids.append(rowid)
+                group_timestamps.extend(timestamps)
+                for group_column, column in zip(group_columns, columns):
+                    group_column.extend(column)
+
+            compacted_cutoff = now - ARCHIVE_COMPACTED_RETENTION.total_seconds()
+            with self._connection:
+                for (endpoint, _, fields), (rowids, timestamps, columns) in groups.items():
+                    timestamps, columns = downsample_rows(
+                        timestamps, columns, ARCHIVE_COMPACTED_RESOLUTION
+                    )
+                    self._connection.execute(
+                        "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        self._chunk_row(endpoint, ARCHIVE_COMPACTED_RESOLUTION, json.loads(fields), timestamps, columns),
+                    )
+                    self._connection.executemany(
+                        "DELETE FROM chunks WHERE rowid = ?", [(rowid,) for rowid in rowids]
+                    )
+                self._connection.execute(
+                    "DELETE FROM chunks WHERE resolution > 0 AND end < ?",
+                    (compacted_cutoff,),
+                )
+
+        if groups:
+            _LOGGER.debug(f"Compacted {len(chunks)} raw chunks of {self.path} into {len(groups)} chunks")
+
+    def query(self, start: float, end: float, fields: list[str] | None = None, limit: int = ARCHIVE_QUERY_LIMIT) -> dict[str, Any]:
+        """Read the archived samples between start and end per endpoint, in columnar form.
+
+        At most limit rows are returned per endpoint. If more rows are available, next_start
+        holds the timestamp to continue from. The chunks are read one at a time, up to the
+        limit. Blocking, run in an executor."""
+        result: dict[str, Any] = dict()
+        with self._lock:
+            if self._connection is None:
+                return result
+            for endpoint in sorted(TELEMETRY_FIELDS):
+                chunks = self._connection.execute(
+                    "SELECT resolution, count, fields, data FROM chunks "
+                    "WHERE endpoint = ? AND start <= ? AND end >= ? ORDER BY start, resolution",
+                    (endpoint, end, start),
+                )
+                for resolution, count, chunk_fields, data in chunks:
+                    endpoint_result = result.setdefault(
+                        endpoint, {"timestamps": list(), "resolution": list(), "values": dict()}
+                    )
+                    append_chunk(
+                        endpoint_result, start, end, fields, limit,
+                        resolution, count, json.loads(chunk_fields), data,
+                    )
+                    if "next_start" in endpoint_result:
+                        break
+
+        return result
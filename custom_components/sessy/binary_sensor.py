@@ -6,6 +6,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 
@@ -14,14 +15,26 @@ from sessypy.devices import SessyBattery, SessyDevice
 from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Binary sensors of the standard entity profile, removed in the minimal profile
+STANDARD_BINARY_SENSORS = (
+    "Strategy Override",
+)
+
+
+@track_platform_setup(Platform.BINARY_SENSOR)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -31,7 +44,9 @@ async def async_setup_entry(
     coordinators = config_entry.runtime_data.coordinators
     binary_sensors = []
 
-    if isinstance(device, SessyBattery):
+    if isinstance(device, SessyBattery) and config_entry.runtime_data.entity_profile.includes(
+        SessyEntityProfile.STANDARD
+    ):
         # Power Status
         try:
             power_status_coordinator: SessyCoordinator = coordinators[
@@ -57,6 +72,10 @@ async def async_setup_entry(
             _LOGGER.warning(f"Error setting up power status binary_sensors: {e}")
 
     async_add_entities(binary_sensors)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.BINARY_SENSOR, map(name_unique_id_suffix, STANDARD_BINARY_SENSORS)
+        )
 
 
 class SessyBinarySensor(SessyCoordinatorEntity, BinarySensorEntity):
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from functools import partial
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.exceptions import HomeAssistantError
@@ -14,14 +16,28 @@ from sessypy.util import SessyConnectionException, SessyNotSupportedException
 from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
 
 from .models import (
     SessyConfigEntry, 
     SessyConnectedDeviceType,
+    SessyEntityProfile,
 )
 
 
+# Buttons of the standard entity profile, removed in the minimal profile
+STANDARD_BUTTONS = (
+    "Dongle Restart",
+    "Check for updates",
+)
+
+
+@track_platform_setup(Platform.BUTTON)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -32,31 +48,37 @@ async def async_setup_entry(
 
     buttons = []
 
-    buttons.append(
-        SessyButton(
-            hass,
-            config_entry,
-            "Dongle Restart",
-            coordinators[device.get_system_info],
-            "status",
-            device.restart,
-            device_class=ButtonDeviceClass.RESTART,
-            entity_category=EntityCategory.DIAGNOSTIC,
+    if config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        buttons.append(
+            SessyButton(
+                hass,
+                config_entry,
+                "Dongle Restart",
+                coordinators[device.get_system_info],
+                "status",
+                # Pauses polling until the device answers again
+                config_entry.runtime_data.supervisor.async_restart,
+                device_class=ButtonDeviceClass.RESTART,
+                entity_category=EntityCategory.DIAGNOSTIC,
+            )
         )
-    )
-    buttons.append(
-        SessyButton(
-            hass,
-            config_entry,
-            "Check for updates",
-            coordinators[device.get_ota_status],
-            "status",
-            device.check_ota,
-            entity_category=EntityCategory.DIAGNOSTIC,
+        buttons.append(
+            SessyButton(
+                hass,
+                config_entry,
+                "Check for updates",
+                coordinators[device.get_ota_status],
+                "status",
+                partial(config_entry.runtime_data.ota_tracker.async_check, config_entry),
+                entity_category=EntityCategory.DIAGNOSTIC,
+            )
         )
-    )
 
     async_add_entities(buttons)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.BUTTON, map(name_unique_id_suffix, STANDARD_BUTTONS)
+        )
 
 
 class SessyButton(SessyCoordinatorEntity, ButtonEntity):
@@ -18,15 +18,48 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_SCAN_INTERVAL,
 )
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from sessypy.devices import get_sessy_device, SessyBattery, SessyP1Meter, SessyCTMeter
 from sessypy.util import SessyConnectionException, SessyLoginException
 
-from .const import DEFAULT_SCAN_INTERVAL_POWER, DOMAIN
+from .const import (
+    CONF_ARCHIVE,
+    CONF_ARCHIVE_RAW_DAYS,
+    CONF_ENTITY_PROFILE,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SCAN_INTERVAL_DIAGNOSTICS,
+    CONF_SCAN_INTERVAL_ENERGY,
+    CONF_SCAN_INTERVAL_SETTINGS,
+    CONF_SCAN_INTERVAL_STRATEGY,
+    CONF_STATISTICS_MODE,
+    CONF_TELEMETRY_HOURS,
+    DEFAULT_ARCHIVE_RAW_DAYS,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_POWER,
+    DEFAULT_TELEMETRY_HOURS,
+    DOMAIN,
+)
+from .device import async_cache_validated_device
+from .models import SessyEntityProfile
 
 _LOGGER = logging.getLogger(__name__)
 
+ENTITY_PROFILE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(SessyEntityProfile),
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key=CONF_ENTITY_PROFILE,
+    )
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -56,7 +89,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     else:
         device_info = {"title": f"Sessy {device_id}"}
 
-    await device.close()
+    # Hand the open connection over to async_setup_entry, which follows shortly
+    async_cache_validated_device(hass, data, device)
     return device_info
 
 
@@ -87,11 +121,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_USERNAME, default=self.username or vol.UNDEFINED
                 ): str,
                 vol.Required(CONF_PASSWORD): str,
+                vol.Required(
+                    CONF_ENTITY_PROFILE, default=DEFAULT_ENTITY_PROFILE
+                ): ENTITY_PROFILE_SELECTOR,
             }
         )
         if user_input is None:
             return self.async_show_form(step_id="user", data_schema=data_schema)
 
+        # The entity profile is an option, changeable later without reconfiguring
+        user_input = dict(user_input)
+        entity_profile = user_input.pop(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+
         await self.async_set_unique_id(user_input.get(CONF_USERNAME))
         self._abort_if_unique_id_configured(
             updates={CONF_HOST: user_input.get(CONF_HOST)}
@@ -111,7 +152,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "unknown"
         else:
             # Connection was successful, create config entry
-            return self.async_create_entry(title=info["title"], data=user_input)
+            return self.async_create_entry(
+                title=info["title"],
+                data=user_input,
+                options={CONF_ENTITY_PROFILE: entity_profile},
+            )
 
         # Pass errors to user and show form again
         return self.async_show_form(
@@ -175,6 +220,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle zeroconf discovery."""
 
         _LOGGER.info("Starting zeroconf config flow for Sessy")
+        if discovery_info.ip_address.version == 6:
+            # sessypy builds its URLs from the bare host, which IPv6 addresses break
+            return self.async_abort(reason="not_ipv4_address")
         try:
             # Get device info from zeroconf
             local_name = discovery_info.hostname[:-1]
@@ -184,9 +232,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 f"Discovered Sessy device at {local_name} with serial: {serial_number}"
             )
 
-            # Check for duplicates
+            # Check for duplicates, connecting known devices by IP address.
+            # The entry applies a new address live, see async_update_options
             await self.async_set_unique_id(serial_number)
-            self._abort_if_unique_id_configured()
+            self._abort_if_unique_id_configured(
+                updates={CONF_HOST: ip_address.compressed}, reload_on_update=False
+            )
 
             # Update the config flow title
             self._name = local_name.removesuffix(".local")
@@ -228,7 +279,55 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         default=self.config_entry.options.get(
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_POWER.seconds
                         ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300))
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                    vol.Required(
+                        CONF_SAMPLE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                    **{
+                        vol.Required(
+                            tier,
+                            default=self.config_entry.options.get(
+                                tier, DEFAULT_SCAN_INTERVAL.seconds
+                            ),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400))
+                        for tier in (
+                            CONF_SCAN_INTERVAL_ENERGY,
+                            CONF_SCAN_INTERVAL_STRATEGY,
+                            CONF_SCAN_INTERVAL_SETTINGS,
+                            CONF_SCAN_INTERVAL_DIAGNOSTICS,
+                        )
+                    },
+                    vol.Required(
+                        CONF_ENTITY_PROFILE,
+                        default=self.config_entry.options.get(
+                            CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE
+                        ),
+                    ): ENTITY_PROFILE_SELECTOR,
+                    vol.Required(
+                        CONF_TELEMETRY_HOURS,
+                        default=self.config_entry.options.get(
+                            CONF_TELEMETRY_HOURS, DEFAULT_TELEMETRY_HOURS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=24)),
+                    vol.Required(
+                        CONF_STATISTICS_MODE,
+                        default=self.config_entry.options.get(
+                            CONF_STATISTICS_MODE, False
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ARCHIVE,
+                        default=self.config_entry.options.get(CONF_ARCHIVE, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_ARCHIVE_RAW_DAYS,
+                        default=self.config_entry.options.get(
+                            CONF_ARCHIVE_RAW_DAYS, DEFAULT_ARCHIVE_RAW_DAYS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
                 }
             ),
         )
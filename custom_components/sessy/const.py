@@ -11,9 +11,56 @@ DEFAULT_SCAN_INTERVAL_POWER = timedelta(seconds=5)
 # Static scan intervals
 SCAN_INTERVAL_OTA_BUSY = timedelta(seconds=5)
 SCAN_INTERVAL_OTA_CHECK = timedelta(hours=6)
+# OTA status is polled fast by the OTA tracker while an install or check is running
+SCAN_INTERVAL_OTA_STATUS = timedelta(minutes=30)
 SCAN_INTERVAL_SCHEDULE = timedelta(hours=1)
 
+# P1 telegram phase lock, in seconds. New telegrams move the next poll EARLY_STEP earlier,
+# a repeated telegram moves it LATE_STEP later and is polled again after RETRY_DELAY
+TELEGRAM_PERIOD_DSMR5 = 1
+TELEGRAM_PERIOD_LEGACY = 10
+PHASE_LOCK_EARLY_STEP = 0.05
+PHASE_LOCK_LATE_STEP = 0.2
+PHASE_LOCK_RETRY_DELAY = 0.25
+PHASE_LOCK_MAX_RETRIES = 3
+
+# Battery analytics, time constants of the moving averages in seconds
+ANALYTICS_PUBLISH_INTERVAL = timedelta(seconds=30)
+ANALYTICS_POWER_TIME_CONSTANT = 300
+ANALYTICS_SOC_TIME_CONSTANT = 900
+# State of charge slope (fraction per second) below which time to full/empty is unknown
+ANALYTICS_MIN_SOC_SLOPE = 1e-6
+
+# Energy costs, published once a minute and stored at most every COSTS_SAVE_DELAY seconds.
+# Without a known price, it is looked up again after COSTS_PRICE_RETRY seconds
+COSTS_PUBLISH_INTERVAL = timedelta(minutes=1)
+COSTS_PRICE_RETRY = 60
+COSTS_SAVE_DELAY = 900
+COSTS_STORAGE_VERSION = 1
+
+# Peak demand (capacity tariff), ranking the top PEAK_TOP_N quarters per month over PEAK_MONTHS months.
+# Quarters first sampled more than PEAK_START_TOLERANCE seconds after their start are not ranked
+PEAK_PUBLISH_INTERVAL = timedelta(minutes=1)
+PEAK_QUARTER_SECONDS = 900
+PEAK_START_TOLERANCE = 60
+PEAK_TOP_N = 3
+PEAK_MONTHS = 12
+PEAK_STORAGE_VERSION = 1
+
+# Polling tiers of the other endpoints in seconds, 0 only refreshes after a change
+CONF_SCAN_INTERVAL_ENERGY = "scan_interval_energy"
+CONF_SCAN_INTERVAL_DIAGNOSTICS = "scan_interval_diagnostics"
+CONF_SCAN_INTERVAL_SETTINGS = "scan_interval_settings"
+CONF_SCAN_INTERVAL_STRATEGY = "scan_interval_strategy"
+
+# Entities and last payload per endpoint, to skip endpoints with only disabled entities
+ENDPOINT_STORAGE_VERSION = 1
+
 SESSY_DEVICE = "sessy_device"
+
+# Devices validated by the config flow, kept open for async_setup_entry
+VALIDATED_DEVICES = "validated_devices"
+VALIDATED_DEVICE_TTL = timedelta(minutes=1)
 SERIAL_NUMBER = "serial_number"
 SESSY_DEVICE_INFO = "sessy_device_info"
 
@@ -31,5 +78,114 @@ COORDINATOR_RETRIES = 5
 COORDINATOR_RETRY_DELAY = 1
 COORDINATOR_TIMEOUT = 10
 
+# Adaptive request timeout: a multiple of the recent p99 latency, within bounds (seconds).
+# Retries after a timeout double the timeout, up to COORDINATOR_TIMEOUT.
+ADAPTIVE_TIMEOUT_FACTOR = 3
+ADAPTIVE_TIMEOUT_MIN = 1
+# Successful requests needed before the timeout adapts
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+
+# Reconnecting after a restart or connection loss, in seconds
+RECONNECT_PROBE_DELAY = 5
+RECONNECT_PROBE_MAX_DELAY = 60
+RECONNECT_PROBE_TIMEOUT = 5
+RECONNECT_RESUME_STAGGER = 0.5
+
+# Upper bounds (seconds) of the request latency histogram buckets
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Number of fetches kept per coordinator for diagnostics
+METRICS_FETCH_HISTORY = 20
+# Number of successful request latencies kept per coordinator for exact percentiles
+METRICS_LATENCY_WINDOW = 200
+
+# Options
+CONF_STATISTICS_MODE = "statistics_mode"
+# Fast sampling interval (seconds) of power related entities, 0 disables sampling
+CONF_SAMPLE_INTERVAL = "sample_interval"
+DEFAULT_SAMPLE_INTERVAL = 0
+# Hours of high-rate telemetry kept in memory, 0 disables the telemetry buffers
+CONF_TELEMETRY_HOURS = "telemetry_hours"
+DEFAULT_TELEMETRY_HOURS = 1
+# Which entities are created: minimal (core power, state of charge, energy and controls), standard or full
+CONF_ENTITY_PROFILE = "entity_profile"
+DEFAULT_ENTITY_PROFILE = "full"
+
+# Telemetry archive
+CONF_ARCHIVE = "archive"
+ARCHIVE_FLUSH_INTERVAL = timedelta(minutes=1)
+ARCHIVE_COMPACT_INTERVAL = timedelta(hours=1)
+# Raw samples are kept for CONF_ARCHIVE_RAW_DAYS, then averaged per ARCHIVE_COMPACTED_RESOLUTION seconds
+CONF_ARCHIVE_RAW_DAYS = "archive_raw_days"
+DEFAULT_ARCHIVE_RAW_DAYS = 365
+ARCHIVE_COMPACTED_RESOLUTION = 60
+ARCHIVE_COMPACTED_RETENTION = timedelta(days=730)
+# Values are stored as integers in thousandths
+ARCHIVE_VALUE_SCALE = 1000
+# Maximum number of rows per endpoint returned by a single archive query
+ARCHIVE_QUERY_LIMIT = 10000
+
+# OTA tracker
+OTA_TRACKER = "ota_tracker"
+OTA_STORAGE_VERSION = 1
+# Interval to look for devices due for an online update check
+OTA_CHECK_DUE_INTERVAL = timedelta(minutes=15)
+# Time for the device to report an install or check after starting it
+OTA_START_GRACE = timedelta(seconds=30)
+OTA_INSTALL_TIMEOUT = timedelta(minutes=30)
+# Time for a device to respond again after installing firmware
+OTA_REBOOT_TIMEOUT = timedelta(minutes=5)
+EVENT_FIRMWARE_ROLLOUT = "sessy_firmware_rollout"
+DEFAULT_ROLLOUT_WAVE_SIZE = 2
+
+# Long-term statistics
+STATISTICS_STORAGE_VERSION = 1
+# Write the statistics of the previous hour shortly after the hour, once the last readings are in
+STATISTICS_WRITE_SECOND = 30
+
+# Services
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+SERVICE_PROFILE = "profile"
+SERVICE_GET_RECENT = "get_recent"
+SERVICE_QUERY_ARCHIVE = "query_archive"
+SERVICE_INSTALL_FIRMWARE = "install_firmware"
+SERVICE_TURBO = "turbo"
+SERVICE_FETCH = "fetch"
+
+ATTR_DURATION = "duration"
+ATTR_TICKS = "ticks"
+ATTR_TOP = "top"
+ATTR_FIELDS = "fields"
+ATTR_RESOLUTION = "resolution"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_WAVE_SIZE = "wave_size"
+ATTR_ENDPOINT = "endpoint"
+ATTR_INTERVAL = "interval"
+ATTR_BATCH_INTERVAL = "batch_interval"
+ATTR_MAX_AGE = "max_age"
+
+DEFAULT_PROFILE_DURATION = 60
+DEFAULT_PROFILE_TOP = 30
+DEFAULT_RECENT_DURATION = 600
+DEFAULT_FETCH_MAX_AGE = 10
+# Turbo mode interval and duration limits, in seconds
+TURBO_MIN_INTERVAL = 0.2
+TURBO_MAX_INTERVAL = 5
+DEFAULT_TURBO_INTERVAL = 0.5
+TURBO_MAX_DURATION = 3600
+DEFAULT_TURBO_DURATION = 300
+
+# HTTP view serving the latest payloads
+PAYLOAD_VIEW_URL = "/api/sessy/{serial}/{endpoint}"
+
+# Websocket API
+WS_TYPE_SUBSCRIBE = "sessy/subscribe"
+# Shortest sample interval a stream subscriber can request, in seconds
+STREAM_MIN_INTERVAL = 1
+STREAM_MAX_INTERVAL = 300
+STREAM_MAX_BATCH_INTERVAL = 60
+
 SESSY_RELEASE_NOTES_URL = "https://www.sessy.nl/firmware-updates"
 SESSY_MANUFACTURER = "Sessy"
+# Nominal usable capacity of a Sessy battery
+SESSY_BATTERY_CAPACITY_WH = 5000
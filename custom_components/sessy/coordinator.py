@@ -5,11 +5,16 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta
 import logging
+from time import monotonic
 
 import async_timeout
 
 from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -21,29 +26,82 @@ from sessypy.devices import (
     SessyMeter,
     SessyP1Meter,
 )
-from sessypy.util import SessyLoginException, SessyNotSupportedException
+from sessypy.util import (
+    SessyConnectionException,
+    SessyLoginException,
+    SessyNotSupportedException,
+)
 
 from typing import Any, Callable, Optional
 
+from .aggregation import SessyWindowAggregator
 from .const import (
+    ADAPTIVE_TIMEOUT_FACTOR,
+    ADAPTIVE_TIMEOUT_MIN,
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SCAN_INTERVAL_DIAGNOSTICS,
+    CONF_SCAN_INTERVAL_ENERGY,
+    CONF_SCAN_INTERVAL_SETTINGS,
+    CONF_SCAN_INTERVAL_STRATEGY,
     COORDINATOR_RETRIES,
     COORDINATOR_RETRY_DELAY,
     COORDINATOR_TIMEOUT,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL_POWER,
-    SCAN_INTERVAL_OTA_CHECK,
+    DOMAIN,
+    ENDPOINT_STORAGE_VERSION,
+    SCAN_INTERVAL_OTA_STATUS,
     SCAN_INTERVAL_SCHEDULE,
 )
+from .metrics import SessyCoordinatorMetrics, SessyStartupTimeline
+from .phase_lock import SessyTelegramPhaseLock
 from .models import SessyConfigEntry
+from .profiler import SessyProfiler, profile_section
+from .supervisor import SessyPauseReason, SessySupervisor
 from .util import get_nested_key
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def setup_coordinators(hass, config_entry: SessyConfigEntry, device: SessyDevice) -> dict[Callable, SessyCoordinator]:
-    coordinators = list()
+# Power related coordinators, polled at the scan interval from the options flow
+POWER_COORDINATOR_FUNCTIONS: list[str] = [
+    SessyBattery.get_power_status.__name__,
+    SessyCTMeter.get_ct_details.__name__,
+    SessyP1Meter.get_p1_details.__name__,
+    SessyP1Meter.get_modbus_details.__name__,
+]
+
+# Coordinators that keep the fixed COORDINATOR_TIMEOUT: the OTA status is polled while
+# the device is busy installing, schedules carry large payloads
+FIXED_TIMEOUT_FUNCTIONS: list[str] = [
+    SessyDevice.get_ota_status.__name__,
+    SessyBattery.get_dynamic_schedule.__name__,
+    SessyBattery.get_dynamic_schedule_legacy.__name__,
+]
+
+# Polling tiers of the other coordinators, by options flow key
+COORDINATOR_TIERS: dict[str, str] = {
+    SessyBattery.get_energy_status.__name__: CONF_SCAN_INTERVAL_ENERGY,
+    SessyDevice.get_network_status.__name__: CONF_SCAN_INTERVAL_DIAGNOSTICS,
+    SessyDevice.get_system_info.__name__: CONF_SCAN_INTERVAL_DIAGNOSTICS,
+    SessyDevice.get_system_settings.__name__: CONF_SCAN_INTERVAL_SETTINGS,
+    SessyMeter.get_grid_target.__name__: CONF_SCAN_INTERVAL_SETTINGS,
+    SessyBattery.get_power_strategy.__name__: CONF_SCAN_INTERVAL_STRATEGY,
+}
+
+
+def get_tier_interval(config_entry: SessyConfigEntry, name: str) -> timedelta | None:
+    """Get the scan interval of a polling tier from the options flow, None to only refresh after changes"""
+    seconds = config_entry.options.get(
+        COORDINATOR_TIERS[name], DEFAULT_SCAN_INTERVAL.seconds
+    )
+    return timedelta(seconds=seconds) if seconds > 0 else None
 
-    # Get power scan interval from options flow
+
+def get_power_intervals(config_entry: SessyConfigEntry) -> tuple[timedelta, timedelta | None]:
+    """Get the power scan interval and sample interval from the options flow"""
     if CONF_SCAN_INTERVAL in config_entry.options:
         scan_interval_power = timedelta(
             seconds=config_entry.options.get(CONF_SCAN_INTERVAL)
@@ -51,13 +109,25 @@ async def setup_coordinators(hass, config_entry: SessyConfigEntry, device: Sessy
     else:
         scan_interval_power = DEFAULT_SCAN_INTERVAL_POWER
 
+    sample_seconds = config_entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+    sample_interval = timedelta(seconds=sample_seconds) if sample_seconds > 0 else None
+
+    return scan_interval_power, sample_interval
+
+
+async def setup_coordinators(hass, config_entry: SessyConfigEntry, device: SessyDevice, timeline: SessyStartupTimeline, supervisor: SessySupervisor) -> dict[Callable, SessyCoordinator]:
+    coordinators = list()
+
+    scan_interval_power, sample_interval = get_power_intervals(config_entry)
+    idle_endpoints = await async_load_idle_endpoints(hass, config_entry)
+
     # Device independent functions
     coordinators.extend(
         [
-            SessyCoordinator(hass, config_entry, device.get_ota_status),
+            # Polled fast by the OTA tracker during installs, update checks are started by the tracker
             SessyCoordinator(
-                hass, config_entry, device.check_ota, SCAN_INTERVAL_OTA_CHECK
-            ),  # Sessy will not check for updates automatically, poll at intervals
+                hass, config_entry, device.get_ota_status, SCAN_INTERVAL_OTA_STATUS
+            ),
             SessyCoordinator(hass, config_entry, device.get_system_info),
             SessyCoordinator(hass, config_entry, device.get_network_status),
         ]
@@ -73,43 +143,67 @@ async def setup_coordinators(hass, config_entry: SessyConfigEntry, device: Sessy
                 SessyCoordinator(hass, config_entry, device.get_system_settings),
             ]
         )
-        try:
-            await device.get_dynamic_schedule()
+        idle_schedule_functions = [
+            function
+            for function in (device.get_dynamic_schedule, device.get_dynamic_schedule_legacy)
+            if function.__name__ in idle_endpoints
+        ]
+        if len(idle_schedule_functions) > 0:
+            # Schedule entities are disabled, don't probe the schedule API
             coordinators.append(
                 SessyCoordinator(
                     hass,
                     config_entry,
-                    device.get_dynamic_schedule,
+                    idle_schedule_functions[0],
                     SCAN_INTERVAL_SCHEDULE,
                 )
             )
-        except SessyNotSupportedException:
-            _LOGGER.warning(
-                f"{device.name} is not using the latest dynamic schedule API, falling back to legacy schedule sensors. Update Sessy to firmware 1.9.2 or later to use the new dynamic schedule API."
-            )
+        else:
             try:
-                # Fallback to legacy dynamic schedule if the new one is not supported
-                await device.get_dynamic_schedule_legacy()
+                await device.get_dynamic_schedule()
                 coordinators.append(
                     SessyCoordinator(
                         hass,
                         config_entry,
-                        device.get_dynamic_schedule_legacy,
+                        device.get_dynamic_schedule,
                         SCAN_INTERVAL_SCHEDULE,
                     )
                 )
-            except SessyNotSupportedException as e:
+            except SessyNotSupportedException:
                 _LOGGER.warning(
-                    f"Dynamic schedule not supported by Sessy device {device.serial_number}. Error: {e}"
+                    f"{device.name} is not using the latest dynamic schedule API, falling back to legacy schedule sensors. Update Sessy to firmware 1.9.2 or later to use the new dynamic schedule API."
+                )
+                try:
+                    # Fallback to legacy dynamic schedule if the new one is not supported
+                    await device.get_dynamic_schedule_legacy()
+                    coordinators.append(
+                        SessyCoordinator(
+                            hass,
+                            config_entry,
+                            device.get_dynamic_schedule_legacy,
+                            SCAN_INTERVAL_SCHEDULE,
+                        )
+                    )
+                except SessyNotSupportedException as e:
+                    _LOGGER.warning(
+                        f"Dynamic schedule not supported by Sessy device {device.serial_number}. Error: {e}"
+                    )
+            except SessyConnectionException:
+                # Retry the setup instead of dropping the schedule
+                raise
+            except Exception as e:
+                _LOGGER.error(
+                    f"Error while fetching dynamic schedule for Sessy device {device.serial_number}. Error: {e}"
                 )
-        except Exception as e:
-            _LOGGER.error(
-                f"Error while fetching dynamic schedule for Sessy device {device.serial_number}. Error: {e}"
-            )
 
     elif isinstance(device, SessyP1Meter):
-        settings = await device.get_system_settings()
-        if settings.get("enable_modbus", False):
+        if device.get_modbus_details.__name__ in idle_endpoints:
+            # Modbus entities are disabled, don't probe the settings
+            enable_modbus = True
+        else:
+            settings = await device.get_system_settings()
+            enable_modbus = settings.get("enable_modbus", False)
+        if enable_modbus:
             coordinators.append(
                 SessyCoordinator(
                     hass, config_entry, device.get_modbus_details, scan_interval_power
@@ -141,43 +235,116 @@ async def setup_coordinators(hass, config_entry: SessyConfigEntry, device: Sessy
     coordinators_dict = dict()
     coordinator: SessyCoordinator
     for coordinator in coordinators:
-        await coordinator.async_config_entry_first_refresh()
+        coordinator.supervisor = supervisor
+        if coordinator.name == SessyP1Meter.get_p1_details.__name__:
+            coordinator.phase_lock = SessyTelegramPhaseLock(scan_interval_power.total_seconds())
+        if coordinator.name in COORDINATOR_TIERS:
+            coordinator.update_interval = get_tier_interval(config_entry, coordinator.name)
+
+        cached_data = idle_endpoints.get(coordinator.name)
+        if cached_data is not None:
+            _LOGGER.debug(f"All entities of {coordinator.name} are disabled, using the cached payload instead of fetching")
+            coordinator.async_set_idle(cached_data)
+        else:
+            with timeline.phase(f"first_refresh.{coordinator.name}"):
+                await coordinator.async_config_entry_first_refresh()
         coordinators_dict[coordinator._device_function] = coordinator
 
+        if coordinator.name in POWER_COORDINATOR_FUNCTIONS:
+            coordinator.async_set_sample_interval(sample_interval)
+
     return coordinators_dict
 
 
 async def update_coordinator_options(hass, config_entry: SessyConfigEntry):
-    update_coordinator_functions: list[str] = [
-        SessyBattery.get_power_status.__name__,
-        SessyCTMeter.get_ct_details.__name__,
-        SessyP1Meter.get_p1_details.__name__,
-        SessyP1Meter.get_modbus_details.__name__,
-    ]
-
-    # Get power scan interval from options flow
-    if CONF_SCAN_INTERVAL in config_entry.options:
-        scan_interval_power = timedelta(
-            seconds=config_entry.options.get(CONF_SCAN_INTERVAL)
-        )
-    else:
-        scan_interval_power = DEFAULT_SCAN_INTERVAL_POWER
+    scan_interval_power, sample_interval = get_power_intervals(config_entry)
 
     coordinators_dict: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
     for coordinator_function in coordinators_dict:
-        if coordinator_function.__name__ in update_coordinator_functions:
-            _LOGGER.debug(f"Updating scan interval for coordinator {coordinator_function.__name__} to {scan_interval_power}")
+        if coordinator_function.__name__ in POWER_COORDINATOR_FUNCTIONS:
+            _LOGGER.debug(f"Updating scan interval for coordinator {coordinator_function.__name__} to {scan_interval_power}, sample interval {sample_interval}")
             coordinator = coordinators_dict[coordinator_function]
             coordinator.update_interval = scan_interval_power
+            coordinator.async_set_sample_interval(sample_interval)
+            if coordinator.phase_lock is not None:
+                coordinator.phase_lock.scan_interval = scan_interval_power.total_seconds()
+        elif coordinator_function.__name__ in COORDINATOR_TIERS:
+            coordinator = coordinators_dict[coordinator_function]
+            coordinator.async_set_update_interval(
+                get_tier_interval(config_entry, coordinator.name)
+            )
 
 
 async def refresh_coordinators(config_entry: SessyConfigEntry):
     coordinators_dict: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
     for coordinator_function in coordinators_dict:
         coordinator = coordinators_dict[coordinator_function]
+        if not coordinator.has_listeners:
+            # No enabled entities or other consumers
+            continue
         await coordinator.async_refresh()
 
 
+def _get_endpoint_store(hass, config_entry: SessyConfigEntry) -> Store:
+    return Store(
+        hass, ENDPOINT_STORAGE_VERSION, f"{DOMAIN}.endpoints.{config_entry.entry_id}"
+    )
+
+
+async def async_load_idle_endpoints(hass, config_entry: SessyConfigEntry) -> dict[str, dict]:
+    """Get the cached payloads of the endpoints whose entities are all disabled"""
+    stored: dict = await _get_endpoint_store(hass, config_entry).async_load()
+    if stored is None:
+        return dict()
+
+    registry_entries: dict[str, list[er.RegistryEntry]] = dict()
+    for registry_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), config_entry.entry_id
+    ):
+        registry_entries.setdefault(registry_entry.unique_id, list()).append(registry_entry)
+
+    idle_endpoints = dict()
+    for name, endpoint in stored.items():
+        unique_ids: list[str] = endpoint.get("unique_ids", list())
+        # Endpoints without entities are used by the integration itself
+        if len(unique_ids) == 0 or endpoint.get("data") is None:
+            continue
+        # Entities missing from the registry are new, and enabled
+        if all(
+            unique_id in registry_entries
+            and all(entry.disabled_by is not None for entry in registry_entries[unique_id])
+            for unique_id in unique_ids
+        ):
+            idle_endpoints[name] = endpoint.get("data")
+
+    return idle_endpoints
+
+
+async def async_save_endpoints(hass, config_entry: SessyConfigEntry):
+    """Remember the entities and last payload of each endpoint, to find idle endpoints on the next start"""
+    coordinators_dict: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+    await _get_endpoint_store(hass, config_entry).async_save(
+        {
+            coordinator.name: {
+                "unique_ids": sorted(coordinator.unique_ids),
+                "data": coordinator.raw_data,
+            }
+            for coordinator in coordinators_dict.values()
+        }
+    )
+
+
+def _set_inflight_exception(inflight: asyncio.Future, err: Exception):
+    inflight.set_exception(err)
+    # Mark the exception as retrieved, there may be no callers waiting for it
+    inflight.exception()
+
+
+@callback
+def _no_op_listener():
+    """Listener keeping a coordinator polling for sample listeners"""
+
+
 class SessyCoordinator(DataUpdateCoordinator):
     """Sessy API coordinator"""
 
@@ -204,6 +371,38 @@ class SessyCoordinator(DataUpdateCoordinator):
         )
         self._device_function = device_function
         self._raw_data = dict()
+        # Monotonic time the raw data was fetched, None for cached payloads
+        self._raw_data_time: float = None
+        self.metrics = SessyCoordinatorMetrics()
+        self.profiler: SessyProfiler = None
+        self._sample_listeners: list[Callable[[dict], None]] = list()
+
+        # Fast sampling between publishes, see async_set_sample_interval
+        self.sample_interval: timedelta = None
+        self.window_stats: dict[SessyEntityContext, tuple[float, float, float]] = dict()
+        self._aggregator: SessyWindowAggregator = None
+        self._unsub_sample: Callable[[], None] = None
+        self._last_sample: float = None
+        # Response of the running request, shared with callers of async_get_raw_data
+        self._inflight: asyncio.Future = None
+
+        # Faster sampling requested by stream subscribers, see async_request_stream_interval
+        self._stream_intervals: list[timedelta] = list()
+        self.stream_interval: timedelta = None
+        self._unsub_stream: Callable[[], None] = None
+
+        # Sub-second polling and publishing, see async_set_turbo_interval
+        self.turbo_interval: timedelta = None
+        self._unsub_turbo: Callable[[], None] = None
+
+        # Pauses polling while the device restarts or is offline, set by setup_coordinators
+        self.supervisor = None
+        # Aligns the refreshes to the P1 telegrams, set by setup_coordinators
+        self.phase_lock: SessyTelegramPhaseLock = None
+
+        # Unique IDs of the entities backed by this coordinator
+        self.unique_ids: set[str] = set()
+        self.idle = False
 
     async def _async_setup(self):
         """Set up the coordinator
@@ -222,36 +421,450 @@ class SessyCoordinator(DataUpdateCoordinator):
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
-        for retry in range(COORDINATOR_RETRIES):
-            try:
-                # Note: asyncio.TimeoutError and aiohttp.ClientError are already
-                # handled by the data update coordinator.
-                async with async_timeout.timeout(COORDINATOR_TIMEOUT):
-                    data = await self._device_function()
-
-                contexts: list[SessyEntityContext] = set(self.async_contexts())
-                flattened_data = dict()
-                for context in contexts:
-                    flattened_data[context] = context.apply(data)
-
-                self._raw_data = data
-                return flattened_data
-
-            except SessyLoginException as err:
-                # Raising ConfigEntryAuthFailed will cancel future updates
-                # and start a config flow with SOURCE_REAUTH (async_step_reauth)
-                raise ConfigEntryAuthFailed from err
-            except Exception as err:
-                if retry == COORDINATOR_RETRIES - 1:
-                    raise UpdateFailed(
-                        f"Error communicating with Sessy API after {COORDINATOR_RETRIES} retries. {err}"
-                    ) from err
-                else:
-                    _LOGGER.debug(
-                        f"Error communicating with Sessy API, retrying in {COORDINATOR_RETRY_DELAY} seconds. {err}"
-                    )
-                    await asyncio.sleep(COORDINATOR_RETRY_DELAY)
+        if self.supervisor is not None and self.supervisor.paused:
+            if self.supervisor.pause_reason == SessyPauseReason.OFFLINE:
+                raise UpdateFailed(f"{self.supervisor.device.name} is offline, waiting for it to answer again")
+            # Keep the last data while the device restarts
+            return self.data if self.data is not None else dict()
+
+        fetch_start = monotonic()
+        success = False
+        attempts = list()
+        try:
+            for retry in range(COORDINATOR_RETRIES):
+                if retry > 0:
+                    self.metrics.record_retry()
+                try:
+                    if self._sample_is_fresh():
+                        # The last sample is recent enough to publish, skip the request
+                        success = True
+                        return self._publish(self._raw_data)
+
+                    if self._inflight is not None:
+                        # Share the running request of a sampler, turbo tick or fetch, which stores and samples it
+                        data = await asyncio.shield(self._inflight)
+                        success = True
+                        return self._publish(data)
+
+                    # Note: asyncio.TimeoutError and aiohttp.ClientError are already
+                    # handled by the data update coordinator.
+                    poll_time = self.hass.loop.time()
+                    data = await self._async_fetch(self.request_timeout(retry), attempts)
+                    if self.phase_lock is not None:
+                        self.phase_lock.observe(data, poll_time)
+
+                    flattened_data = self._flatten(data)
+                    if self._aggregator is not None:
+                        self._aggregator.add(flattened_data, monotonic())
+
+                    self._set_raw_data(data)
+                    self._notify_sample_listeners(data)
+                    success = True
+                    return self._publish(data, flattened_data)
+
+                except SessyLoginException as err:
+                    # Raising ConfigEntryAuthFailed will cancel future updates
+                    # and start a config flow with SOURCE_REAUTH (async_step_reauth)
+                    raise ConfigEntryAuthFailed from err
+                except Exception as err:
+                    if self.supervisor is not None and self.supervisor.paused:
+                        # The device is restarting or another endpoint found it offline
+                        raise UpdateFailed(
+                            f"Sessy device paused while fetching {self.name}. {err}"
+                        ) from err
+                    if retry == COORDINATOR_RETRIES - 1:
+                        if self.supervisor is not None and isinstance(
+                            err, (SessyConnectionException, TimeoutError)
+                        ):
+                            self.supervisor.async_set_offline(self.name)
+                        raise UpdateFailed(
+                            f"Error communicating with Sessy API after {COORDINATOR_RETRIES} retries. {err}"
+                        ) from err
+                    else:
+                        _LOGGER.debug(
+                            f"Error communicating with Sessy API, retrying in {COORDINATOR_RETRY_DELAY} seconds. {err}"
+                        )
+                        await asyncio.sleep(COORDINATOR_RETRY_DELAY)
+                        continue
+        finally:
+            self.metrics.record_fetch(fetch_start, monotonic() - fetch_start, success, attempts)
+
+    def request_timeout(self, retry: int = 0) -> float:
+        """Timeout in seconds of a request, adapted to the recent latency of this endpoint.
+
+        Retries double the timeout, so an endpoint that became slower can still answer
+        and adapt the timeout."""
+        if self.name in FIXED_TIMEOUT_FUNCTIONS:
+            return COORDINATOR_TIMEOUT
+        if len(self.metrics.latency_window) < ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return COORDINATOR_TIMEOUT
+
+        timeout = max(
+            self.metrics.recent_latency_percentile(99) * ADAPTIVE_TIMEOUT_FACTOR,
+            ADAPTIVE_TIMEOUT_MIN,
+        )
+        return min(timeout * 2**retry, COORDINATOR_TIMEOUT)
+
+    async def _async_fetch(self, timeout: float = COORDINATOR_TIMEOUT, attempts: list = None):
+        """Call the device function once, recording request metrics and the attempt of the calling fetch"""
+        request_start = monotonic()
+        inflight = self._inflight = self.hass.loop.create_future()
+        try:
+            async with async_timeout.timeout(timeout):
+                data = await self._device_function()
+        except TimeoutError as err:
+            self.metrics.record_request(monotonic() - request_start, timed_out=True, attempts=attempts)
+            _set_inflight_exception(inflight, err)
+            raise
+        except Exception as err:
+            self.metrics.record_request(monotonic() - request_start, failed=True, attempts=attempts)
+            _set_inflight_exception(inflight, err)
+            raise
+        except BaseException:
+            inflight.cancel()
+            raise
+        finally:
+            # A newer request may have replaced the marker, only clear our own
+            if self._inflight is inflight:
+                self._inflight = None
+
+        self.metrics.record_request(monotonic() - request_start, attempts=attempts)
+        self.metrics.record_payload(data)
+        inflight.set_result(data)
+        return data
+
+    @property
+    def _fetching(self) -> bool:
+        return self._inflight is not None
+
+    async def async_get_raw_data(self, max_age: float) -> tuple[dict, float]:
+        """Get the latest payload and its age in seconds if at most max_age seconds old, otherwise fetch it.
+
+        Callers arriving while a request to the endpoint is running share its response."""
+        age = self.raw_data_age
+        if age is not None and age <= max_age:
+            return self._raw_data, age
+
+        if self._inflight is not None:
+            return await asyncio.shield(self._inflight), 0
+
+        if self.supervisor is not None and self.supervisor.paused:
+            raise SessyConnectionException(
+                f"{self.supervisor.device.name} is not answering, waiting for it to answer again"
+            )
+        fetch_start = monotonic()
+        success = False
+        attempts = list()
+        try:
+            data = await self._async_fetch(self.request_timeout(), attempts)
+            success = True
+        finally:
+            self.metrics.record_fetch(fetch_start, monotonic() - fetch_start, success, attempts)
+
+        self._set_raw_data(data)
+        self._notify_sample_listeners(data)
+        return data, 0
+
+    def _set_raw_data(self, data: dict):
+        self._raw_data = data
+        self._raw_data_time = monotonic()
+
+    @property
+    def raw_data_age(self) -> float | None:
+        """Seconds since the raw data was fetched, None for cached payloads"""
+        if self._raw_data_time is None:
+            return None
+        return monotonic() - self._raw_data_time
+
+    def _flatten(self, data: dict, aggregated_only: bool = False) -> dict[SessyEntityContext, tuple[Any, bool]]:
+        """Apply the entity contexts to a payload"""
+        flatten_start = monotonic()
+        with profile_section(self.profiler):
+            contexts: list[SessyEntityContext] = set(self.async_contexts())
+            flattened_data = dict()
+            for context in contexts:
+                if aggregated_only and not context.aggregate:
                     continue
+                flattened_data[context] = context.apply(data)
+        self.metrics.record_flatten(monotonic() - flatten_start)
+        return flattened_data
+
+    def _publish(self, data: dict, flattened_data: dict = None) -> dict[SessyEntityContext, tuple[Any, bool]]:
+        """Close the sample window, if sampling, and return the flattened data to publish"""
+        if flattened_data is None:
+            flattened_data = self._flatten(data)
+        if self._aggregator is not None:
+            self.window_stats = self._aggregator.publish(monotonic())
+        return flattened_data
+
+    def _sample_is_fresh(self) -> bool:
+        """Whether the last sample is recent enough to publish instead of sending another request"""
+        intervals = [
+            interval
+            for interval in (self.sample_interval, self.stream_interval, self.turbo_interval)
+            if interval is not None
+        ]
+        if self._last_sample is None or len(intervals) == 0:
+            return False
+        return monotonic() - self._last_sample < 2 * min(intervals).total_seconds()
+
+    @callback
+    def async_set_idle(self, data: dict):
+        """Use a cached payload instead of the first refresh, for endpoints whose entities are all disabled.
+
+        The coordinator is only polled once a listener is added."""
+        self.idle = True
+        self._raw_data = data
+        self.data = dict()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh, in phase with the P1 telegrams if locked"""
+        if not self._phase_locked:
+            super()._schedule_refresh()
+            return
+        if self.config_entry.pref_disable_polling:
+            return
+
+        self._async_unsub_refresh()
+        self._unsub_refresh = self.hass.loop.call_at(
+            self.phase_lock.next_poll(self.hass.loop.time()),
+            self._async_handle_phase_locked_refresh,
+        ).cancel
+
+    @callback
+    def _async_handle_phase_locked_refresh(self):
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._handle_refresh_interval(),
+            name=f"{self.name} - {self.config_entry.title} - phase locked refresh",
+            eager_start=True,
+        )
+
+    @property
+    def _phase_locked(self) -> bool:
+        # Faster sampling publishes its own samples instead
+        return (
+            self.phase_lock is not None
+            and self.phase_lock.locked
+            and self.update_interval is not None
+            and self.sample_interval is None
+            and self.stream_interval is None
+            and self.turbo_interval is None
+        )
+
+    @property
+    def has_listeners(self) -> bool:
+        return len(self._listeners) > 0
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta | None):
+        """Change the update interval, rescheduling the next refresh. Pass None to only refresh on request."""
+        if update_interval == self.update_interval:
+            return
+
+        self.update_interval = update_interval
+        self._unschedule_refresh()
+        if self.has_listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_set_sample_interval(self, sample_interval: timedelta | None):
+        """Sample the device at a faster rate than the update interval.
+
+        Samples are aggregated into time-weighted mean, minimum and maximum values per
+        entity context, which are published once per update interval in window_stats.
+        Pass None to stop sampling."""
+        if self._unsub_sample is not None:
+            self._unsub_sample()
+            self._unsub_sample = None
+
+        if sample_interval is None or (
+            self.update_interval is not None and sample_interval >= self.update_interval
+        ):
+            self.sample_interval = None
+            self._aggregator = None
+            self._last_sample = None
+            self.window_stats = dict()
+            self.always_update = False
+            return
+
+        self.sample_interval = sample_interval
+        if self._aggregator is None:
+            self._aggregator = SessyWindowAggregator()
+        # The window statistics change even if the last sample did not
+        self.always_update = True
+        self._unsub_sample = async_track_time_interval(
+            self.hass,
+            self._async_sample,
+            sample_interval,
+            name=f"{self.name} sampler",
+            cancel_on_shutdown=True,
+        )
+
+    async def _async_sample(self, now=None):
+        """Take a single sample, skipped if a request is already running or nothing listens"""
+        if not self.has_listeners:
+            return
+        if self._fetching:
+            self.metrics.record_tick_skipped()
+            return
+        if self.supervisor is not None and self.supervisor.paused:
+            return
+
+        fetch_start = monotonic()
+        success = False
+        attempts = list()
+        try:
+            data = await self._async_fetch(self.request_timeout(), attempts)
+        except Exception as e:
+            # Failed samples are not retried, the next publish reports persistent errors
+            _LOGGER.debug(f"Error sampling {self.name}: {e}")
+            return
+        else:
+            success = True
+        finally:
+            self.metrics.record_fetch(fetch_start, monotonic() - fetch_start, success, attempts)
+
+        self._last_sample = monotonic()
+        if self._aggregator is not None:
+            # Sampling may have stopped while waiting for the device
+            self._aggregator.add(self._flatten(data, aggregated_only=True), self._last_sample)
+        self._set_raw_data(data)
+        self._notify_sample_listeners(data)
+
+    @callback
+    def async_request_stream_interval(self, stream_interval: timedelta) -> Callable[[], None]:
+        """Sample at least this often for the sample listeners, until the returned function is called.
+
+        Samples are taken at the shortest requested interval. Entities keep publishing
+        once per update interval."""
+        self._stream_intervals.append(stream_interval)
+        self._async_update_stream_sampler()
+
+        @callback
+        def remove_stream_interval():
+            self._stream_intervals.remove(stream_interval)
+            self._async_update_stream_sampler()
+
+        return remove_stream_interval
+
+    @callback
+    def _async_update_stream_sampler(self):
+        stream_interval = min(self._stream_intervals, default=None)
+        if stream_interval == self.stream_interval:
+            return
+
+        if self._unsub_stream is not None:
+            self._unsub_stream()
+            self._unsub_stream = None
+
+        self.stream_interval = stream_interval
+        if stream_interval is None:
+            return
+        self._unsub_stream = async_track_time_interval(
+            self.hass,
+            self._async_sample,
+            stream_interval,
+            name=f"{self.name} stream sampler",
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_set_turbo_interval(self, turbo_interval: timedelta | None):
+        """Poll and publish to the entities at a (sub-second) interval. Pass None to stop.
+
+        Unlike the regular refresh, a slow response does not delay the next tick: ticks
+        are skipped while a request to the endpoint is still running."""
+        if self._unsub_turbo is not None:
+            self._unsub_turbo()
+            self._unsub_turbo = None
+
+        self.turbo_interval = turbo_interval
+        if turbo_interval is None:
+            return
+        self._unsub_turbo = async_track_time_interval(
+            self.hass,
+            self._async_turbo_tick,
+            turbo_interval,
+            name=f"{self.name} turbo",
+            cancel_on_shutdown=True,
+        )
+
+    async def _async_turbo_tick(self, now=None):
+        if self.supervisor is not None and self.supervisor.paused:
+            return
+        if self._fetching:
+            self.metrics.record_tick_skipped()
+            return
+
+        fetch_start = monotonic()
+        success = False
+        attempts = list()
+        try:
+            data = await self._async_fetch(self.request_timeout(), attempts)
+        except Exception as e:
+            _LOGGER.debug(f"Error polling {self.name} in turbo mode: {e}")
+            return
+        else:
+            success = True
+        finally:
+            self.metrics.record_fetch(fetch_start, monotonic() - fetch_start, success, attempts)
+
+        if self.turbo_interval is None:
+            # Turbo mode ended while waiting for the device
+            return
+
+        self._last_sample = monotonic()
+        flattened_data = self._flatten(data)
+        if self._aggregator is not None:
+            self._aggregator.add(flattened_data, self._last_sample)
+        self._set_raw_data(data)
+        self._notify_sample_listeners(data)
+        # Also reschedules the regular refresh, which does not run while the ticks succeed
+        self.async_set_updated_data(self._publish(data, flattened_data))
+
+    async def async_shutdown(self) -> None:
+        """Cancel the samplers and any scheduled updates"""
+        self.async_set_sample_interval(None)
+        self.async_set_turbo_interval(None)
+        self._stream_intervals.clear()
+        self._async_update_stream_sampler()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, recording dispatch metrics"""
+        self.metrics.start_dispatch(len(self._listeners))
+        with profile_section(self.profiler):
+            super().async_update_listeners()
+        self.metrics.finish_dispatch()
+
+        if self.profiler is not None:
+            self.profiler.record_tick()
+
+    @callback
+    def async_add_sample_listener(self, sample_callback: Callable[[dict], None]) -> Callable[[], None]:
+        """Listen for every fetched payload, whether it changed or not.
+
+        A sample listener counts as a regular listener, so the coordinator keeps polling
+        while it is registered."""
+        self._sample_listeners.append(sample_callback)
+        remove_listener = self.async_add_listener(_no_op_listener)
+
+        @callback
+        def remove_sample_listener():
+            self._sample_listeners.remove(sample_callback)
+            remove_listener()
+
+        return remove_sample_listener
+
+    def _notify_sample_listeners(self, data: dict):
+        for sample_callback in list(self._sample_listeners):
+            try:
+                sample_callback(data)
+            except Exception as e:
+                _LOGGER.warning(f"Error handling sample of {self.name}: {e}")
 
     def get_data(self):
         return self.data
@@ -259,6 +872,11 @@ class SessyCoordinator(DataUpdateCoordinator):
     @property
     def raw_data(self):
         return self._raw_data
+
+    @property
+    def endpoint_name(self) -> str:
+        """Human readable name of the polled endpoint"""
+        return self.name.removeprefix("get_").replace("_", " ").title()
     
 
 class SessyEntityContext:
@@ -267,6 +885,8 @@ class SessyEntityContext:
         self.transform_function = transform_function
         self.availability_key = availability_key
         self.availability_test_value = availability_test_value
+        # Aggregate fast samples of this value into the window statistics
+        self.aggregate = False
 
     def apply(self, data) -> tuple[Any, bool]:
         value = get_nested_key(data, self.data_key)
@@ -0,0 +1,271 @@
+"""Incremental energy cost accounting, from the energy counters and the Sessy energy prices"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from sessypy.devices import SessyBattery
+
+from .const import (
+    COSTS_PRICE_RETRY,
+    COSTS_PUBLISH_INTERVAL,
+    COSTS_SAVE_DELAY,
+    COSTS_STORAGE_VERSION,
+    DOMAIN,
+)
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .util import divide_by_hundred_thousand, get_nested_key
+
+
+# Cost accounts per endpoint, summing the Wh counters in these keys
+COST_COUNTERS: dict[str, dict[str, tuple[str, ...]]] = {
+    "get_p1_details": {
+        "grid_import_cost": ("power_consumed_tariff1", "power_consumed_tariff2"),
+        "grid_export_revenue": ("power_produced_tariff1", "power_produced_tariff2"),
+    },
+    "get_energy_status": {
+        "battery_charge_cost": ("sessy_energy.import_wh",),
+        "battery_discharge_revenue": ("sessy_energy.export_wh",),
+    },
+}
+
+PRICE_ENDPOINTS = (
+    SessyBattery.get_dynamic_schedule.__name__,
+    SessyBattery.get_dynamic_schedule_legacy.__name__,
+)
+
+
+def _numeric(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def schedule_price(coordinator: SessyCoordinator, now: datetime) -> tuple[float | None, float]:
+    """Price in EUR/kWh at now from a schedule coordinator, with the timestamp it is valid until"""
+    prices = get_nested_key(coordinator.raw_data, "energy_prices")
+    timestamp = now.timestamp()
+    if not isinstance(prices, list):
+        return None, timestamp + COSTS_PRICE_RETRY
+
+    if coordinator.name == SessyBattery.get_dynamic_schedule.__name__:
+        for entry in prices:
+            if entry.get("start_time") <= timestamp < entry.get("end_time"):
+                price = entry.get("price")
+                if _numeric(price):
+                    return divide_by_hundred_thousand(price), entry.get("end_time")
+    else:
+        # TODO remove this when legacy schedule is no longer supported
+        date_key = now.strftime("%Y-%m-%d")
+        for day_schedule in prices:
+            if day_schedule.get("date") != date_key:
+                continue
+            day_prices = day_schedule.get("price", list())
+            if now.hour < len(day_prices) and _numeric(day_prices[now.hour]):
+                end_of_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+                return divide_by_hundred_thousand(day_prices[now.hour]), end_of_hour.timestamp()
+
+    return None, timestamp + COSTS_PRICE_RETRY
+
+
+@dataclass
+class SessyCostAccount:
+    """Cost of a cumulative energy counter, each increase charged at the current price.
+
+    Stored with its last counter reading, so the increase while Home Assistant was
+    stopped is charged at the first price after the restart."""
+
+    total: float = 0.0
+    last_wh: float | None = None
+
+    def add(self, energy_wh: float, price: float | None):
+        if self.last_wh is not None and energy_wh >= self.last_wh:
+            if price is None:
+                # Charge the increase once the price is known
+                return
+            self.total += (energy_wh - self.last_wh) / 1000 * price
+        # Start counting from the first reading, or again after a counter reset
+        self.last_wh = energy_wh
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def restore(self, data: dict[str, Any]):
+        total = data.get("total")
+        last_wh = data.get("last_wh")
+        if _numeric(total):
+            self.total = total
+        if _numeric(last_wh):
+            self.last_wh = last_wh
+
+
+class SessyEnergyCosts:
+    """Running energy costs of a device with constant cost per sample.
+
+    The energy counters are sampled while any cost sensor listens, and charged at the
+    energy price of this device, or of another Sessy battery if it has none (P1 meters).
+    The costs are published to the listeners at COSTS_PUBLISH_INTERVAL.
+
+    The accounts are stored per device, independent of which cost sensors are enabled,
+    so the arbitrage value does not depend on the charge cost and revenue sensors."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: SessyConfigEntry):
+        self.hass = hass
+        self.config_entry = config_entry
+
+        self.accounts: dict[str, SessyCostAccount] = dict()
+        self._counters: list[tuple[SessyCoordinator, dict[str, tuple[str, ...]]]] = list()
+        for coordinator in config_entry.runtime_data.coordinators.values():
+            counters = COST_COUNTERS.get(coordinator.name)
+            if counters is None:
+                continue
+            self._counters.append((coordinator, counters))
+            for account in counters:
+                self.accounts[account] = SessyCostAccount()
+
+        serial_number = config_entry.runtime_data.device.serial_number.lower()
+        self._store: Store = Store(
+            hass, COSTS_STORAGE_VERSION, f"{DOMAIN}.energy_costs.{serial_number}"
+        )
+
+        self._price: float = None
+        self._price_valid_until: float = 0
+
+        self._listeners: list[Callable[[], None]] = list()
+        self._unsubscribers: list[Callable[[], None]] = list()
+
+    async def async_load(self):
+        stored = await self._store.async_load()
+        if stored is None:
+            return
+        for account, data in stored.get("accounts", dict()).items():
+            if account in self.accounts:
+                self.accounts[account].restore(data)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "accounts": {
+                account: cost_account.as_dict()
+                for account, cost_account in self.accounts.items()
+            },
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for published costs, sampling the counters while listened to"""
+        if len(self._listeners) == 0:
+            self._async_start()
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(update_callback)
+            if len(self._listeners) == 0:
+                self._async_stop()
+
+        return remove_listener
+
+    @callback
+    def _async_start(self):
+        for coordinator, counters in self._counters:
+            self._unsubscribers.append(
+                coordinator.async_add_sample_listener(self._sample_handler(counters))
+            )
+        # Keep the own price schedule polled, even without enabled price sensors
+        for coordinator in self.config_entry.runtime_data.coordinators.values():
+            if coordinator.name in PRICE_ENDPOINTS:
+                self._unsubscribers.append(
+                    coordinator.async_add_sample_listener(self.async_handle_price_schedule)
+                )
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self.hass,
+                self._async_publish,
+                COSTS_PUBLISH_INTERVAL,
+                name="Sessy energy costs",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_stop(self):
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+        self._store.async_delay_save(self._data_to_save)
+
+    @callback
+    def _async_publish(self, now=None):
+        self._store.async_delay_save(self._data_to_save, COSTS_SAVE_DELAY)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_handle_price_schedule(self, data: dict):
+        # Look up the price again in the updated schedule
+        self._price_valid_until = 0
+
+    def _sample_handler(self, counters: dict[str, tuple[str, ...]]) -> Callable[[dict], None]:
+        @callback
+        def async_handle_sample(data: dict):
+            price = self.current_price()
+            for account, keys in counters.items():
+                values = [get_nested_key(data, key) for key in keys]
+                if all(_numeric(value) for value in values):
+                    self.accounts[account].add(sum(values), price)
+
+        return async_handle_sample
+
+    def current_price(self) -> float | None:
+        """Energy price in EUR/kWh, looked up again once the price slot ends"""
+        now = datetime.now()
+        if now.timestamp() < self._price_valid_until:
+            return self._price
+
+        self._price, self._price_valid_until = None, now.timestamp() + COSTS_PRICE_RETRY
+        # Prefer the own schedule, the entry is not loaded yet while setting up
+        config_entries = [self.config_entry] + [
+            config_entry
+            for config_entry in self.hass.config_entries.async_loaded_entries(DOMAIN)
+            if config_entry is not self.config_entry
+        ]
+        for config_entry in config_entries:
+            for coordinator in config_entry.runtime_data.coordinators.values():
+                if coordinator.name not in PRICE_ENDPOINTS:
+                    continue
+                price, valid_until = schedule_price(coordinator, now)
+                if price is not None:
+                    self._price, self._price_valid_until = price, valid_until
+                    return price
+        return None
+
+    def _total(self, account: str) -> float | None:
+        cost_account = self.accounts.get(account)
+        return cost_account.total if cost_account is not None else None
+
+    @property
+    def grid_import_cost(self) -> float | None:
+        return self._total("grid_import_cost")
+
+    @property
+    def grid_export_revenue(self) -> float | None:
+        return self._total("grid_export_revenue")
+
+    @property
+    def battery_charge_cost(self) -> float | None:
+        return self._total("battery_charge_cost")
+
+    @property
+    def battery_discharge_revenue(self) -> float | None:
+        return self._total("battery_discharge_revenue")
+
+    @property
+    def arbitrage_value(self) -> float | None:
+        """Discharge revenue minus charge cost of the battery"""
+        if self.battery_charge_cost is None or self.battery_discharge_revenue is None:
+            return None
+        return self.battery_discharge_revenue - self.battery_charge_cost
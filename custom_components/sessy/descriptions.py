@@ -0,0 +1,770 @@
+"""Declarative catalogue of the Sessy entities, keyed by endpoint"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    CURRENCY_EURO,
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfFrequency,
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+from sessypy.const import SessyModbusState, SessyP1State, SessySystemState
+from sessypy.devices import SessyBattery, SessyCTMeter, SessyDevice, SessyP1Meter
+
+from .models import SessyConnectedDeviceType, SessyEntityProfile
+from .util import (
+    divide_by_hundred_thousand,
+    divide_by_thousand,
+    enum_to_options_list,
+    only_negative_as_positive,
+    only_positive,
+    status_string_modbus,
+    status_string_p1,
+    status_string_system_state,
+    unit_interval_to_percentage,
+)
+
+
+class SessySensorKind(StrEnum):
+    DEFAULT = "default"
+    COMBINED = "combined"
+    SCHEDULE = "schedule"
+    LEGACY_SCHEDULE = "legacy_schedule"
+
+
+@dataclass(frozen=True, kw_only=True)
+class SessySensorDescription:
+    """Description of a sensor on a coordinator endpoint"""
+
+    name: str
+    data_key: str = ""
+    kind: SessySensorKind = SessySensorKind.DEFAULT
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    unit_of_measurement: str | None = None
+    transform_function: Callable | None = None
+    translation_key: str | None = None
+    options: list[str] | None = None
+    entity_category: EntityCategory | None = None
+    precision: int | None = None
+    suggested_unit_of_measurement: str | None = None
+    availability_key: str | None = None
+    availability_test_value: Any = None
+    connected_device_type: SessyConnectedDeviceType = SessyConnectedDeviceType.SELF
+    unique_id_suffix: str | None = None
+
+    # Combined sensors sum these keys, schedule sensors read this key per schedule entry
+    data_keys: tuple[str, ...] = ()
+    schedule_key: str | None = None
+
+    # Only create the sensor if the data key is present on discovery
+    optional: bool = False
+    # Only create the sensor on these device classes (all if empty)
+    device_types: tuple[type[SessyDevice], ...] = ()
+    # Energy counters are disabled by default in statistics mode
+    energy_counter: bool = False
+    # Only enable the sensor by default if this key is non-zero on discovery
+    enabled_key: str | None = None
+    # Smallest entity profile that creates the sensor
+    profile: SessyEntityProfile = SessyEntityProfile.STANDARD
+
+
+def payload_index(data: Any, prefix: str = "") -> dict[str, Any]:
+    """Walk a payload once, mapping every dotted key path to its non-None value"""
+    index = dict()
+    if not isinstance(data, dict):
+        return index
+
+    for key, value in data.items():
+        if value is None:
+            continue
+        path = f"{prefix}{key}"
+        index[path] = value
+        if isinstance(value, dict):
+            index.update(payload_index(value, f"{path}."))
+    return index
+
+
+def select_descriptions(
+    catalogue: dict[str, tuple],
+    endpoint: str,
+    device: SessyDevice,
+    index: dict[str, Any],
+    profile: SessyEntityProfile = SessyEntityProfile.FULL,
+) -> list:
+    """Select the descriptions of an endpoint supported by the device and payload, within the entity profile"""
+    return [
+        description
+        for description in catalogue.get(endpoint, ())
+        if profile.includes(description.profile)
+        and (not description.device_types or isinstance(device, description.device_types))
+        and (not description.optional or description.data_key in index)
+    ]
+
+
+def _phases(build: Callable[[int], tuple]) -> tuple:
+    return tuple(
+        description for phase_id in range(1, 4) for description in build(phase_id)
+    )
+
+
+P1_AVAILABILITY = dict(
+    availability_key="state",
+    availability_test_value=SessyP1State.OK,
+)
+MODBUS_AVAILABILITY = dict(
+    availability_key="state",
+    availability_test_value="MODBUS_OK",
+)
+
+SENSOR_DESCRIPTIONS: dict[str, tuple[SessySensorDescription, ...]] = {
+    "get_network_status": (
+        SessySensorDescription(
+            name="WiFi RSSI",
+            profile=SessyEntityProfile.FULL,
+            data_key="wifi_sta.rssi",
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            optional=True,
+        ),
+    ),
+    "get_system_info": tuple(
+        SessySensorDescription(
+            name=f"{memory_type.title()} Memory Available",
+            profile=SessyEntityProfile.FULL,
+            data_key=f"{memory_type}_mem_available",
+            device_class=SensorDeviceClass.DATA_SIZE,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfInformation.BYTES,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            suggested_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        )
+        for memory_type in ("internal", "external")
+    ),
+    "get_dynamic_schedule": (
+        SessySensorDescription(
+            name="Power Schedule",
+            data_key="dynamic_schedule",
+            kind=SessySensorKind.SCHEDULE,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            schedule_key="power",
+            optional=True,
+        ),
+        SessySensorDescription(
+            name="Energy Price",
+            data_key="energy_prices",
+            kind=SessySensorKind.SCHEDULE,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            schedule_key="price",
+            transform_function=divide_by_hundred_thousand,
+            optional=True,
+        ),
+    ),
+    # TODO remove this when legacy schedule is no longer supported
+    "get_dynamic_schedule_legacy": (
+        SessySensorDescription(
+            name="Power Schedule",
+            data_key="power_strategy",
+            kind=SessySensorKind.LEGACY_SCHEDULE,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            schedule_key="power",
+            optional=True,
+        ),
+        SessySensorDescription(
+            name="Energy Price",
+            data_key="energy_prices",
+            kind=SessySensorKind.LEGACY_SCHEDULE,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
+            schedule_key="price",
+            transform_function=divide_by_hundred_thousand,
+            optional=True,
+        ),
+    ),
+    "get_power_status": (
+        SessySensorDescription(
+            name="System State",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy.system_state",
+            device_class=SensorDeviceClass.ENUM,
+            translation_key="battery_system_state",
+            transform_function=status_string_system_state,
+            options=enum_to_options_list(SessySystemState, status_string_system_state),
+            entity_category=EntityCategory.DIAGNOSTIC,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="System State Details",
+            profile=SessyEntityProfile.FULL,
+            data_key="sessy.system_state_details",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="State of Charge",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy.state_of_charge",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=PERCENTAGE,
+            transform_function=unit_interval_to_percentage,
+            precision=1,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy.power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="Charge Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy.power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            transform_function=only_negative_as_positive,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="Discharge Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy.power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            transform_function=only_positive,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="Frequency",
+            profile=SessyEntityProfile.FULL,
+            data_key="sessy.frequency",
+            device_class=SensorDeviceClass.FREQUENCY,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfFrequency.HERTZ,
+            transform_function=divide_by_thousand,
+            precision=3,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+        ),
+        SessySensorDescription(
+            name="Inverter Current",
+            profile=SessyEntityProfile.FULL,
+            data_key="sessy.inverter_current_ma",
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+            suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            optional=True,
+        ),
+        SessySensorDescription(
+            name="Pack Voltage",
+            profile=SessyEntityProfile.FULL,
+            data_key="sessy.pack_voltage",
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+            suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            optional=True,
+        ),
+        SessySensorDescription(
+            name="External Power",
+            data_key="sessy.external_power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            optional=True,
+        ),
+        *_phases(
+            lambda phase_id: (
+                SessySensorDescription(
+                    name=f"Renewable Energy Phase {phase_id} Voltage",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"renewable_energy_phase{phase_id}.voltage_rms",
+                    device_class=SensorDeviceClass.VOLTAGE,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+                    connected_device_type=SessyConnectedDeviceType.BATTERY,
+                ),
+                SessySensorDescription(
+                    name=f"Renewable Energy Phase {phase_id} Current",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"renewable_energy_phase{phase_id}.current_rms",
+                    device_class=SensorDeviceClass.CURRENT,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    connected_device_type=SessyConnectedDeviceType.BATTERY,
+                ),
+                SessySensorDescription(
+                    name=f"Renewable Energy Phase {phase_id} Power",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"renewable_energy_phase{phase_id}.power",
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfPower.WATT,
+                    connected_device_type=SessyConnectedDeviceType.BATTERY,
+                ),
+            )
+        ),
+    ),
+    "get_energy_status": (
+        SessySensorDescription(
+            name="Charged Energy",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy_energy.import_wh",
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            device_types=(SessyBattery,),
+            energy_counter=True,
+        ),
+        SessySensorDescription(
+            name="Discharged Energy",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="sessy_energy.export_wh",
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            device_types=(SessyBattery,),
+            energy_counter=True,
+        ),
+        # Metered phase energy, named after the renewable energy phases on batteries
+        *_phases(
+            lambda phase_id: tuple(
+                SessySensorDescription(
+                    name=f"{prefix}Phase {phase_id} {direction.title()}ed Energy",
+                    profile=SessyEntityProfile.MINIMAL,
+                    data_key=f"energy_phase{phase_id}.{direction}_wh",
+                    device_class=SensorDeviceClass.ENERGY,
+                    state_class=SensorStateClass.TOTAL_INCREASING,
+                    unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+                    suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+                    connected_device_type=connected_device_type,
+                    device_types=(device_type,),
+                    energy_counter=True,
+                )
+                for device_type, prefix, connected_device_type in (
+                    (SessyBattery, "Renewable Energy ", SessyConnectedDeviceType.BATTERY),
+                    (SessyCTMeter, "", SessyConnectedDeviceType.SELF),
+                )
+                for direction in ("import", "export")
+            )
+        ),
+    ),
+    "get_p1_details": (
+        SessySensorDescription(
+            name="Status",
+            data_key="state",
+            device_class=SensorDeviceClass.ENUM,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            translation_key="p1_state",
+            transform_function=status_string_p1,
+            options=enum_to_options_list(SessyP1State, status_string_p1),
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            unique_id_suffix="sensor-P1Status",
+        ),
+        SessySensorDescription(
+            name="Tariff",
+            profile=SessyEntityProfile.FULL,
+            data_key="tariff_indicator",
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            **P1_AVAILABILITY,
+        ),
+        SessySensorDescription(
+            name="Total Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="power_total",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            unique_id_suffix="sensor-P1Power",
+            **P1_AVAILABILITY,
+        ),
+        SessySensorDescription(
+            name="Total Consuming Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="power_consumed",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            unique_id_suffix="sensor-P1ConsumingPower",
+            **P1_AVAILABILITY,
+        ),
+        SessySensorDescription(
+            name="Total Producing Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="power_produced",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            unique_id_suffix="sensor-P1ProducingPower",
+            **P1_AVAILABILITY,
+        ),
+        SessySensorDescription(
+            name="Gas Consumption",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="gas_meter_value",
+            device_class=SensorDeviceClass.GAS,
+            state_class=SensorStateClass.TOTAL,
+            unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+            transform_function=divide_by_thousand,
+            precision=3,
+            enabled_key="gas_meter_value",
+            connected_device_type=SessyConnectedDeviceType.P1_GAS_METER,
+            unique_id_suffix="sensor-GasConsumption",
+            **P1_AVAILABILITY,
+        ),
+        *_phases(
+            lambda phase_id: (
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Voltage",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"voltage_l{phase_id}",
+                    device_class=SensorDeviceClass.VOLTAGE,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+                    connected_device_type=SessyConnectedDeviceType.P1_METER,
+                    **P1_AVAILABILITY,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Current",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"current_l{phase_id}",
+                    device_class=SensorDeviceClass.CURRENT,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                    precision=0,
+                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    connected_device_type=SessyConnectedDeviceType.P1_METER,
+                    **P1_AVAILABILITY,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Consuming Power",
+                    data_key=f"power_consumed_l{phase_id}",
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfPower.WATT,
+                    connected_device_type=SessyConnectedDeviceType.P1_METER,
+                    **P1_AVAILABILITY,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Producing Power",
+                    data_key=f"power_produced_l{phase_id}",
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfPower.WATT,
+                    connected_device_type=SessyConnectedDeviceType.P1_METER,
+                    **P1_AVAILABILITY,
+                ),
+            )
+        ),
+        *(
+            SessySensorDescription(
+                name=f"Tariff {tariff_id} {direction.title()} Energy",
+                profile=SessyEntityProfile.MINIMAL,
+                data_key=f"power_{direction.lower()}_tariff{tariff_id}",
+                device_class=SensorDeviceClass.ENERGY,
+                state_class=SensorStateClass.TOTAL,
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+                suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+                connected_device_type=SessyConnectedDeviceType.P1_METER,
+                energy_counter=True,
+                **P1_AVAILABILITY,
+            )
+            for tariff_id in range(1, 3)
+            for direction in ("consumed", "produced")
+        ),
+        # Combine tariff 1 and 2 energy into total energy sensors
+        *(
+            SessySensorDescription(
+                name=f"Total {direction.title()} Energy",
+                profile=SessyEntityProfile.MINIMAL,
+                kind=SessySensorKind.COMBINED,
+                data_keys=(f"power_{direction}_tariff1", f"power_{direction}_tariff2"),
+                device_class=SensorDeviceClass.ENERGY,
+                state_class=SensorStateClass.TOTAL,
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+                suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+                connected_device_type=SessyConnectedDeviceType.P1_METER,
+                **P1_AVAILABILITY,
+            )
+            for direction in ("consumed", "produced")
+        ),
+    ),
+    "get_modbus_details": (
+        SessySensorDescription(
+            name="Total Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="total_power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+            connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
+            unique_id_suffix="sensor-ModbusTotalPower",
+            **MODBUS_AVAILABILITY,
+        ),
+        *(
+            SessySensorDescription(
+                name=f"Total {direction.title()}ed Energy",
+                profile=SessyEntityProfile.MINIMAL,
+                data_key=f"total_{direction}",
+                device_class=SensorDeviceClass.ENERGY,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+                suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+                connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
+                unique_id_suffix=f"sensor-ModbusTotal{direction.title()}edEnergy",
+                energy_counter=True,
+                **MODBUS_AVAILABILITY,
+            )
+            for direction in ("import", "export")
+        ),
+        *_phases(
+            lambda phase_id: (
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Voltage",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"phase_{phase_id}.voltage",
+                    device_class=SensorDeviceClass.VOLTAGE,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+                    connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
+                    unique_id_suffix=f"sensor-ModbusPhase{phase_id}Voltage",
+                    **MODBUS_AVAILABILITY,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Current",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"phase_{phase_id}.current",
+                    device_class=SensorDeviceClass.CURRENT,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
+                    unique_id_suffix=f"sensor-ModbusPhase{phase_id}Current",
+                    **MODBUS_AVAILABILITY,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Power",
+                    data_key=f"phase_{phase_id}.power",
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfPower.WATT,
+                    connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
+                    unique_id_suffix=f"sensor-ModbusPhase{phase_id}Power",
+                    **MODBUS_AVAILABILITY,
+                ),
+            )
+        ),
+        # Diagnostic fields
+        SessySensorDescription(
+            name="Device Type",
+            profile=SessyEntityProfile.FULL,
+            data_key="device_type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            unique_id_suffix="sensor-ModbusDeviceType",
+        ),
+        SessySensorDescription(
+            name="Status",
+            data_key="state",
+            device_class=SensorDeviceClass.ENUM,
+            translation_key="modbus_state",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            transform_function=status_string_modbus,
+            options=enum_to_options_list(SessyModbusState, status_string_modbus),
+            unique_id_suffix="sensor-ModbusStatus",
+        ),
+    ),
+    "get_ct_details": (
+        SessySensorDescription(
+            name="Total Power",
+            profile=SessyEntityProfile.MINIMAL,
+            data_key="total_power",
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_of_measurement=UnitOfPower.WATT,
+        ),
+        *_phases(
+            lambda phase_id: (
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Voltage",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"voltage_l{phase_id}",
+                    device_class=SensorDeviceClass.VOLTAGE,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                    precision=3,
+                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Current",
+                    profile=SessyEntityProfile.FULL,
+                    data_key=f"current_l{phase_id}",
+                    device_class=SensorDeviceClass.CURRENT,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                    precision=3,
+                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                ),
+                SessySensorDescription(
+                    name=f"Phase {phase_id} Power",
+                    data_key=f"power_l{phase_id}",
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    unit_of_measurement=UnitOfPower.WATT,
+                ),
+            )
+        ),
+    ),
+}
+
+
+# Battery analytics, the data key is the SessyBatteryAnalytics property
+ANALYTICS_SENSOR_DESCRIPTIONS: tuple[SessySensorDescription, ...] = (
+    SessySensorDescription(
+        name="Power Trend",
+        data_key="power_trend",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit_of_measurement=UnitOfPower.WATT,
+        precision=0,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+    SessySensorDescription(
+        name="Power Ramp Rate",
+        data_key="ramp_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit_of_measurement=f"{UnitOfPower.WATT}/{UnitOfTime.MINUTES}",
+        precision=0,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+    SessySensorDescription(
+        name="Time to Full",
+        data_key="time_to_full",
+        device_class=SensorDeviceClass.DURATION,
+        unit_of_measurement=UnitOfTime.MINUTES,
+        precision=0,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+    SessySensorDescription(
+        name="Time to Empty",
+        data_key="time_to_empty",
+        device_class=SensorDeviceClass.DURATION,
+        unit_of_measurement=UnitOfTime.MINUTES,
+        precision=0,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+    SessySensorDescription(
+        name="Equivalent Full Cycles",
+        data_key="equivalent_full_cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        precision=2,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+    SessySensorDescription(
+        name="Round Trip Efficiency",
+        data_key="round_trip_efficiency",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit_of_measurement=PERCENTAGE,
+        precision=1,
+        connected_device_type=SessyConnectedDeviceType.BATTERY,
+    ),
+)
+
+
+# Energy costs, the data key is the SessyEnergyCosts property
+COST_SENSOR_DESCRIPTIONS: tuple[SessySensorDescription, ...] = (
+    *(
+        SessySensorDescription(
+            name=name,
+            data_key=data_key,
+            device_class=SensorDeviceClass.MONETARY,
+            state_class=SensorStateClass.TOTAL,
+            unit_of_measurement=CURRENCY_EURO,
+            precision=2,
+            connected_device_type=SessyConnectedDeviceType.P1_METER,
+            device_types=(SessyP1Meter,),
+        )
+        for name, data_key in (
+            ("Grid Import Cost", "grid_import_cost"),
+            ("Grid Export Revenue", "grid_export_revenue"),
+        )
+    ),
+    *(
+        SessySensorDescription(
+            name=name,
+            data_key=data_key,
+            device_class=SensorDeviceClass.MONETARY,
+            state_class=SensorStateClass.TOTAL,
+            unit_of_measurement=CURRENCY_EURO,
+            precision=2,
+            connected_device_type=SessyConnectedDeviceType.BATTERY,
+            device_types=(SessyBattery,),
+        )
+        for name, data_key in (
+            ("Charge Cost", "battery_charge_cost"),
+            ("Discharge Revenue", "battery_discharge_revenue"),
+            ("Arbitrage Value", "arbitrage_value"),
+        )
+    ),
+)
+
+
+# Peak demand of P1 meters, the data key is the SessyPeakDemand property
+PEAK_SENSOR_DESCRIPTIONS: tuple[SessySensorDescription, ...] = tuple(
+    SessySensorDescription(
+        name=name,
+        data_key=data_key,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit_of_measurement=UnitOfPower.WATT,
+        precision=0,
+        connected_device_type=SessyConnectedDeviceType.P1_METER,
+        device_types=(SessyP1Meter,),
+    )
+    for name, data_key in (
+        ("Quarter Average Power", "quarter_average_power"),
+        ("Last Quarter Power", "last_quarter_power"),
+        ("Monthly Peak Power", "monthly_peak_power"),
+        ("Rolling Peak Average Power", "rolling_peak_average"),
+    )
+)
@@ -5,12 +5,16 @@ from __future__ import annotations
 import logging
 
 from homeassistant.const import ATTR_IDENTIFIERS
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from sessypy.api import SessyApi
 from sessypy.devices import (
     SessyBattery,
+    SessyCTMeter,
     SessyDevice,
     SessyP1Meter,
 )
@@ -18,6 +22,8 @@ from sessypy.devices import (
 from .const import (
     DOMAIN,
     SESSY_MANUFACTURER,
+    VALIDATED_DEVICE_TTL,
+    VALIDATED_DEVICES,
 )
 from .coordinator import SessyCoordinator
 from .models import SessyConfigEntry, SessyConnectedDeviceType
@@ -25,6 +31,75 @@ from .util import decode_equipment_identifier
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device class by the first letter of the serial number, as in sessypy discovery
+DEVICE_CLASSES: dict[str, type[SessyDevice]] = {
+    "C": SessyCTMeter,
+    "D": SessyBattery,
+    "P": SessyP1Meter,
+}
+
+
+def create_sessy_device(config_entry: SessyConfigEntry) -> SessyDevice | None:
+    """Create the device from the serial number of a known entry, skipping the discovery request.
+
+    The serial number is the unique ID, taken from the zeroconf TXT record or the username."""
+    device_class = DEVICE_CLASSES.get((config_entry.unique_id or "")[:1].upper())
+    if device_class is None:
+        return None
+
+    return device_class(
+        SessyApi(
+            config_entry.data.get(CONF_HOST),
+            config_entry.data.get(CONF_USERNAME),
+            config_entry.data.get(CONF_PASSWORD),
+        )
+    )
+
+
+@callback
+def async_set_device_host(device: SessyDevice, host: str):
+    """Point an open device at a new address, keeping its session"""
+    # sessypy (pinned at 0.2.6) has no setter: the API builds its URLs from api.host,
+    # and the device keeps a private copy. Check both when bumping sessypy
+    device.api.host = host
+    device._host = host
+
+
+def _validated_device_key(data: dict) -> tuple:
+    return (data.get(CONF_HOST), data.get(CONF_USERNAME), data.get(CONF_PASSWORD))
+
+
+@callback
+def async_cache_validated_device(hass: HomeAssistant, data: dict, device: SessyDevice):
+    """Keep a device validated by the config flow open for async_setup_entry, closing it if unused"""
+    validated_devices: dict = hass.data.setdefault(DOMAIN, dict()).setdefault(
+        VALIDATED_DEVICES, dict()
+    )
+    key = _validated_device_key(data)
+    previous = async_pop_validated_device(hass, data)
+    if previous is not None:
+        hass.async_create_task(previous.close())
+
+    async def async_expire(now):
+        if validated_devices.get(key, (None,))[0] is device:
+            validated_devices.pop(key)
+            await device.close()
+
+    validated_devices[key] = (device, async_call_later(hass, VALIDATED_DEVICE_TTL, async_expire))
+
+
+@callback
+def async_pop_validated_device(hass: HomeAssistant, data: dict) -> SessyDevice | None:
+    """Take the device validated by the config flow for this entry data, if still open"""
+    validated_devices: dict = hass.data.get(DOMAIN, dict()).get(VALIDATED_DEVICES, dict())
+    cached = validated_devices.pop(_validated_device_key(data), None)
+    if cached is None:
+        return None
+
+    device, cancel_expire = cached
+    cancel_expire()
+    return device
+
 
 async def generate_device_info(
     hass: HomeAssistant,
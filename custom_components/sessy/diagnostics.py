@@ -0,0 +1,80 @@
+"""Diagnostics support for Sessy"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+
+TO_REDACT = {
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "device_uid",
+    "equipment_identifier",
+    "gas_equipment_identifier",
+    "gateway",
+    "ip",
+    "mac",
+    "self_serial",
+    "sessy_serial",
+    "ssid",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: SessyConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    runtime_data = config_entry.runtime_data
+    coordinators: dict[Callable, SessyCoordinator] = runtime_data.coordinators
+
+    coordinators_diagnostics = dict()
+    for coordinator in coordinators.values():
+        update_interval = coordinator.update_interval
+        coordinators_diagnostics[coordinator.name] = {
+            "update_interval": (
+                update_interval.total_seconds() if update_interval else None
+            ),
+            "effective_update_interval": coordinator.metrics.effective_interval,
+            "sample_interval": (
+                coordinator.sample_interval.total_seconds()
+                if coordinator.sample_interval
+                else None
+            ),
+            "turbo_interval": (
+                coordinator.turbo_interval.total_seconds()
+                if coordinator.turbo_interval
+                else None
+            ),
+            "request_timeout": coordinator.request_timeout(),
+            "phase_lock": (
+                coordinator.phase_lock.as_dict()
+                if coordinator.phase_lock is not None
+                else None
+            ),
+            "last_update_success": coordinator.last_update_success,
+            "metrics": coordinator.metrics.as_dict(),
+            "fetch_history": list(coordinator.metrics.fetch_history),
+            "raw_data": async_redact_data(coordinator.raw_data, TO_REDACT),
+        }
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "device": {
+            "type": runtime_data.device.__class__.__name__,
+            "model": runtime_data.device.model,
+        },
+        "startup_timeline": runtime_data.timeline.phases,
+        "coordinators": coordinators_diagnostics,
+        "turbo": runtime_data.turbo.as_dict() if runtime_data.turbo is not None else None,
+    }
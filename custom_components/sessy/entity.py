@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import logging
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from sessypy.devices import (
     SessyDevice,
 )
 
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from .const import (
     ENTITY_ERROR_THRESHOLD,
@@ -21,6 +23,37 @@ from .models import SessyConfigEntry, SessyConnectedDeviceType
 _LOGGER = logging.getLogger(__name__)
 
 
+def name_unique_id_suffix(name: str) -> str:
+    """Unique id suffix of an entity named without an explicit suffix"""
+    return f"sensor-{name.replace(' ', '')}"
+
+
+@callback
+def async_remove_excluded_entities(
+    hass: HomeAssistant,
+    config_entry: SessyConfigEntry,
+    platform: Platform,
+    unique_id_suffixes: Iterable[str],
+):
+    """Remove the registry entries of the entities outside the entity profile,
+    so switching to a smaller profile does not leave entities behind"""
+    serial_number = config_entry.runtime_data.device.serial_number
+    unique_ids = {
+        f"sessy-{serial_number}-{unique_id_suffix}".lower()
+        for unique_id_suffix in unique_id_suffixes
+    }
+    if not unique_ids:
+        return
+
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+        if registry_entry.domain == platform and registry_entry.unique_id in unique_ids:
+            _LOGGER.debug(
+                f"Removing {registry_entry.entity_id}, not part of the {config_entry.runtime_data.entity_profile} entity profile"
+            )
+            registry.async_remove(registry_entry.entity_id)
+
+
 class SessyCoordinatorEntity(CoordinatorEntity):
     """Base Sessy Entity, coordinated by SessyCoordinator"""
 
@@ -58,11 +91,12 @@ class SessyCoordinatorEntity(CoordinatorEntity):
 
         # TODO Technical dept, this will cause issues if we ever need to change entity names
         if unique_id_suffix is None:
-            unique_id_suffix = f"sensor-{name.replace(' ', '')}"
+            unique_id_suffix = name_unique_id_suffix(name)
 
         self._attr_unique_id = (
             f"sessy-{device.serial_number}-{unique_id_suffix}".lower()
         )
+        coordinator.unique_ids.add(self._attr_unique_id)
         self._attr_translation_key = translation_key
 
         self._attr_device_info = config_entry.runtime_data.device_info.get(
@@ -91,6 +125,7 @@ class SessyCoordinatorEntity(CoordinatorEntity):
         finally:
             self.update_from_cache()
             self.async_write_ha_state()
+            self.coordinator.metrics.record_state_write()
 
     def copy_from_cache(self):
         value, available = self.coordinator.data.get(self.context, tuple((None, False)))
@@ -0,0 +1,269 @@
+"""Runtime performance metrics for Sessy coordinators"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from functools import wraps
+import json
+from time import monotonic
+from typing import Any
+
+from .const import METRICS_FETCH_HISTORY, METRICS_LATENCY_BUCKETS, METRICS_LATENCY_WINDOW
+
+
+class SessyCoordinatorMetrics:
+    """Request, flatten and dispatch counters recorded by a SessyCoordinator"""
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.retries = 0
+
+        # Last bucket counts requests slower than the largest bucket bound
+        self.latency_histogram = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+        self.latency_last: float = None
+        self.latency_total = 0.0
+        # Recent successful request latencies, for the adaptive timeout
+        self.latency_window: deque[float] = deque(maxlen=METRICS_LATENCY_WINDOW)
+
+        # Last payload, serialized only when its size is read
+        self._payload: Any = None
+        self._sized_payload: Any = None
+        self._payload_size: int = None
+        self.flatten_time: float = None
+        self.dispatch_time: float = None
+
+        self.ticks = 0
+        # Sample ticks skipped because a request to the endpoint was still running
+        self.ticks_skipped = 0
+        self.listeners_notified = 0
+        self.state_writes = 0
+        self.state_writes_total = 0
+
+        self._dispatch_start: float = None
+
+        # Last fetches, each including the individual attempts (retries)
+        self.fetch_history: deque[dict[str, Any]] = deque(maxlen=METRICS_FETCH_HISTORY)
+        self._fetch_starts: deque[float] = deque(maxlen=METRICS_FETCH_HISTORY)
+
+    def record_request(
+        self,
+        latency: float,
+        timed_out: bool = False,
+        failed: bool = False,
+        attempts: list[dict[str, Any]] | None = None,
+    ):
+        """Record the outcome of a single request to the device, as an attempt of a fetch if given"""
+        if attempts is not None:
+            attempts.append(
+                {
+                    "latency_ms": to_milliseconds(latency),
+                    "result": "timeout" if timed_out else "error" if failed else "ok",
+                }
+            )
+        self.requests += 1
+        self.latency_last = latency
+        self.latency_total += latency
+        self.latency_histogram[bisect_left(METRICS_LATENCY_BUCKETS, latency)] += 1
+
+        if timed_out:
+            self.timeouts += 1
+            self.failures += 1
+        elif failed:
+            self.failures += 1
+        else:
+            self.latency_window.append(latency)
+
+    def record_retry(self):
+        self.retries += 1
+
+    def record_fetch(
+        self, start: float, duration: float, success: bool, attempts: list[dict[str, Any]]
+    ):
+        """Record a complete fetch cycle with the attempts it made"""
+        self._fetch_starts.append(start)
+        # Recorded when the fetch ends, start is monotonic
+        started_at = datetime.now(UTC) - timedelta(seconds=duration)
+        self.fetch_history.append(
+            {
+                "started_at": started_at.isoformat(timespec="milliseconds"),
+                "duration_ms": to_milliseconds(duration),
+                "success": success,
+                "attempts": attempts,
+            }
+        )
+
+    @property
+    def effective_interval(self) -> float | None:
+        """Mean measured time in seconds between the starts of the recent fetches"""
+        if len(self._fetch_starts) < 2:
+            return None
+        return (self._fetch_starts[-1] - self._fetch_starts[0]) / (
+            len(self._fetch_starts) - 1
+        )
+
+    def record_tick_skipped(self):
+        self.ticks_skipped += 1
+
+    @property
+    def successful_requests(self) -> int:
+        return self.requests - self.failures
+
+    def record_payload(self, data: Any):
+        """Record a payload returned by the device, without serializing it"""
+        self._payload = data
+
+    @property
+    def payload_size(self) -> int | None:
+        """Serialized size of the last payload, computed once per payload when read"""
+        if self._payload is not self._sized_payload:
+            self._sized_payload = self._payload
+            try:
+                self._payload_size = (
+                    len(json.dumps(self._payload, separators=(",", ":")))
+                    if self._payload is not None
+                    else None
+                )
+            except (TypeError, ValueError):
+                self._payload_size = None
+        return self._payload_size
+
+    def record_flatten(self, duration: float):
+        self.flatten_time = duration
+
+    def start_dispatch(self, listeners: int):
+        """Mark the start of a listener dispatch tick"""
+        self.ticks += 1
+        self.listeners_notified = listeners
+        self.state_writes = 0
+        self._dispatch_start = monotonic()
+
+    def finish_dispatch(self):
+        if self._dispatch_start is not None:
+            self.dispatch_time = monotonic() - self._dispatch_start
+            self._dispatch_start = None
+
+    def record_state_write(self):
+        self.state_writes += 1
+        self.state_writes_total += 1
+
+    @property
+    def latency_mean(self) -> float | None:
+        if self.requests == 0:
+            return None
+        return self.latency_total / self.requests
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Estimate a latency percentile as the upper bound of the matching histogram bucket"""
+        if self.requests == 0:
+            return None
+
+        threshold = self.requests * percentile / 100
+        count = 0
+        for index, bucket_count in enumerate(self.latency_histogram):
+            count += bucket_count
+            if count >= threshold:
+                if index < len(METRICS_LATENCY_BUCKETS):
+                    return METRICS_LATENCY_BUCKETS[index]
+                break
+
+        # Slower than the largest bucket, fall back to the largest bucket bound
+        return METRICS_LATENCY_BUCKETS[-1]
+
+    def recent_latency_percentile(self, percentile: float) -> float | None:
+        """Latency percentile of the recent successful requests"""
+        if len(self.latency_window) == 0:
+            return None
+        latencies = sorted(self.latency_window)
+        index = min(int(len(latencies) * percentile / 100), len(latencies) - 1)
+        return latencies[index]
+
+    def histogram(self) -> dict[str, int]:
+        """Return the latency histogram keyed by bucket upper bound"""
+        histogram = dict()
+        for index, bucket_count in enumerate(self.latency_histogram):
+            if index < len(METRICS_LATENCY_BUCKETS):
+                histogram[f"le_{METRICS_LATENCY_BUCKETS[index]}s"] = bucket_count
+            else:
+                histogram["inf"] = bucket_count
+        return histogram
+
+    def summary(self) -> dict[str, Any]:
+        """Compact summary, suitable for state attributes"""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "latency_mean_ms": to_milliseconds(self.latency_mean),
+            "state_writes_per_tick": self.state_writes,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Full set of metrics, suitable for state attributes and diagnostics"""
+        return {
+            **self.summary(),
+            "latency_last_ms": to_milliseconds(self.latency_last),
+            "latency_p50_ms": to_milliseconds(self.latency_percentile(50)),
+            "latency_p95_ms": to_milliseconds(self.latency_percentile(95)),
+            "latency_recent_p99_ms": to_milliseconds(self.recent_latency_percentile(99)),
+            "latency_histogram": self.histogram(),
+            "payload_size": self.payload_size,
+            "flatten_time_ms": to_milliseconds(self.flatten_time),
+            "dispatch_time_ms": to_milliseconds(self.dispatch_time),
+            "ticks": self.ticks,
+            "ticks_skipped": self.ticks_skipped,
+            "listeners_notified": self.listeners_notified,
+            "state_writes_total": self.state_writes_total,
+        }
+
+
+class SessyStartupTimeline:
+    """Timeline of the phases of setting up a config entry"""
+
+    def __init__(self):
+        self._start = monotonic()
+        self.phases: list[dict[str, Any]] = list()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a named phase"""
+        phase_start = monotonic()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.phases.append(
+                {
+                    "phase": name,
+                    "offset_ms": to_milliseconds(phase_start - self._start),
+                    "duration_ms": to_milliseconds(monotonic() - phase_start),
+                    "success": success,
+                }
+            )
+
+
+def track_platform_setup(platform: str):
+    """Decorate a platform's async_setup_entry to record its duration in the startup timeline"""
+
+    def decorator(async_setup_entry: Callable):
+        @wraps(async_setup_entry)
+        async def wrapper(hass, config_entry, async_add_entities):
+            with config_entry.runtime_data.timeline.phase(f"platform.{platform}"):
+                return await async_setup_entry(hass, config_entry, async_add_entities)
+
+        return wrapper
+
+    return decorator
+
+
+def to_milliseconds(seconds: float | None) -> float | None:
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 2)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Callable
 
@@ -7,6 +7,8 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from sessypy.devices import SessyDevice
 
+from .metrics import SessyStartupTimeline
+
 type SessyConfigEntry = ConfigEntry[SessyRuntimeData]
 
 class SessyConnectedDeviceType(StrEnum):
@@ -16,11 +18,34 @@ class SessyConnectedDeviceType(StrEnum):
     P1_GAS_METER = "p1_gas_meter"
     MODBUS_METER = "modbus_meter"
 
+class SessyEntityProfile(StrEnum):
+    MINIMAL = "minimal"
+    STANDARD = "standard"
+    FULL = "full"
+
+    def includes(self, profile: "SessyEntityProfile") -> bool:
+        """Whether this profile creates the entities of the given (smaller) profile"""
+        order = list(SessyEntityProfile)
+        return order.index(profile) <= order.index(self)
+
 @dataclass
 class SessyRuntimeData:
     device: SessyDevice
     device_info: dict[SessyConnectedDeviceType,DeviceInfo]
     coordinators: dict[Callable, DataUpdateCoordinator]
+    timeline: SessyStartupTimeline = field(default_factory=SessyStartupTimeline)
+    statistics: list | None = None
+    telemetry: dict | None = None
+    archive: object | None = None
+    ota_tracker: object | None = None
+    supervisor: object | None = None
+    analytics: object | None = None
+    costs: object | None = None
+    peak_demand: object | None = None
+    turbo: object | None = None
+    # Functions ending the websocket sample streams of the device
+    streams: set[Callable[[], None]] = field(default_factory=set)
+    entity_profile: SessyEntityProfile = SessyEntityProfile.FULL
 
 
     
\ No newline at end of file
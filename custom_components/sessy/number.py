@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from homeassistant.const import PERCENTAGE, UnitOfPower, UnitOfTime
+from homeassistant.const import PERCENTAGE, Platform, UnitOfPower, UnitOfTime
 from homeassistant.components.number import NumberEntity, NumberDeviceClass
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -14,14 +14,31 @@ from sessypy.util import SessyNotSupportedException, SessyConnectionException
 from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Settings of the standard entity profile, removed in the minimal profile
+STANDARD_NUMBERS = (
+    "Minimum Power",
+    "Maximum Power",
+    "Noise Level",
+    "Eco Charge Power",
+    "Eco Charge Hours",
+    "Minimum State of Charge",
+)
+
+
+@track_platform_setup(Platform.NUMBER)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -50,117 +67,118 @@ async def async_setup_entry(
             )
         )
 
-        system_settings_coordinator = coordinators[device.get_system_settings]
-
-        numbers.append(
-            SessySettingNumberEntity(
-                hass,
-                config_entry,
-                "Minimum Power",
-                system_settings_coordinator,
-                "min_power",
-                NumberDeviceClass.POWER,
-                UnitOfPower.WATT,
-                50,
-                2000,
-                entity_category=EntityCategory.CONFIG,
-                connected_device_type=SessyConnectedDeviceType.BATTERY,
+        # Settings are not part of the minimal entity profile
+        if config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+            system_settings_coordinator = coordinators[device.get_system_settings]
+            numbers.append(
+                SessySettingNumberEntity(
+                    hass,
+                    config_entry,
+                    "Minimum Power",
+                    system_settings_coordinator,
+                    "min_power",
+                    NumberDeviceClass.POWER,
+                    UnitOfPower.WATT,
+                    50,
+                    2000,
+                    entity_category=EntityCategory.CONFIG,
+                    connected_device_type=SessyConnectedDeviceType.BATTERY,
+                )
             )
-        )
-        numbers.append(
-            SessySettingNumberEntity(
-                hass,
-                config_entry,
-                "Maximum Power",
-                system_settings_coordinator,
-                "max_power",
-                NumberDeviceClass.POWER,
-                UnitOfPower.WATT,
-                50,
-                2200,
-                entity_category=EntityCategory.CONFIG,
-                connected_device_type=SessyConnectedDeviceType.BATTERY,
+            numbers.append(
+                SessySettingNumberEntity(
+                    hass,
+                    config_entry,
+                    "Maximum Power",
+                    system_settings_coordinator,
+                    "max_power",
+                    NumberDeviceClass.POWER,
+                    UnitOfPower.WATT,
+                    50,
+                    2200,
+                    entity_category=EntityCategory.CONFIG,
+                    connected_device_type=SessyConnectedDeviceType.BATTERY,
+                )
             )
-        )
 
-        # Firmware or hardware-revision specific settings
-        try:
-            settings: dict = system_settings_coordinator.raw_data
-            if "error" in settings:
-                _LOGGER.warning(
-                    f"Sessy settings api returned an error:\n{settings.get('error')}\nSome entities might not work until settings are saved in the Sessy portal or web UI."
-                )
+            # Firmware or hardware-revision specific settings
+            try:
+                settings: dict = system_settings_coordinator.raw_data
+                if "error" in settings:
+                    _LOGGER.warning(
+                        f"Sessy settings api returned an error:\n{settings.get('error')}\nSome entities might not work until settings are saved in the Sessy portal or web UI."
+                    )
 
-            # Noise controls
-            if not settings.get("disable_noise_level", True):
-                numbers.append(
-                    SessySettingNumberEntity(
-                        hass,
-                        config_entry,
-                        "Noise Level",
-                        system_settings_coordinator,
-                        "allowed_noise_level",
-                        min_value=1,
-                        max_value=5,
-                        entity_category=EntityCategory.CONFIG,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
+                # Noise controls
+                if not settings.get("disable_noise_level", True):
+                    numbers.append(
+                        SessySettingNumberEntity(
+                            hass,
+                            config_entry,
+                            "Noise Level",
+                            system_settings_coordinator,
+                            "allowed_noise_level",
+                            min_value=1,
+                            max_value=5,
+                            entity_category=EntityCategory.CONFIG,
+                            connected_device_type=SessyConnectedDeviceType.BATTERY,
+                        )
                     )
-                )
 
-            # Eco mode controls (fw 1.6.8+)
-            if settings.get("eco_charge_power", None) is not None:
-                numbers.append(
-                    SessySettingNumberEntity(
-                        hass,
-                        config_entry,
-                        "Eco Charge Power",
-                        system_settings_coordinator,
-                        "eco_charge_power",
-                        NumberDeviceClass.POWER,
-                        UnitOfPower.WATT,
-                        50,
-                        2200,
-                        entity_category=EntityCategory.CONFIG,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
+                # Eco mode controls (fw 1.6.8+)
+                if settings.get("eco_charge_power", None) is not None:
+                    numbers.append(
+                        SessySettingNumberEntity(
+                            hass,
+                            config_entry,
+                            "Eco Charge Power",
+                            system_settings_coordinator,
+                            "eco_charge_power",
+                            NumberDeviceClass.POWER,
+                            UnitOfPower.WATT,
+                            50,
+                            2200,
+                            entity_category=EntityCategory.CONFIG,
+                            connected_device_type=SessyConnectedDeviceType.BATTERY,
+                        )
                     )
-                )
-            if settings.get("eco_charge_hours", None) is not None:
-                numbers.append(
-                    SessySettingNumberEntity(
-                        hass,
-                        config_entry,
-                        "Eco Charge Hours",
-                        system_settings_coordinator,
-                        "eco_charge_hours",
-                        NumberDeviceClass.DURATION,
-                        UnitOfTime.HOURS,
-                        0,
-                        24,
-                        entity_category=EntityCategory.CONFIG,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
+                if settings.get("eco_charge_hours", None) is not None:
+                    numbers.append(
+                        SessySettingNumberEntity(
+                            hass,
+                            config_entry,
+                            "Eco Charge Hours",
+                            system_settings_coordinator,
+                            "eco_charge_hours",
+                            NumberDeviceClass.DURATION,
+                            UnitOfTime.HOURS,
+                            0,
+                            24,
+                            entity_category=EntityCategory.CONFIG,
+                            connected_device_type=SessyConnectedDeviceType.BATTERY,
+                        )
                     )
-                )
-            if settings.get("min_soc", None) is not None:
-                numbers.append(
-                    SessySettingNumberEntity(
-                        hass,
-                        config_entry,
-                        "Minimum State of Charge",
-                        system_settings_coordinator,
-                        "min_soc",
-                        None,
-                        PERCENTAGE,
-                        0,
-                        100,
-                        entity_category=EntityCategory.CONFIG,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
+                if settings.get("min_soc", None) is not None:
+                    numbers.append(
+                        SessySettingNumberEntity(
+                            hass,
+                            config_entry,
+                            "Minimum State of Charge",
+                            system_settings_coordinator,
+                            "min_soc",
+                            None,
+                            PERCENTAGE,
+                            0,
+                            100,
+                            entity_category=EntityCategory.CONFIG,
+                            connected_device_type=SessyConnectedDeviceType.BATTERY,
+                        )
                     )
-                )
 
-        except Exception as e:
-            _LOGGER.warning(
-                f"Error setting up firmware specific settings: {e}\n{settings}"
-            )
+            except Exception as e:
+                _LOGGER.warning(
+                    f"Error setting up firmware specific settings: {e}\n{settings}"
+                )
 
     elif isinstance(device, SessyMeter):
         grid_target_coordinator = coordinators[device.get_grid_target]
@@ -181,6 +199,10 @@ async def async_setup_entry(
         )
 
     async_add_entities(numbers)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.NUMBER, map(name_unique_id_suffix, STANDARD_NUMBERS)
+        )
 
 
 class SessyNumberEntity(SessyCoordinatorEntity, NumberEntity):
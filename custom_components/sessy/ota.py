@@ -0,0 +1,388 @@
+"""Firmware update (OTA) tracking for Sessy devices"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+from time import monotonic
+from typing import Callable
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from sessypy.const import SessyOtaState, SessyOtaTarget
+from sessypy.devices import SessyDevice
+
+from .const import (
+    DOMAIN,
+    EVENT_FIRMWARE_ROLLOUT,
+    OTA_CHECK_DUE_INTERVAL,
+    OTA_INSTALL_TIMEOUT,
+    OTA_REBOOT_TIMEOUT,
+    OTA_START_GRACE,
+    OTA_STORAGE_VERSION,
+    OTA_TRACKER,
+    SCAN_INTERVAL_OTA_BUSY,
+    SCAN_INTERVAL_OTA_CHECK,
+)
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# States in which the device is still working on an install or check
+OTA_ACTIVE_STATES = (
+    SessyOtaState.CHECKING,
+    SessyOtaState.UPDATING,
+    SessyOtaState.PENDING_VERIFY,
+)
+OTA_FAILED_STATES = (
+    SessyOtaState.FAILED,
+    SessyOtaState.CHECK_FAILED,
+)
+
+
+class SessyOtaError(HomeAssistantError):
+    """Error to indicate a firmware install or update check failed"""
+
+
+async def async_get_ota_tracker(hass: HomeAssistant) -> SessyOtaTracker:
+    """Get the OTA tracker shared by all Sessy devices"""
+    domain_data = hass.data.setdefault(DOMAIN, dict())
+    tracker: SessyOtaTracker = domain_data.get(OTA_TRACKER)
+    if tracker is None:
+        tracker = SessyOtaTracker(hass)
+        domain_data[OTA_TRACKER] = tracker
+    await tracker.async_load()
+    return tracker
+
+
+def get_ota_states(ota_status: dict) -> list[SessyOtaState]:
+    """Get the OTA states of the dongle and the serial device (AC board)"""
+    return [
+        (ota_status.get(target) or dict()).get("state", SessyOtaState.DISABLED)
+        for target in ("self", "serial")
+    ]
+
+
+class SessyOtaProgress:
+    """A running firmware install or update check of a single device"""
+
+    def __init__(self, config_entry: SessyConfigEntry, action: str):
+        self.config_entry = config_entry
+        self.action = action
+        self.start = monotonic()
+        self.seen_active = False
+        self.done_since: float = None
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def finish(self, error: Exception = None):
+        if self.future.done():
+            return
+        if error is None:
+            self.future.set_result(None)
+        else:
+            self.future.set_exception(error)
+            # Do not log unretrieved exceptions if nobody awaits the result
+            self.future.exception()
+
+
+class SessyOtaTracker:
+    """Tracks firmware installs and update checks of all Sessy devices
+
+    The OTA status of a device is only polled fast while an install or check is
+    running, by refreshing its ota_status coordinator from a single shared timer.
+    Online update checks are started when a device is due, based on the last check
+    time, which is persisted so restarts do not trigger new checks.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store: Store = Store(hass, OTA_STORAGE_VERSION, f"{DOMAIN}.ota")
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+        self._entries: dict[str, SessyConfigEntry] = dict()
+        self._last_checks: dict[str, float] = dict()
+        self._active: dict[str, SessyOtaProgress] = dict()
+
+        self._unsub_poll: Callable = None
+        self._unsub_check_due: Callable = None
+        self.rollout: SessyFirmwareRollout = None
+
+    async def async_load(self):
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load()
+            if stored is not None:
+                self._last_checks = stored.get("last_checks", dict())
+            self._loaded = True
+
+    @callback
+    def async_register(self, config_entry: SessyConfigEntry) -> Callable[[], None]:
+        """Schedule update checks for a device, returns a function to unregister it"""
+        self._entries[config_entry.entry_id] = config_entry
+        if self._unsub_check_due is None:
+            self._unsub_check_due = async_track_time_interval(
+                self.hass,
+                self._async_check_due,
+                OTA_CHECK_DUE_INTERVAL,
+                name="Sessy OTA check",
+            )
+
+        @callback
+        def unregister():
+            self._entries.pop(config_entry.entry_id, None)
+            progress = self._active.pop(config_entry.entry_id, None)
+            if progress is not None:
+                progress.finish(SessyOtaError(f"{config_entry.title} was unloaded"))
+            self._async_update_poll()
+            if not self._entries and self._unsub_check_due is not None:
+                self._unsub_check_due()
+                self._unsub_check_due = None
+
+        return unregister
+
+    def is_active(self, config_entry: SessyConfigEntry) -> bool:
+        return config_entry.entry_id in self._active
+
+    async def async_install(self, config_entry: SessyConfigEntry) -> asyncio.Future:
+        """Start installing the available firmware on all targets of a device.
+
+        Returns a future which completes once the install is done, or fails."""
+        device: SessyDevice = config_entry.runtime_data.device
+        await device.install_ota(SessyOtaTarget.ALL)
+        _LOGGER.info(f"Started firmware install on {config_entry.title}")
+        return self._async_track(config_entry, "install")
+
+    async def async_check(self, config_entry: SessyConfigEntry) -> asyncio.Future:
+        """Start an online update check of a device.
+
+        Returns a future which completes once the check is done, or fails."""
+        device: SessyDevice = config_entry.runtime_data.device
+        await device.check_ota()
+        self._last_checks[device.serial_number] = dt_util.utcnow().timestamp()
+        self._store.async_delay_save(self._data_to_save)
+        return self._async_track(config_entry, "check")
+
+    def _data_to_save(self) -> dict:
+        return {"last_checks": self._last_checks}
+
+    @callback
+    def _async_track(self, config_entry: SessyConfigEntry, action: str) -> asyncio.Future:
+        progress = self._active.get(config_entry.entry_id)
+        if progress is None or progress.action != action:
+            if progress is not None:
+                progress.finish(SessyOtaError(f"{progress.action} of {config_entry.title} was superseded by {action}"))
+            progress = SessyOtaProgress(config_entry, action)
+            self._active[config_entry.entry_id] = progress
+        self._async_update_poll()
+        return progress.future
+
+    @callback
+    def _async_update_poll(self):
+        """Run the fast poll timer only while installs or checks are active"""
+        if self._active and self._unsub_poll is None:
+            self._unsub_poll = async_track_time_interval(
+                self.hass,
+                self._async_poll,
+                SCAN_INTERVAL_OTA_BUSY,
+                name="Sessy OTA progress",
+            )
+        elif not self._active and self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    async def _async_poll(self, now: datetime = None):
+        progresses = list(self._active.values())
+        await asyncio.gather(*[self._async_poll_progress(progress) for progress in progresses])
+        self._async_update_poll()
+
+    async def _async_poll_progress(self, progress: SessyOtaProgress):
+        config_entry = progress.config_entry
+        device: SessyDevice = config_entry.runtime_data.device
+        coordinator: SessyCoordinator = config_entry.runtime_data.coordinators[device.get_ota_status]
+        await coordinator.async_refresh()
+
+        elapsed = monotonic() - progress.start
+        error = None
+        done = False
+        if not coordinator.last_update_success:
+            # The device restarts while installing, keep polling until the timeout
+            pass
+        else:
+            states = get_ota_states(coordinator.raw_data)
+            if any(state in OTA_FAILED_STATES for state in states):
+                error = SessyOtaError(f"Firmware {progress.action} of {config_entry.title} failed: {', '.join(states)}")
+            elif any(state in OTA_ACTIVE_STATES for state in states):
+                progress.seen_active = True
+            elif SessyOtaState.DONE in states:
+                # Installed, keep polling until the device restarted and reports idle,
+                # so the update entity does not stay in progress until the next poll
+                progress.seen_active = True
+                if progress.done_since is None:
+                    progress.done_since = monotonic()
+            elif progress.seen_active or elapsed > OTA_START_GRACE.total_seconds():
+                done = True
+
+        if not done and error is None:
+            if progress.done_since is not None:
+                # Installed, stop waiting for the device to report idle after the restart timeout
+                done = monotonic() - progress.done_since > OTA_REBOOT_TIMEOUT.total_seconds()
+            elif elapsed > OTA_INSTALL_TIMEOUT.total_seconds():
+                error = SessyOtaError(f"Firmware {progress.action} of {config_entry.title} timed out")
+
+        if done or error is not None:
+            if self._active.get(config_entry.entry_id) is progress:
+                del self._active[config_entry.entry_id]
+            progress.finish(error)
+            if error is not None:
+                _LOGGER.warning(str(error))
+            else:
+                _LOGGER.debug(f"Firmware {progress.action} of {config_entry.title} finished")
+
+    async def _async_check_due(self, now: datetime = None):
+        """Start update checks of devices which were not checked for SCAN_INTERVAL_OTA_CHECK"""
+        timestamp = dt_util.utcnow().timestamp()
+        for config_entry in list(self._entries.values()):
+            if self.is_active(config_entry):
+                continue
+            serial_number = config_entry.runtime_data.device.serial_number
+            last_check = self._last_checks.get(serial_number, 0)
+            if timestamp - last_check < SCAN_INTERVAL_OTA_CHECK.total_seconds():
+                continue
+            try:
+                await self.async_check(config_entry)
+            except Exception as e:
+                _LOGGER.debug(f"Update check of {config_entry.title} failed: {e}")
+
+    def has_update(self, config_entry: SessyConfigEntry) -> bool:
+        """Return True if the last known OTA status of a device reports available firmware"""
+        device: SessyDevice = config_entry.runtime_data.device
+        coordinator: SessyCoordinator = config_entry.runtime_data.coordinators[device.get_ota_status]
+        return SessyOtaState.AVAILABLE in get_ota_states(coordinator.raw_data)
+
+    @callback
+    def async_start_rollout(self, config_entries: list[SessyConfigEntry], wave_size: int) -> SessyFirmwareRollout:
+        """Install firmware on a number of devices in the background, wave_size devices at a time"""
+        if self.rollout is not None:
+            raise SessyOtaError("A firmware rollout is already running")
+
+        self.rollout = SessyFirmwareRollout(self, config_entries, wave_size)
+        task = self.hass.async_create_background_task(
+            self.rollout.async_run(), "Sessy firmware rollout"
+        )
+        task.add_done_callback(self._rollout_done)
+        return self.rollout
+
+    def _rollout_done(self, task: asyncio.Task):
+        self.rollout = None
+
+
+class SessyFirmwareRollout:
+    """Installs firmware on devices in waves, halting when a device fails
+
+    A device fails if its install fails, or if it does not respond again within
+    OTA_REBOOT_TIMEOUT after the install. Progress is reported in a persistent
+    notification and as sessy_firmware_rollout events.
+    """
+
+    def __init__(self, tracker: SessyOtaTracker, config_entries: list[SessyConfigEntry], wave_size: int):
+        self.tracker = tracker
+        self.hass = tracker.hass
+        self.config_entries = config_entries
+        self.wave_size = wave_size
+        self.notification_id = f"sessy_firmware_rollout_{int(dt_util.utcnow().timestamp())}"
+
+        self.completed: list[str] = list()
+        self.skipped: list[str] = list()
+        self.failed: dict[str, str] = dict()
+
+    async def async_run(self):
+        pending = list()
+        for config_entry in self.config_entries:
+            if self.tracker.has_update(config_entry) and not self.tracker.is_active(config_entry):
+                pending.append(config_entry)
+            else:
+                self.skipped.append(config_entry.title)
+                self._fire(config_entry, "skipped")
+
+        total = len(pending)
+        for wave_start in range(0, total, self.wave_size):
+            wave = pending[wave_start : wave_start + self.wave_size]
+            self._notify(f"Installing firmware on {', '.join(entry.title for entry in wave)}.")
+            await asyncio.gather(*[self._async_install(config_entry) for config_entry in wave])
+
+            if self.failed:
+                halted = [entry.title for entry in pending[wave_start + self.wave_size :]]
+                self._notify(
+                    f"Firmware rollout halted. Failed: {self._format_failed()}."
+                    + (f" Not installed: {', '.join(halted)}." if halted else ""),
+                    "Sessy firmware rollout halted",
+                )
+                _LOGGER.warning(f"Firmware rollout halted after failures: {self.failed}")
+                return
+
+        self._notify(
+            f"Firmware installed on {len(self.completed)} devices."
+            + (f" Skipped (no update available): {', '.join(self.skipped)}." if self.skipped else ""),
+            "Sessy firmware rollout complete",
+        )
+
+    async def _async_install(self, config_entry: SessyConfigEntry):
+        self._fire(config_entry, "installing")
+        try:
+            progress = await self.tracker.async_install(config_entry)
+            await progress
+            self._fire(config_entry, "rebooting")
+            await self._async_wait_for_device(config_entry)
+        except Exception as e:
+            self.failed[config_entry.title] = str(e) or e.__class__.__name__
+            self._fire(config_entry, "failed", str(e))
+            return
+
+        self.completed.append(config_entry.title)
+        self._fire(config_entry, "done")
+
+    async def _async_wait_for_device(self, config_entry: SessyConfigEntry):
+        """Wait until the device responds again after installing firmware"""
+        device: SessyDevice = config_entry.runtime_data.device
+        coordinator: SessyCoordinator = config_entry.runtime_data.coordinators[device.get_system_info]
+        start = monotonic()
+        while monotonic() - start < OTA_REBOOT_TIMEOUT.total_seconds():
+            await asyncio.sleep(SCAN_INTERVAL_OTA_BUSY.total_seconds())
+            await coordinator.async_refresh()
+            if coordinator.last_update_success:
+                return
+        raise SessyOtaError(f"{config_entry.title} did not respond after installing firmware")
+
+    def _format_failed(self) -> str:
+        return ", ".join(f"{title} ({error})" for title, error in self.failed.items())
+
+    @callback
+    def _fire(self, config_entry: SessyConfigEntry, status: str, error: str = None):
+        self.hass.bus.async_fire(
+            EVENT_FIRMWARE_ROLLOUT,
+            {
+                "config_entry_id": config_entry.entry_id,
+                "device": config_entry.title,
+                "status": status,
+                "error": error,
+                "completed": len(self.completed),
+                "failed": len(self.failed),
+                "total": len(self.config_entries) - len(self.skipped),
+            },
+        )
+
+    @callback
+    def _notify(self, message: str, title: str = "Sessy firmware rollout"):
+        progress = f"{len(self.completed)} of {len(self.config_entries) - len(self.skipped)} devices done."
+        persistent_notification.async_create(
+            self.hass, f"{message} {progress}", title=title, notification_id=self.notification_id
+        )
@@ -0,0 +1,237 @@
+"""Incremental 15 minute peak demand (capacity tariff), fed by the P1 details coordinator"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from time import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from sessypy.const import SessyP1State
+
+from .const import (
+    DOMAIN,
+    PEAK_MONTHS,
+    PEAK_PUBLISH_INTERVAL,
+    PEAK_QUARTER_SECONDS,
+    PEAK_START_TOLERANCE,
+    PEAK_STORAGE_VERSION,
+    PEAK_TOP_N,
+)
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+
+CONSUMED_COUNTERS = ("power_consumed_tariff1", "power_consumed_tariff2")
+
+
+def _numeric(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _month(timestamp: float) -> str:
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).strftime("%Y-%m")
+
+
+class SessyPeakDemand:
+    """Quarter hour average import power and the monthly peaks, with constant cost per sample.
+
+    The running average integrates power_consumed over the current quarter. A finished
+    quarter is averaged from the consumed energy counters instead, as billed by the grid
+    operator, if they were read at the start of the quarter. Quarters that were only
+    partly observed are not ranked.
+
+    The quarter start readings and the peaks are stored, so a restart does not lose the
+    current quarter or the month."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        p1_details_coordinator: SessyCoordinator,
+    ):
+        self.hass = hass
+        self.p1_details_coordinator = p1_details_coordinator
+
+        serial_number = config_entry.runtime_data.device.serial_number.lower()
+        self._store: Store = Store(
+            hass, PEAK_STORAGE_VERSION, f"{DOMAIN}.peak_demand.{serial_number}"
+        )
+
+        # Current quarter: start, counter reading at its start, integrated energy since the first sample
+        self.quarter_start: float = None
+        self._start_wh: float = None
+        self._start_time: float = None
+        self._energy_ws: float = 0
+        self._observed: float = 0
+        self._last_sample: tuple[float, float] = None
+
+        self.last_quarter_power: float = None
+        # Top quarters of the current month as [start, power], highest first
+        self.month: str = None
+        self.top_quarters: list[list[float]] = list()
+        # Peak power per month, for the rolling average of capacity tariffs
+        self.monthly_peaks: dict[str, float] = dict()
+
+        self._listeners: list[Callable[[], None]] = list()
+        self._unsubscribers: list[Callable[[], None]] = list()
+
+    async def async_load(self):
+        stored = await self._store.async_load()
+        if stored is None:
+            return
+        self.quarter_start = stored.get("quarter_start")
+        self._start_wh = stored.get("start_wh")
+        self._start_time = stored.get("start_time")
+        self.last_quarter_power = stored.get("last_quarter_power")
+        self.month = stored.get("month")
+        self.top_quarters = stored.get("top_quarters", list())
+        self.monthly_peaks = stored.get("monthly_peaks", dict())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "quarter_start": self.quarter_start,
+            "start_wh": self._start_wh,
+            "start_time": self._start_time,
+            "last_quarter_power": self.last_quarter_power,
+            "month": self.month,
+            "top_quarters": self.top_quarters,
+            "monthly_peaks": self.monthly_peaks,
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for published peaks, sampling the P1 meter while listened to"""
+        if len(self._listeners) == 0:
+            self._async_start()
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(update_callback)
+            if len(self._listeners) == 0:
+                self._async_stop()
+
+        return remove_listener
+
+    @callback
+    def _async_start(self):
+        self._unsubscribers.append(
+            self.p1_details_coordinator.async_add_sample_listener(self.async_handle_p1_details)
+        )
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self.hass,
+                self._async_publish,
+                PEAK_PUBLISH_INTERVAL,
+                name="Sessy peak demand",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_stop(self):
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+        self._last_sample = None
+        self._store.async_delay_save(self._data_to_save)
+
+    @callback
+    def _async_publish(self, now=None):
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_handle_p1_details(self, data: dict):
+        if data.get("state") != SessyP1State.OK:
+            return
+        power = data.get("power_consumed")
+        counters = [data.get(key) for key in CONSUMED_COUNTERS]
+        consumed_wh = sum(counters) if all(_numeric(value) for value in counters) else None
+        now = time()
+
+        quarter_start = int(now // PEAK_QUARTER_SECONDS) * PEAK_QUARTER_SECONDS
+        if quarter_start != self.quarter_start:
+            self._async_next_quarter(quarter_start, now, consumed_wh)
+
+        if self._last_sample is not None:
+            # Hold the previous power until this sample
+            last_time, last_power = self._last_sample
+            elapsed = min(now - last_time, now - quarter_start)
+            if elapsed > 0:
+                self._energy_ws += last_power * elapsed
+                self._observed += elapsed
+        self._last_sample = (now, power) if _numeric(power) else None
+
+    @callback
+    def _async_next_quarter(self, quarter_start: float, now: float, consumed_wh: float | None):
+        if self.quarter_start is not None and quarter_start - self.quarter_start == PEAK_QUARTER_SECONDS:
+            power = self._quarter_power(consumed_wh)
+            if power is not None:
+                self._rank_quarter(self.quarter_start, power)
+            self.last_quarter_power = power
+        elif self.quarter_start is not None:
+            # Not sampled around the end of the last quarter, it can not be finished
+            self.last_quarter_power = None
+
+        self.quarter_start = quarter_start
+        self._start_wh = consumed_wh
+        self._start_time = now
+        self._energy_ws = 0
+        self._observed = 0
+        self._store.async_delay_save(self._data_to_save)
+        self._async_publish()
+
+    def _quarter_power(self, consumed_wh: float | None) -> float | None:
+        """Average import power of the finished quarter in W, None if it was partly observed"""
+        if self._start_time is None or self._start_time - self.quarter_start > PEAK_START_TOLERANCE:
+            return None
+        if consumed_wh is not None and self._start_wh is not None and consumed_wh >= self._start_wh:
+            return (consumed_wh - self._start_wh) * 3600 / PEAK_QUARTER_SECONDS
+        if self._observed >= PEAK_QUARTER_SECONDS - PEAK_START_TOLERANCE:
+            return self._energy_ws / self._observed
+        return None
+
+    def _rank_quarter(self, quarter_start: float, power: float):
+        month = _month(quarter_start)
+        if month != self.month:
+            self.month = month
+            self.top_quarters = list()
+
+        self.top_quarters.append([quarter_start, power])
+        self.top_quarters.sort(key=lambda quarter: quarter[1], reverse=True)
+        del self.top_quarters[PEAK_TOP_N:]
+
+        self.monthly_peaks[month] = self.top_quarters[0][1]
+        for old_month in sorted(self.monthly_peaks)[:-PEAK_MONTHS]:
+            del self.monthly_peaks[old_month]
+
+    @property
+    def quarter_average_power(self) -> float | None:
+        """Average import power in W over the observed part of the current quarter"""
+        if self._observed == 0:
+            return None
+        return self._energy_ws / self._observed
+
+    @property
+    def monthly_peak_power(self) -> float | None:
+        if self.month != _month(time()):
+            # No finished quarter yet this month
+            return 0 if self.month is not None else None
+        return self.top_quarters[0][1]
+
+    @property
+    def rolling_peak_average(self) -> float | None:
+        """Average of the monthly peaks of the last PEAK_MONTHS months"""
+        if not self.monthly_peaks:
+            return None
+        return sum(self.monthly_peaks.values()) / len(self.monthly_peaks)
+
+    def top_quarters_attribute(self) -> list[dict[str, Any]]:
+        return [
+            {"start": datetime.fromtimestamp(start, dt_util.get_default_time_zone()), "power": power}
+            for start, power in self.top_quarters
+        ]
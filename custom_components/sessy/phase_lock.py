@@ -0,0 +1,96 @@
+"""Align the polling of the P1 meter to the arrival of DSMR telegrams"""
+
+from __future__ import annotations
+
+from math import floor
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+from .const import (
+    PHASE_LOCK_EARLY_STEP,
+    PHASE_LOCK_LATE_STEP,
+    PHASE_LOCK_MAX_RETRIES,
+    PHASE_LOCK_RETRY_DELAY,
+    TELEGRAM_PERIOD_DSMR5,
+    TELEGRAM_PERIOD_LEGACY,
+)
+
+
+def telegram_period(dsmr_version: Any) -> float | None:
+    """Seconds between telegrams of a meter, 1 for DSMR 5 and 10 for older versions"""
+    try:
+        version = float(dsmr_version)
+    except (TypeError, ValueError):
+        return None
+    # Reported as 50 for DSMR 5.0, or as 5.0
+    if version >= 10:
+        version /= 10
+    return TELEGRAM_PERIOD_DSMR5 if version >= 5 else TELEGRAM_PERIOD_LEGACY
+
+
+class SessyTelegramPhaseLock:
+    """Locks the polling of the P1 details to the arrival of the DSMR telegrams.
+
+    Telegrams are told apart by their payload. A poll that finds a new telegram moves
+    the next poll slightly earlier, a poll that finds the previous telegram again was
+    too early: the phase moves later and the telegram is polled again shortly after.
+    The polls settle just after the arrival of each telegram.
+
+    Only locks when the telegram period is at least the scan interval, faster meters
+    are polled at the scan interval and are at most one telegram period stale."""
+
+    def __init__(self, scan_interval: float):
+        self.scan_interval = scan_interval
+        self.period: float = None
+
+        # Loop time of the last poll in phase, just after the arrival of a telegram
+        self._phase: float = None
+        self._last_telegram: bytes = None
+        self._retries = 0
+
+        self.telegrams = 0
+        self.duplicates = 0
+
+    @property
+    def locked(self) -> bool:
+        return (
+            self.period is not None
+            and self._phase is not None
+            and self.period >= self.scan_interval
+        )
+
+    def observe(self, data: dict, poll_time: float):
+        """Record the payload of a poll sent at loop time poll_time"""
+        self.period = telegram_period(data.get("dsmr_version"))
+        telegram = json_bytes(data)
+        is_new = telegram != self._last_telegram
+        self._last_telegram = telegram
+
+        if self._phase is None or is_new:
+            # Possibly late, poll a little earlier next time
+            self.telegrams += 1
+            self._retries = 0
+            self._phase = poll_time - PHASE_LOCK_EARLY_STEP
+        else:
+            # Too early, the telegram had not arrived yet
+            self.duplicates += 1
+            self._retries += 1
+            self._phase = poll_time + PHASE_LOCK_LATE_STEP
+
+    def next_poll(self, now: float) -> float:
+        """Loop time of the next poll"""
+        if 0 < self._retries <= PHASE_LOCK_MAX_RETRIES:
+            return now + PHASE_LOCK_RETRY_DELAY
+
+        # The first poll in phase after now, at least one period after the last
+        periods = max(1, floor((now - self._phase) / self.period) + 1)
+        return self._phase + periods * self.period
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "locked": self.locked,
+            "telegram_period": self.period,
+            "telegrams": self.telegrams,
+            "duplicates": self.duplicates,
+        }
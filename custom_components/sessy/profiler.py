@@ -0,0 +1,115 @@
+"""On-demand profiling of the Sessy update path"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+import cProfile
+import io
+import pstats
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .coordinator import SessyCoordinator
+
+
+class SessyProfiler:
+    """cProfile wrapper, only enabled around the synchronous parts of the Sessy update path
+
+    Profiling is switched on for flattening coordinator data and dispatching it to
+    the entities (including update_from_cache and state writes) only, so time spent
+    by other integrations on the event loop does not show up in the profile.
+    Time waiting for the device is not CPU time, it is reported from the
+    coordinator request metrics instead.
+    """
+
+    def __init__(self, max_ticks: int = None):
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._max_ticks = max_ticks
+        self._done = asyncio.Event()
+        self.ticks = 0
+
+    @contextmanager
+    def section(self):
+        """Profile the enclosed block. Nested sections are merged into the outer one."""
+        if self._depth > 0:
+            yield
+            return
+
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Another profiler (e.g. the profiler integration) is already active
+            yield
+            return
+
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._profile.disable()
+
+    def record_tick(self):
+        """Count a dispatch tick, completing the profile once the tick limit is reached"""
+        self.ticks += 1
+        if self._max_ticks is not None and self.ticks >= self._max_ticks:
+            self._done.set()
+
+    async def async_run(self, coordinators: list[SessyCoordinator], duration: float):
+        """Attach the profiler to the coordinators until the duration or tick limit is reached"""
+        for coordinator in coordinators:
+            coordinator.profiler = self
+        try:
+            await asyncio.wait_for(self._done.wait(), duration)
+        except TimeoutError:
+            pass
+        finally:
+            for coordinator in coordinators:
+                coordinator.profiler = None
+
+    def write(
+        self,
+        profile_path: str,
+        summary_path: str,
+        coordinators: list[SessyCoordinator],
+        top: int,
+    ):
+        """Write the raw profile and a text summary. Blocking, run in an executor."""
+        self._profile.dump_stats(profile_path)
+
+        summary = io.StringIO()
+        summary.write(f"Sessy update path profile, {self.ticks} dispatch ticks\n\n")
+
+        coordinator: SessyCoordinator
+        for coordinator in coordinators:
+            metrics = coordinator.metrics.summary()
+            summary.write(
+                f"{coordinator.name}: {metrics['requests']} requests, "
+                f"mean latency {metrics['latency_mean_ms']} ms, "
+                f"{metrics['retries']} retries, {metrics['timeouts']} timeouts\n"
+            )
+        summary.write("\n")
+
+        try:
+            stats = pstats.Stats(self._profile, stream=summary)
+        except TypeError:
+            # No profiled sections were run
+            summary.write("No samples were collected\n")
+        else:
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+        with open(summary_path, "w", encoding="utf-8") as summary_file:
+            summary_file.write(summary.getvalue())
+
+
+@contextmanager
+def profile_section(profiler: SessyProfiler | None):
+    """Profile the enclosed block if a profiler is attached"""
+    if profiler is None:
+        yield
+    else:
+        with profiler.section():
+            yield
+
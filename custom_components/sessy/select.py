@@ -3,6 +3,7 @@
 from __future__ import annotations
 from enum import Enum
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.components.select import SelectEntity
 from homeassistant.exceptions import HomeAssistantError
@@ -15,6 +16,7 @@ from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
 from .entity import SessyCoordinatorEntity
+from .metrics import track_platform_setup
 from .models import SessyConfigEntry, SessyConnectedDeviceType
 from .util import enum_to_options_list, status_string_power_strategy
 
@@ -23,6 +25,7 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+@track_platform_setup(Platform.SELECT)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
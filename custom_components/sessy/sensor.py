@@ -4,46 +4,45 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 
 from homeassistant.const import (
-    CURRENCY_EURO,
-    UnitOfPower,
-    PERCENTAGE,
-    UnitOfElectricPotential,
-    UnitOfElectricCurrent,
-    UnitOfInformation,
-    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-    UnitOfFrequency,
-    UnitOfEnergy,
-    UnitOfVolume,
+    Platform,
+    UnitOfTime,
 )
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.event import async_track_time_change
 
-from sessypy.const import SessyModbusState, SessySystemState, SessyP1State
-from sessypy.devices import SessyBattery, SessyP1Meter, SessyCTMeter
-
 from typing import Callable, Optional
 
+from .analytics import SessyBatteryAnalytics
+from .const import CONF_STATISTICS_MODE
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .costs import SessyEnergyCosts
+from .descriptions import (
+    ANALYTICS_SENSOR_DESCRIPTIONS,
+    COST_SENSOR_DESCRIPTIONS,
+    PEAK_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    SessySensorDescription,
+    SessySensorKind,
+    payload_index,
+    select_descriptions,
+)
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import to_milliseconds, track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
+from .peak import SessyPeakDemand
 from .util import (
-    divide_by_hundred_thousand,
-    enum_to_options_list,
     get_nested_key,
-    status_string_modbus,
-    status_string_p1,
-    status_string_system_state,
     transform_on_list,
-    unit_interval_to_percentage,
-    divide_by_thousand,
-    only_negative_as_positive,
-    only_positive,
 )
 
 import logging
@@ -51,6 +50,7 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+@track_platform_setup(Platform.SENSOR)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -60,880 +60,174 @@ async def async_setup_entry(
     coordinators = config_entry.runtime_data.coordinators
     sensors = []
 
-    try:
-        # Disable WiFi RSSI sensor if WiFi is not connected on discovery
-        network_status_coordinator: SessyCoordinator = coordinators[
-            device.get_network_status
-        ]
-        network_status: dict = network_status_coordinator.raw_data
-
-        if get_nested_key(network_status, "wifi_sta.rssi") is not None:
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "WiFi RSSI",
-                    network_status_coordinator,
-                    "wifi_sta.rssi",
-                    SensorDeviceClass.SIGNAL_STRENGTH,
-                    SensorStateClass.MEASUREMENT,
-                    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                )
-            )
-    except Exception as e:
-        _LOGGER.warning(f"Error setting up WiFi RSSI sensor: {e}")
-
-    for memory_type in ("internal", "external"):
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                f"{memory_type.title()} Memory Available",
-                coordinators[device.get_system_info],
-                f"{memory_type}_mem_available",
-                SensorDeviceClass.DATA_SIZE,
-                SensorStateClass.MEASUREMENT,
-                UnitOfInformation.BYTES,
-                entity_category=EntityCategory.DIAGNOSTIC,
-                suggested_unit_of_measurement=UnitOfInformation.KILOBYTES,
-            )
-        )
-
-    if isinstance(device, SessyBattery):
-        # Dynamic Schedule
-        try:
-            # Disable sensors if no schedule is present on discovery
-            dynamic_schedule_coordinator: SessyCoordinator = coordinators.get(
-                device.get_dynamic_schedule, None
-            )
-            if dynamic_schedule_coordinator is not None:
-                dynamic_schedule: dict = dynamic_schedule_coordinator.raw_data
-
-                if dynamic_schedule.get("dynamic_schedule", None) is not None:
-                    sensors.append(
-                        SessyScheduleSensor(
-                            hass,
-                            config_entry,
-                            "Power Schedule",
-                            dynamic_schedule_coordinator,
-                            "dynamic_schedule",
-                            SensorDeviceClass.POWER,
-                            SensorStateClass.MEASUREMENT,
-                            UnitOfPower.WATT,
-                            schedule_key="power",
-                        )
-                    )
-
-                if dynamic_schedule.get("energy_prices", None) is not None:
-                    sensors.append(
-                        SessyScheduleSensor(
-                            hass,
-                            config_entry,
-                            "Energy Price",
-                            dynamic_schedule_coordinator,
-                            "energy_prices",
-                            None,
-                            SensorStateClass.MEASUREMENT,
-                            f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
-                            schedule_key="price",
-                            transform_function=divide_by_hundred_thousand,
-                        )
-                    )
-            else:
-                # Fallback to legacy schedule if dynamic schedule is not supported
-                # TODO remove this when legacy schedule is no longer supported
-
-                dynamic_schedule_coordinator: SessyCoordinator = coordinators.get(
-                    device.get_dynamic_schedule_legacy, None
-                )
-                if dynamic_schedule_coordinator is not None:
-                    dynamic_schedule: dict = dynamic_schedule_coordinator.raw_data
-
-                    if dynamic_schedule.get("power_strategy", None) is not None:
-                        sensors.append(
-                            SessyLegacyScheduleSensor(
-                                hass,
-                                config_entry,
-                                "Power Schedule",
-                                dynamic_schedule_coordinator,
-                                "power_strategy",
-                                SensorDeviceClass.POWER,
-                                SensorStateClass.MEASUREMENT,
-                                UnitOfPower.WATT,
-                                schedule_key="power",
-                            )
-                        )
-
-                    if dynamic_schedule.get("energy_prices", None) is not None:
-                        sensors.append(
-                            SessyLegacyScheduleSensor(
-                                hass,
-                                config_entry,
-                                "Energy Price",
-                                dynamic_schedule_coordinator,
-                                "energy_prices",
-                                None,
-                                SensorStateClass.MEASUREMENT,
-                                f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}",
-                                schedule_key="price",
-                                transform_function=divide_by_hundred_thousand,
-                            )
-                        )
-
-        except Exception as e:
-            _LOGGER.warning(f"Error setting up schedule sensors: {e}")
+    # Energy counters are written as hourly statistics instead, don't enable their entities by default
+    statistics_mode = config_entry.options.get(CONF_STATISTICS_MODE, False)
+    # Sensors outside the entity profile are not created at all
+    profile = config_entry.runtime_data.entity_profile
 
-        # Power Status
+    coordinator: SessyCoordinator
+    for coordinator in coordinators.values():
         try:
-            power_status_coordinator: SessyCoordinator = coordinators[
-                device.get_power_status
-            ]
-            power_status: dict = power_status_coordinator.raw_data
-
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "System State",
-                    power_status_coordinator,
-                    "sessy.system_state",
-                    SensorDeviceClass.ENUM,
-                    translation_key="battery_system_state",
-                    transform_function=status_string_system_state,
-                    options=enum_to_options_list(
-                        SessySystemState, status_string_system_state
-                    ),
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "System State Details",
-                    power_status_coordinator,
-                    "sessy.system_state_details",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "State of Charge",
-                    power_status_coordinator,
-                    "sessy.state_of_charge",
-                    SensorDeviceClass.BATTERY,
-                    SensorStateClass.MEASUREMENT,
-                    PERCENTAGE,
-                    transform_function=unit_interval_to_percentage,
-                    precision=1,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "Power",
-                    power_status_coordinator,
-                    "sessy.power",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "Charge Power",
-                    power_status_coordinator,
-                    "sessy.power",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    transform_function=only_negative_as_positive,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "Discharge Power",
-                    power_status_coordinator,
-                    "sessy.power",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    transform_function=only_positive,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "Frequency",
-                    power_status_coordinator,
-                    "sessy.frequency",
-                    SensorDeviceClass.FREQUENCY,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfFrequency.HERTZ,
-                    transform_function=divide_by_thousand,
-                    precision=3,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-
-            if get_nested_key(power_status, "sessy.inverter_current_ma") is not None:
+            # Walk the payload once to check which optional keys the device supports
+            index = payload_index(coordinator.raw_data)
+            for description in select_descriptions(
+                SENSOR_DESCRIPTIONS, coordinator.name, device, index, profile
+            ):
                 sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Inverter Current",
-                        power_status_coordinator,
-                        "sessy.inverter_current_ma",
-                        SensorDeviceClass.CURRENT,
-                        SensorStateClass.MEASUREMENT,
-                        UnitOfElectricCurrent.MILLIAMPERE,
-                        suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
+                    create_sensor(
+                        hass, config_entry, coordinator, description, index, statistics_mode
                     )
                 )
-
-            if get_nested_key(power_status, "sessy.pack_voltage") is not None:
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Pack Voltage",
-                        power_status_coordinator,
-                        "sessy.pack_voltage",
-                        SensorDeviceClass.VOLTAGE,
-                        SensorStateClass.MEASUREMENT,
-                        UnitOfElectricPotential.MILLIVOLT,
-                        suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
-                    )
-                )
-
-            if get_nested_key(power_status, "sessy.external_power") is not None:
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "External Power",
-                        power_status_coordinator,
-                        "sessy.external_power",
-                        SensorDeviceClass.POWER,
-                        SensorStateClass.MEASUREMENT,
-                        UnitOfPower.WATT,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
-                    )
-                )
-
         except Exception as e:
-            _LOGGER.warning(f"Error setting up power status sensors: {e}")
-
-        # Sessy Energy sensors
-        try:
-            # Fetch API content to check compatibility
-            energy_status_coordinator: SessyCoordinator = coordinators[
-                device.get_energy_status
-            ]
-            energy_status: dict = energy_status_coordinator.raw_data
-            if energy_status is not None:
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Charged Energy",
-                        energy_status_coordinator,
-                        "sessy_energy.import_wh",
-                        SensorDeviceClass.ENERGY,
-                        SensorStateClass.TOTAL_INCREASING,
-                        UnitOfEnergy.WATT_HOUR,
-                        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
-                    )
-                )
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Discharged Energy",
-                        energy_status_coordinator,
-                        "sessy_energy.export_wh",
-                        SensorDeviceClass.ENERGY,
-                        SensorStateClass.TOTAL_INCREASING,
-                        UnitOfEnergy.WATT_HOUR,
-                        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        connected_device_type=SessyConnectedDeviceType.BATTERY,
-                    )
-                )
-        except Exception as e:
-            _LOGGER.warning(f"Error setting up battery energy sensors: {e}")
-
-        for phase_id in range(1, 4):
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Renewable Energy Phase {phase_id} Voltage",
-                    power_status_coordinator,
-                    f"renewable_energy_phase{phase_id}.voltage_rms",
-                    SensorDeviceClass.VOLTAGE,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricPotential.MILLIVOLT,
-                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Renewable Energy Phase {phase_id} Current",
-                    power_status_coordinator,
-                    f"renewable_energy_phase{phase_id}.current_rms",
-                    SensorDeviceClass.CURRENT,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricCurrent.MILLIAMPERE,
-                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Renewable Energy Phase {phase_id} Power",
-                    power_status_coordinator,
-                    f"renewable_energy_phase{phase_id}.power",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    connected_device_type=SessyConnectedDeviceType.BATTERY,
-                )
-            )
-
-            # Metered phase energy sensors
-            try:
-                if energy_status is not None:
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Renewable Energy Phase {phase_id} Imported Energy",
-                            energy_status_coordinator,
-                            f"energy_phase{phase_id}.import_wh",
-                            SensorDeviceClass.ENERGY,
-                            SensorStateClass.TOTAL_INCREASING,
-                            UnitOfEnergy.WATT_HOUR,
-                            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                            connected_device_type=SessyConnectedDeviceType.BATTERY,
-                        )
-                    )
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Renewable Energy Phase {phase_id} Exported Energy",
-                            energy_status_coordinator,
-                            f"energy_phase{phase_id}.export_wh",
-                            SensorDeviceClass.ENERGY,
-                            SensorStateClass.TOTAL_INCREASING,
-                            UnitOfEnergy.WATT_HOUR,
-                            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                            connected_device_type=SessyConnectedDeviceType.BATTERY,
-                        )
-                    )
-            except Exception as e:
-                _LOGGER.warning(
-                    f"Error setting up battery metered phase energy sensors: {e}"
-                )
-
-    elif isinstance(device, SessyP1Meter):
-        p1_details_coordinator: SessyCoordinator = coordinators[device.get_p1_details]
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Status",
-                p1_details_coordinator,
-                "state",
-                SensorDeviceClass.ENUM,
-                entity_category=EntityCategory.DIAGNOSTIC,
-                translation_key="p1_state",
-                transform_function=status_string_p1,
-                options=enum_to_options_list(SessyP1State, status_string_p1),
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-                unique_id_suffix="sensor-P1Status",
-            )
-        )
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Tariff",
-                p1_details_coordinator,
-                "tariff_indicator",
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-            )
+            _LOGGER.warning(f"Error setting up {coordinator.endpoint_name} sensors: {e}")
+
+    # Battery analytics, sampling the coordinators only while a sensor is enabled
+    power_status_coordinator = coordinators.get(getattr(device, "get_power_status", None))
+    analytics_descriptions = [
+        description
+        for description in ANALYTICS_SENSOR_DESCRIPTIONS
+        if profile.includes(description.profile)
+    ]
+    if power_status_coordinator is not None and analytics_descriptions:
+        analytics = SessyBatteryAnalytics(
+            hass,
+            power_status_coordinator,
+            coordinators.get(getattr(device, "get_energy_status", None)),
         )
+        config_entry.runtime_data.analytics = analytics
+        for description in analytics_descriptions:
+            sensors.append(SessyAnalyticsSensor(hass, config_entry, analytics, description))
+
+    # Energy costs, charging the energy counters at the energy prices while a sensor is enabled
+    cost_descriptions = [
+        description
+        for description in COST_SENSOR_DESCRIPTIONS
+        if profile.includes(description.profile) and isinstance(device, description.device_types)
+    ]
+    if cost_descriptions:
+        costs = SessyEnergyCosts(hass, config_entry)
+        await costs.async_load()
+        config_entry.runtime_data.costs = costs
+        for description in cost_descriptions:
+            sensors.append(SessyCostSensor(hass, config_entry, costs, description))
+
+    # Quarter hour peak demand, sampling the P1 meter only while a sensor is enabled
+    p1_details_coordinator = coordinators.get(getattr(device, "get_p1_details", None))
+    peak_descriptions = [
+        description
+        for description in PEAK_SENSOR_DESCRIPTIONS
+        if profile.includes(description.profile)
+    ]
+    if p1_details_coordinator is not None and peak_descriptions:
+        peak_demand = SessyPeakDemand(hass, config_entry, p1_details_coordinator)
+        await peak_demand.async_load()
+        config_entry.runtime_data.peak_demand = peak_demand
+        for description in peak_descriptions:
+            sensors.append(SessyPeakDemandSensor(hass, config_entry, peak_demand, description))
+
+    # Polling performance diagnostics, disabled by default
+    if profile.includes(SessyEntityProfile.FULL):
+        for coordinator in coordinators.values():
+            sensors.append(SessyCoordinatorMetricsSensor(hass, config_entry, coordinator))
+        sensors.append(SessyMetricsSummarySensor(hass, config_entry))
 
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Total Power",
-                p1_details_coordinator,
-                "power_total",
-                SensorDeviceClass.POWER,
-                SensorStateClass.MEASUREMENT,
-                UnitOfPower.WATT,
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-                unique_id_suffix="sensor-P1Power",
-            )
-        )
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Total Consuming Power",
-                p1_details_coordinator,
-                "power_consumed",
-                SensorDeviceClass.POWER,
-                SensorStateClass.MEASUREMENT,
-                UnitOfPower.WATT,
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-                unique_id_suffix="sensor-P1ConsumingPower",
-            )
-        )
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Total Producing Power",
-                p1_details_coordinator,
-                "power_produced",
-                SensorDeviceClass.POWER,
-                SensorStateClass.MEASUREMENT,
-                UnitOfPower.WATT,
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-                unique_id_suffix="sensor-P1ProducingPower",
-            )
-        )
-        try:
-            p1_details: dict = p1_details_coordinator.raw_data
-            gas_meter_present = p1_details.get("gas_meter_value", 0) != 0
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    "Gas Consumption",
-                    p1_details_coordinator,
-                    "gas_meter_value",
-                    SensorDeviceClass.GAS,
-                    SensorStateClass.TOTAL,
-                    UnitOfVolume.CUBIC_METERS,
-                    transform_function=divide_by_thousand,
-                    precision=3,
-                    enabled_default=gas_meter_present,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_GAS_METER,
-                    unique_id_suffix="sensor-GasConsumption",
-                )
-            )
-        except Exception as e:
-            _LOGGER.warning(f"Error setting up gas meter: {e}")
-
-        for phase_id in range(1, 4):
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Voltage",
-                    p1_details_coordinator,
-                    f"voltage_l{phase_id}",
-                    SensorDeviceClass.VOLTAGE,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricPotential.MILLIVOLT,
-                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Current",
-                    p1_details_coordinator,
-                    f"current_l{phase_id}",
-                    SensorDeviceClass.CURRENT,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricCurrent.MILLIAMPERE,
-                    precision=0,
-                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Consuming Power",
-                    p1_details_coordinator,
-                    f"power_consumed_l{phase_id}",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Producing Power",
-                    p1_details_coordinator,
-                    f"power_produced_l{phase_id}",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
+    async_add_entities(sensors)
+    async_remove_excluded_entities(
+        hass, config_entry, Platform.SENSOR, excluded_unique_id_suffixes(config_entry)
+    )
 
-        for tariff_id in range(1, 3):
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Tariff {tariff_id} Consumed Energy",
-                    p1_details_coordinator,
-                    f"power_consumed_tariff{tariff_id}",
-                    SensorDeviceClass.ENERGY,
-                    SensorStateClass.TOTAL,
-                    UnitOfEnergy.WATT_HOUR,
-                    suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Tariff {tariff_id} Produced Energy",
-                    p1_details_coordinator,
-                    f"power_produced_tariff{tariff_id}",
-                    SensorDeviceClass.ENERGY,
-                    SensorStateClass.TOTAL,
-                    UnitOfEnergy.WATT_HOUR,
-                    suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                    availability_key="state",
-                    availability_test_value=SessyP1State.OK,
-                    connected_device_type=SessyConnectedDeviceType.P1_METER,
-                )
-            )
 
-        # Combine tariff 1 and 2 energy into total energy sensors
-        sensors.append(
-            SessyCombinedSensor(
-                hass,
-                config_entry,
-                "Total Consumed Energy",
-                p1_details_coordinator,
-                ["power_consumed_tariff1", "power_consumed_tariff2"],
-                SensorDeviceClass.ENERGY,
-                SensorStateClass.TOTAL,
-                UnitOfEnergy.WATT_HOUR,
-                suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-            )
-        )
-        sensors.append(
-            SessyCombinedSensor(
-                hass,
-                config_entry,
-                "Total Produced Energy",
-                p1_details_coordinator,
-                ["power_produced_tariff1", "power_produced_tariff2"],
-                SensorDeviceClass.ENERGY,
-                SensorStateClass.TOTAL,
-                UnitOfEnergy.WATT_HOUR,
-                suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                availability_key="state",
-                availability_test_value=SessyP1State.OK,
-                connected_device_type=SessyConnectedDeviceType.P1_METER,
-            )
+def excluded_unique_id_suffixes(config_entry: SessyConfigEntry) -> set[str]:
+    """Unique id suffixes of the sensors of the device outside the entity profile"""
+    device = config_entry.runtime_data.device
+    profile = config_entry.runtime_data.entity_profile
+    excluded, included = set(), set()
+
+    for descriptions in SENSOR_DESCRIPTIONS.values():
+        for description in descriptions:
+            if description.device_types and not isinstance(device, description.device_types):
+                continue
+            unique_id_suffix = description.unique_id_suffix or name_unique_id_suffix(
+                description.name
+            )
+            (included if profile.includes(description.profile) else excluded).add(unique_id_suffix)
+
+    for description in (
+        *ANALYTICS_SENSOR_DESCRIPTIONS,
+        *COST_SENSOR_DESCRIPTIONS,
+        *PEAK_SENSOR_DESCRIPTIONS,
+    ):
+        unique_id_suffix = name_unique_id_suffix(description.name)
+        (included if profile.includes(description.profile) else excluded).add(unique_id_suffix)
+
+    if not profile.includes(SessyEntityProfile.FULL):
+        for coordinator in config_entry.runtime_data.coordinators.values():
+            excluded.add(name_unique_id_suffix(f"{coordinator.endpoint_name} Latency"))
+        excluded.add(name_unique_id_suffix("Polling Summary"))
+
+    # A sensor of another endpoint can share the name of an excluded sensor
+    return excluded - included
+
+
+def create_sensor(
+    hass: HomeAssistant,
+    config_entry: SessyConfigEntry,
+    coordinator: SessyCoordinator,
+    description: SessySensorDescription,
+    index: dict,
+    statistics_mode: bool,
+) -> SessySensor:
+    """Create the sensor entity for a description"""
+    enabled_default = True
+    if description.energy_counter:
+        enabled_default = not statistics_mode
+    if description.enabled_key is not None:
+        enabled_default = index.get(description.enabled_key, 0) != 0
+
+    if description.kind in (SessySensorKind.SCHEDULE, SessySensorKind.LEGACY_SCHEDULE):
+        sensor_class = (
+            SessyScheduleSensor
+            if description.kind == SessySensorKind.SCHEDULE
+            else SessyLegacyScheduleSensor
         )
-
-        # ModBus entities
-        modbus_coordinator: SessyCoordinator = coordinators.get(
-            device.get_modbus_details, None
+        return sensor_class(
+            hass,
+            config_entry,
+            description.name,
+            coordinator,
+            description.data_key,
+            description.device_class,
+            description.state_class,
+            description.unit_of_measurement,
+            transform_function=description.transform_function,
+            schedule_key=description.schedule_key,
+            precision=description.precision,
+            enabled_default=enabled_default,
         )
-        if modbus_coordinator is not None:
-            try:
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Total Power",
-                        modbus_coordinator,
-                        "total_power",
-                        SensorDeviceClass.POWER,
-                        SensorStateClass.MEASUREMENT,
-                        UnitOfPower.WATT,
-                        availability_key="state",
-                        availability_test_value="MODBUS_OK",
-                        connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                        unique_id_suffix="sensor-ModbusTotalPower",
-                    )
-                )
-
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Total Imported Energy",
-                        modbus_coordinator,
-                        "total_import",
-                        SensorDeviceClass.ENERGY,
-                        SensorStateClass.TOTAL_INCREASING,
-                        UnitOfEnergy.WATT_HOUR,
-                        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        availability_key="state",
-                        availability_test_value="MODBUS_OK",
-                        connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                        unique_id_suffix="sensor-ModbusTotalImportedEnergy",
-                    )
-                )
-
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Total Exported Energy",
-                        modbus_coordinator,
-                        "total_export",
-                        SensorDeviceClass.ENERGY,
-                        SensorStateClass.TOTAL_INCREASING,
-                        UnitOfEnergy.WATT_HOUR,
-                        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        availability_key="state",
-                        availability_test_value="MODBUS_OK",
-                        connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                        unique_id_suffix="sensor-ModbusTotalExportedEnergy",
-                    )
-                )
-
-                for phase_id in range(1, 4):
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Phase {phase_id} Voltage",
-                            modbus_coordinator,
-                            f"phase_{phase_id}.voltage",
-                            SensorDeviceClass.VOLTAGE,
-                            SensorStateClass.MEASUREMENT,
-                            UnitOfElectricPotential.MILLIVOLT,
-                            suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                            availability_key="state",
-                            availability_test_value="MODBUS_OK",
-                            connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                            unique_id_suffix=f"sensor-ModbusPhase{phase_id}Voltage",
-                        )
-                    )
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Phase {phase_id} Current",
-                            modbus_coordinator,
-                            f"phase_{phase_id}.current",
-                            SensorDeviceClass.CURRENT,
-                            SensorStateClass.MEASUREMENT,
-                            UnitOfElectricCurrent.MILLIAMPERE,
-                            suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                            availability_key="state",
-                            availability_test_value="MODBUS_OK",
-                            connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                            unique_id_suffix=f"sensor-ModbusPhase{phase_id}Current",
-                        )
-                    )
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Phase {phase_id} Power",
-                            modbus_coordinator,
-                            f"phase_{phase_id}.power",
-                            SensorDeviceClass.POWER,
-                            SensorStateClass.MEASUREMENT,
-                            UnitOfPower.WATT,
-                            availability_key="state",
-                            availability_test_value="MODBUS_OK",
-                            connected_device_type=SessyConnectedDeviceType.MODBUS_METER,
-                            unique_id_suffix=f"sensor-ModbusPhase{phase_id}Power",
-                        )
-                    )
-
-                # Diagnostic fields
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Device Type",
-                        modbus_coordinator,
-                        "device_type",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        unique_id_suffix="sensor-ModbusDeviceType",
-                    )
-                )
-                sensors.append(
-                    SessySensor(
-                        hass,
-                        config_entry,
-                        "Status",
-                        modbus_coordinator,
-                        "state",
-                        SensorDeviceClass.ENUM,
-                        translation_key="modbus_state",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        transform_function=status_string_modbus,
-                        options=enum_to_options_list(
-                            SessyModbusState, status_string_modbus
-                        ),
-                        unique_id_suffix="sensor-ModbusStatus",
-                    )
-                )
 
-            except Exception as e:
-                _LOGGER.warning(f"Error setting up modbus sensors: {e}")
-
-    elif isinstance(device, SessyCTMeter):
-        ct_details_coordinator: SessyCoordinator = coordinators[device.get_ct_details]
-        sensors.append(
-            SessySensor(
-                hass,
-                config_entry,
-                "Total Power",
-                ct_details_coordinator,
-                "total_power",
-                SensorDeviceClass.POWER,
-                SensorStateClass.MEASUREMENT,
-                UnitOfPower.WATT,
-            )
+    kwargs = dict(
+        device_class=description.device_class,
+        state_class=description.state_class,
+        unit_of_measurement=description.unit_of_measurement,
+        transform_function=description.transform_function,
+        translation_key=description.translation_key,
+        options=description.options,
+        entity_category=description.entity_category,
+        precision=description.precision,
+        suggested_unit_of_measurement=description.suggested_unit_of_measurement,
+        enabled_default=enabled_default,
+        availability_key=description.availability_key,
+        availability_test_value=description.availability_test_value,
+        connected_device_type=description.connected_device_type,
+        unique_id_suffix=description.unique_id_suffix,
+    )
+    if description.kind == SessySensorKind.COMBINED:
+        return SessyCombinedSensor(
+            hass, config_entry, description.name, coordinator, list(description.data_keys), **kwargs
         )
-        for phase_id in range(1, 4):
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Voltage",
-                    ct_details_coordinator,
-                    f"voltage_l{phase_id}",
-                    SensorDeviceClass.VOLTAGE,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricPotential.MILLIVOLT,
-                    precision=3,
-                    suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Current",
-                    ct_details_coordinator,
-                    f"current_l{phase_id}",
-                    SensorDeviceClass.CURRENT,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfElectricCurrent.MILLIAMPERE,
-                    precision=3,
-                    suggested_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                )
-            )
-            sensors.append(
-                SessySensor(
-                    hass,
-                    config_entry,
-                    f"Phase {phase_id} Power",
-                    ct_details_coordinator,
-                    f"power_l{phase_id}",
-                    SensorDeviceClass.POWER,
-                    SensorStateClass.MEASUREMENT,
-                    UnitOfPower.WATT,
-                )
-            )
-
-            # Metered phase energy sensors
-            try:
-                # Fetch API content to check compatibility
-                energy_status_coordinator: SessyCoordinator = coordinators[
-                    device.get_energy_status
-                ]
-                energy_status: dict = energy_status_coordinator.raw_data
-                if energy_status is not None:
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Phase {phase_id} Imported Energy",
-                            energy_status_coordinator,
-                            f"energy_phase{phase_id}.import_wh",
-                            SensorDeviceClass.ENERGY,
-                            SensorStateClass.TOTAL_INCREASING,
-                            UnitOfEnergy.WATT_HOUR,
-                            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        )
-                    )
-                    sensors.append(
-                        SessySensor(
-                            hass,
-                            config_entry,
-                            f"Phase {phase_id} Exported Energy",
-                            energy_status_coordinator,
-                            f"energy_phase{phase_id}.export_wh",
-                            SensorDeviceClass.ENERGY,
-                            SensorStateClass.TOTAL_INCREASING,
-                            UnitOfEnergy.WATT_HOUR,
-                            suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                        )
-                    )
-            except Exception as e:
-                _LOGGER.warning(f"Error setting up CT meter energy sensors: {e}")
-
-    async_add_entities(sensors)
+    return SessySensor(
+        hass, config_entry, description.name, coordinator, description.data_key, **kwargs
+    )
 
 
 class SessySensor(SessyCoordinatorEntity, SensorEntity):
@@ -985,8 +279,22 @@ class SessySensor(SessyCoordinatorEntity, SensorEntity):
 
         self._attr_entity_registry_enabled_default = enabled_default
 
+        # Publish the time-weighted mean of fast samples, if the coordinator samples
+        self.context.aggregate = state_class == SensorStateClass.MEASUREMENT
+
     def update_from_cache(self):
-        self._attr_native_value = self.cache_value
+        window = self.coordinator.window_stats.get(self.context)
+        if window is None or not self._attr_available:
+            self._attr_native_value = self.cache_value
+            self._attr_extra_state_attributes = None
+            return
+
+        mean, minimum, maximum = window
+        self._attr_native_value = round(mean, 3)
+        self._attr_extra_state_attributes = {
+            "minimum": minimum,
+            "maximum": maximum,
+        }
 
 
 class SessyCombinedSensor(SessySensor):
@@ -1229,3 +537,146 @@ class SessyLegacyScheduleSensor(SessySensor):
                     continue
 
         return None
+
+
+class SessyAnalyticsSensor(SensorEntity):
+    """Derived battery value, published by SessyBatteryAnalytics at a fixed rate"""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        analytics: SessyBatteryAnalytics | SessyEnergyCosts | SessyPeakDemand,
+        description: SessySensorDescription,
+    ):
+        self.hass = hass
+        self.config_entry = config_entry
+        self.analytics = analytics
+        self.data_key = description.data_key
+
+        device = config_entry.runtime_data.device
+        self._attr_name = description.name
+        self._attr_unique_id = (
+            f"sessy-{device.serial_number}-sensor-{description.name.replace(' ', '')}".lower()
+        )
+        self._attr_device_info = config_entry.runtime_data.device_info.get(
+            description.connected_device_type,
+            config_entry.runtime_data.device_info.get(SessyConnectedDeviceType.SELF),
+        )
+        self._attr_device_class = description.device_class
+        self._attr_state_class = description.state_class
+        self._attr_native_unit_of_measurement = description.unit_of_measurement
+        self._attr_suggested_display_precision = description.precision
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self.analytics.async_add_listener(self._handle_analytics_update))
+
+    @callback
+    def _handle_analytics_update(self):
+        self._attr_native_value = getattr(self.analytics, self.data_key)
+        self.async_write_ha_state()
+
+
+class SessyCostSensor(SessyAnalyticsSensor):
+    """Running energy cost, published by SessyEnergyCosts from its stored accounts"""
+
+    async def async_added_to_hass(self):
+        self._attr_native_value = getattr(self.analytics, self.data_key)
+        await super().async_added_to_hass()
+
+
+class SessyPeakDemandSensor(SessyAnalyticsSensor):
+    """Quarter hour peak demand, published by SessyPeakDemand"""
+
+    @callback
+    def _handle_analytics_update(self):
+        if self.data_key == "monthly_peak_power":
+            self._attr_extra_state_attributes = {
+                "top_quarters": self.analytics.top_quarters_attribute(),
+            }
+        elif self.data_key == "rolling_peak_average":
+            self._attr_extra_state_attributes = {
+                "monthly_peaks": dict(self.analytics.monthly_peaks),
+            }
+        super()._handle_analytics_update()
+
+
+class SessyMetricsSensor(SensorEntity):
+    """Diagnostic sensor reporting polling performance, updated by polling the in-memory metrics"""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        name: str,
+        unique_id_suffix: str,
+    ):
+        self.hass = hass
+        self.config_entry = config_entry
+
+        device = config_entry.runtime_data.device
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"sessy-{device.serial_number}-{unique_id_suffix}".lower()
+        )
+        self._attr_device_info = config_entry.runtime_data.device_info.get(
+            SessyConnectedDeviceType.SELF
+        )
+
+
+class SessyCoordinatorMetricsSensor(SessyMetricsSensor):
+    """Latency of the last request to a coordinator endpoint, with all metrics as attributes"""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        coordinator: SessyCoordinator,
+    ):
+        super().__init__(
+            hass,
+            config_entry,
+            f"{coordinator.endpoint_name} Latency",
+            f"sensor-{coordinator.endpoint_name.replace(' ', '')}Latency",
+        )
+        self.coordinator = coordinator
+
+    async def async_update(self):
+        metrics = self.coordinator.metrics
+        self._attr_native_value = to_milliseconds(metrics.latency_last)
+        self._attr_extra_state_attributes = metrics.as_dict()
+
+
+class SessyMetricsSummarySensor(SessyMetricsSensor):
+    """Total number of requests to the device, with a per-endpoint summary as attributes"""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, hass: HomeAssistant, config_entry: SessyConfigEntry):
+        super().__init__(
+            hass, config_entry, "Polling Summary", "sensor-PollingSummary"
+        )
+
+    async def async_update(self):
+        coordinators: dict[Callable, SessyCoordinator] = (
+            self.config_entry.runtime_data.coordinators
+        )
+        self._attr_native_value = sum(
+            coordinator.metrics.requests for coordinator in coordinators.values()
+        )
+        self._attr_extra_state_attributes = {
+            coordinator.name: coordinator.metrics.summary()
+            for coordinator in coordinators.values()
+        }
@@ -0,0 +1,407 @@
+"""Services for the Sessy integration"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from time import time
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_FIELDS,
+    ATTR_ENDPOINT,
+    ATTR_INTERVAL,
+    ATTR_MAX_AGE,
+    ATTR_RESOLUTION,
+    ATTR_START,
+    ATTR_TICKS,
+    ATTR_TOP,
+    ATTR_WAVE_SIZE,
+    DEFAULT_FETCH_MAX_AGE,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_TOP,
+    DEFAULT_RECENT_DURATION,
+    DEFAULT_ROLLOUT_WAVE_SIZE,
+    DEFAULT_TURBO_DURATION,
+    DEFAULT_TURBO_INTERVAL,
+    DOMAIN,
+    SERVICE_FETCH,
+    SERVICE_GET_RECENT,
+    SERVICE_INSTALL_FIRMWARE,
+    SERVICE_PROFILE,
+    SERVICE_QUERY_ARCHIVE,
+    SERVICE_TURBO,
+    TURBO_MAX_DURATION,
+    TURBO_MAX_INTERVAL,
+    TURBO_MIN_INTERVAL,
+)
+from .archive import SessyArchive
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .ota import async_get_ota_tracker
+from .profiler import SessyProfiler
+from .telemetry import SessyTelemetryBuffer
+from .turbo import SessyTurbo
+from .util import get_nested_key
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_TICKS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+SERVICE_GET_RECENT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_RECENT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=86400)
+        ),
+        vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_RESOLUTION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+SERVICE_QUERY_ARCHIVE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_INSTALL_FIRMWARE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_WAVE_SIZE, default=DEFAULT_ROLLOUT_WAVE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+    }
+)
+
+SERVICE_FETCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ENDPOINT): cv.string,
+        vol.Optional(ATTR_MAX_AGE, default=DEFAULT_FETCH_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=86400)
+        ),
+        vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_TURBO_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_TURBO_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=TURBO_MIN_INTERVAL, max=TURBO_MAX_INTERVAL)
+        ),
+        # 0 stops a running turbo mode
+        vol.Optional(ATTR_DURATION, default=DEFAULT_TURBO_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=TURBO_MAX_DURATION)
+        ),
+    }
+)
+
+
+def get_loaded_config_entry(hass: HomeAssistant, entry_id: str) -> SessyConfigEntry:
+    """Get a loaded Sessy config entry by id, raising a validation error otherwise"""
+    config_entry = hass.config_entries.async_get_entry(entry_id)
+    if config_entry is None or config_entry.domain != DOMAIN:
+        raise ServiceValidationError(f"Config entry {entry_id} is not a Sessy device")
+    if config_entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Sessy device {config_entry.title} is not loaded")
+    return config_entry
+
+
+def get_config_entry_ids(hass: HomeAssistant, device_ids: list[str]) -> list[str]:
+    """Get the Sessy config entry ids of devices, in order and without duplicates"""
+    device_registry = dr.async_get(hass)
+    entry_ids = dict()
+    for device_id in device_ids:
+        device = device_registry.async_get(device_id)
+        if device is None:
+            raise ServiceValidationError(f"Device {device_id} does not exist")
+        for entry_id in device.config_entries:
+            config_entry = hass.config_entries.async_get_entry(entry_id)
+            if config_entry is not None and config_entry.domain == DOMAIN:
+                entry_ids[entry_id] = None
+                break
+        else:
+            raise ServiceValidationError(f"Device {device.name} is not a Sessy device")
+    return list(entry_ids)
+
+
+async def async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the update path of a Sessy device for a number of seconds or ticks, in the background"""
+    config_entry = get_loaded_config_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    serial_number = config_entry.runtime_data.device.serial_number
+
+    start_time = datetime.now().strftime("%Y%m%d%H%M%S")
+    notification_id = f"sessy_profile_{serial_number}_{start_time}"
+    profile_path = hass.config.path(f"{notification_id}.prof")
+    summary_path = hass.config.path(f"{notification_id}.txt")
+    persistent_notification.async_create(
+        hass,
+        f"Profiling {config_entry.title}. This notification will be updated when it is complete.",
+        title="Sessy profile started",
+        notification_id=notification_id,
+    )
+
+    config_entry.async_create_background_task(
+        hass,
+        _async_run_profile(
+            hass,
+            config_entry,
+            SessyProfiler(call.data.get(ATTR_TICKS)),
+            call.data[ATTR_DURATION],
+            call.data[ATTR_TOP],
+            notification_id,
+            profile_path,
+            summary_path,
+        ),
+        f"{config_entry.title} profile",
+    )
+
+    return {
+        "profile": profile_path,
+        "summary": summary_path,
+    }
+
+
+async def _async_run_profile(
+    hass: HomeAssistant,
+    config_entry: SessyConfigEntry,
+    profiler: SessyProfiler,
+    duration: float,
+    top: int,
+    notification_id: str,
+    profile_path: str,
+    summary_path: str,
+):
+    coordinators = list(config_entry.runtime_data.coordinators.values())
+    try:
+        await profiler.async_run(coordinators, duration)
+        await hass.async_add_executor_job(
+            profiler.write, profile_path, summary_path, coordinators, top
+        )
+    except Exception as e:
+        _LOGGER.warning(f"Profiling {config_entry.title} failed: {e}")
+        persistent_notification.async_create(
+            hass,
+            f"Profiling {config_entry.title} failed: {e}",
+            title="Sessy profile failed",
+            notification_id=notification_id,
+        )
+        return
+
+    _LOGGER.info(f"Wrote Sessy profile to {profile_path} and summary to {summary_path}")
+    persistent_notification.async_create(
+        hass,
+        f"Profiled {profiler.ticks} ticks. Wrote cProfile data to {profile_path} and a summary to {summary_path}",
+        title="Sessy profile complete",
+        notification_id=notification_id,
+    )
+
+
+async def async_get_recent(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the buffered telemetry of a Sessy device for a recent time window"""
+    config_entry = get_loaded_config_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    buffers: dict[str, SessyTelemetryBuffer] = config_entry.runtime_data.telemetry
+    if buffers is None:
+        raise ServiceValidationError(
+            f"No telemetry history is kept for {config_entry.title}"
+        )
+
+    end = time()
+    start = end - call.data[ATTR_DURATION]
+
+    return {
+        name: buffer.query(
+            start, end, call.data.get(ATTR_FIELDS), call.data.get(ATTR_RESOLUTION)
+        )
+        for name, buffer in buffers.items()
+    }
+
+
+async def async_query_archive(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the archived telemetry of a Sessy device for a time range"""
+    config_entry = get_loaded_config_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    archive: SessyArchive = config_entry.runtime_data.archive
+    if archive is None:
+        raise ServiceValidationError(
+            f"The telemetry archive is not enabled for {config_entry.title}"
+        )
+
+    start = dt_util.as_timestamp(call.data[ATTR_START])
+    end = dt_util.as_timestamp(call.data[ATTR_END]) if ATTR_END in call.data else time()
+    if end < start:
+        raise ServiceValidationError("The end of the range is before its start")
+
+    return await hass.async_add_executor_job(
+        archive.query, start, end, call.data.get(ATTR_FIELDS)
+    )
+
+
+async def async_install_firmware(hass: HomeAssistant, call: ServiceCall):
+    """Install firmware on a number of Sessy devices in waves, in the background"""
+    config_entries = [
+        get_loaded_config_entry(hass, entry_id)
+        for entry_id in get_config_entry_ids(hass, call.data[ATTR_DEVICE_ID])
+    ]
+    tracker = await async_get_ota_tracker(hass)
+    tracker.async_start_rollout(config_entries, call.data[ATTR_WAVE_SIZE])
+
+
+async def async_fetch(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the payload of a Sessy endpoint, only requesting it if the latest is older than max_age"""
+    config_entry = get_loaded_config_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    endpoint = call.data[ATTR_ENDPOINT]
+
+    coordinators: dict[str, SessyCoordinator] = {
+        coordinator.name: coordinator
+        for coordinator in config_entry.runtime_data.coordinators.values()
+    }
+    coordinator = coordinators.get(endpoint)
+    if coordinator is None:
+        raise ServiceValidationError(
+            f"{config_entry.title} has no {endpoint} endpoint, choose one of {', '.join(sorted(coordinators))}"
+        )
+
+    try:
+        data, age = await coordinator.async_get_raw_data(call.data[ATTR_MAX_AGE])
+    except Exception as e:
+        raise HomeAssistantError(f"Fetching {endpoint} of {config_entry.title} failed: {e}") from e
+
+    if ATTR_FIELDS in call.data:
+        data = {field: get_nested_key(data, field) for field in call.data[ATTR_FIELDS]}
+
+    return {
+        "endpoint": endpoint,
+        "age": round(age, 3),
+        "data": data,
+    }
+
+
+async def async_turbo(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Poll the power endpoints of a Sessy device at a sub-second interval for a limited time"""
+    config_entry = get_loaded_config_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    runtime_data = config_entry.runtime_data
+
+    # A new call replaces the running turbo mode
+    previous: SessyTurbo = runtime_data.turbo
+    if previous is not None:
+        previous.async_stop()
+    if call.data[ATTR_DURATION] == 0:
+        return previous.as_dict() if previous is not None else dict()
+
+    turbo = SessyTurbo(
+        hass,
+        config_entry,
+        timedelta(seconds=call.data[ATTR_INTERVAL]),
+        timedelta(seconds=call.data[ATTR_DURATION]),
+    )
+    if len(turbo.coordinators) == 0:
+        raise ServiceValidationError(f"{config_entry.title} has no power endpoints")
+    turbo.async_start()
+    runtime_data.turbo = turbo
+    return turbo.as_dict()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register the Sessy services"""
+
+    async def handle_profile(call: ServiceCall) -> ServiceResponse:
+        return await async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        handle_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_get_recent(call: ServiceCall) -> ServiceResponse:
+        return await async_get_recent(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_RECENT,
+        handle_get_recent,
+        schema=SERVICE_GET_RECENT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def handle_query_archive(call: ServiceCall) -> ServiceResponse:
+        return await async_query_archive(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ARCHIVE,
+        handle_query_archive,
+        schema=SERVICE_QUERY_ARCHIVE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def handle_install_firmware(call: ServiceCall):
+        await async_install_firmware(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INSTALL_FIRMWARE,
+        handle_install_firmware,
+        schema=SERVICE_INSTALL_FIRMWARE_SCHEMA,
+    )
+
+    async def handle_fetch(call: ServiceCall) -> ServiceResponse:
+        return await async_fetch(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FETCH,
+        handle_fetch,
+        schema=SERVICE_FETCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def handle_turbo(call: ServiceCall) -> ServiceResponse:
+        return await async_turbo(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TURBO,
+        handle_turbo,
+        schema=SERVICE_TURBO_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,173 @@
+"""Hourly long-term statistics for the Sessy energy counters"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any, Callable
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_STORAGE_VERSION, STATISTICS_WRITE_SECOND
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .util import get_nested_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cumulative Wh counters per coordinator function, with the statistic name suffix
+STATISTICS_COUNTERS: dict[str, list[tuple[str, str]]] = {
+    "get_energy_status": [
+        ("sessy_energy.import_wh", "Charged Energy"),
+        ("sessy_energy.export_wh", "Discharged Energy"),
+        *[
+            (f"energy_phase{phase_id}.{direction}_wh", f"Phase {phase_id} {name} Energy")
+            for phase_id in range(1, 4)
+            for direction, name in (("import", "Imported"), ("export", "Exported"))
+        ],
+    ],
+    "get_p1_details": [
+        (f"power_{direction}_tariff{tariff_id}", f"Tariff {tariff_id} {name} Energy")
+        for tariff_id in range(1, 3)
+        for direction, name in (("consumed", "Consumed"), ("produced", "Produced"))
+    ],
+    "get_modbus_details": [
+        ("total_import", "Modbus Total Imported Energy"),
+        ("total_export", "Modbus Total Exported Energy"),
+    ],
+}
+
+
+async def async_setup_statistics(hass: HomeAssistant, config_entry: SessyConfigEntry) -> list[SessyStatisticsWriter]:
+    """Start writing hourly statistics for all coordinators with energy counters"""
+    writers = list()
+    coordinators: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+    for coordinator in coordinators.values():
+        counters = STATISTICS_COUNTERS.get(coordinator.name)
+        if counters is None:
+            continue
+
+        writer = SessyStatisticsWriter(hass, config_entry, coordinator, counters)
+        await writer.async_start()
+        config_entry.async_on_unload(writer.async_stop)
+        writers.append(writer)
+
+    return writers
+
+
+class SessyStatisticsWriter:
+    """Keeps the latest energy counter readings of a coordinator and writes them as hourly external statistics
+
+    Counter resets (e.g. after replacing a meter) are folded into a persisted offset,
+    so the statistic sum keeps increasing.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        coordinator: SessyCoordinator,
+        counters: list[tuple[str, str]],
+    ):
+        self.hass = hass
+        self.coordinator = coordinator
+        self.counters = counters
+
+        device = config_entry.runtime_data.device
+        self._serial_number = device.serial_number.lower()
+        self._device_name = device.name
+
+        self._store: Store = Store(
+            hass,
+            STATISTICS_STORAGE_VERSION,
+            f"{DOMAIN}.statistics.{self._serial_number}.{coordinator.name}",
+        )
+        # Per counter key: latest reading and offset from earlier counter resets
+        self._counters: dict[str, dict[str, float]] = dict()
+        self._unsubscribers: list[Callable] = list()
+
+    async def async_start(self):
+        stored = await self._store.async_load()
+        if stored is not None:
+            self._counters = stored
+
+        self._unsubscribers.append(
+            self.coordinator.async_add_sample_listener(self._handle_sample)
+        )
+        self._unsubscribers.append(
+            async_track_time_change(
+                self.hass, self._async_write_hour, minute=0, second=STATISTICS_WRITE_SECOND
+            )
+        )
+
+    @callback
+    def async_stop(self):
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+        self._store.async_delay_save(self._data_to_save)
+
+    def statistic_id(self, key: str) -> str:
+        return f"{DOMAIN}:{self._serial_number}_{key.replace('.', '_')}"
+
+    @callback
+    def _handle_sample(self, data: dict):
+        for key, _ in self.counters:
+            value = get_nested_key(data, key)
+            if value is None:
+                continue
+
+            counter = self._counters.setdefault(key, {"last": value, "offset": 0})
+            if value < counter["last"]:
+                _LOGGER.info(
+                    f"Counter {key} of {self._device_name} decreased from {counter['last']} to {value}, treating it as a counter reset"
+                )
+                counter["offset"] += counter["last"]
+                self._store.async_delay_save(self._data_to_save)
+            counter["last"] = value
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return self._counters
+
+    @callback
+    def _async_write_hour(self, now: datetime):
+        """Write the counter readings at the end of the previous hour"""
+        hour_start = dt_util.as_utc(now).replace(
+            minute=0, second=0, microsecond=0
+        ) - timedelta(hours=1)
+
+        for key, name in self.counters:
+            counter = self._counters.get(key)
+            if counter is None:
+                continue
+
+            metadata = StatisticMetaData(
+                has_mean=False,
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=f"{self._device_name} {name}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+            )
+            statistic = StatisticData(
+                start=hour_start,
+                state=counter["last"],
+                sum=counter["last"] + counter["offset"],
+            )
+            async_add_external_statistics(self.hass, metadata, [statistic])
+
+        # Persist the latest readings to detect counter resets across restarts
+        self._store.async_delay_save(self._data_to_save)
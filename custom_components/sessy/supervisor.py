@@ -0,0 +1,99 @@
+"""Pause polling while a Sessy device restarts or is offline"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import StrEnum
+import logging
+from typing import Callable
+
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+
+from sessypy.devices import SessyDevice
+
+from .const import (
+    RECONNECT_PROBE_DELAY,
+    RECONNECT_PROBE_MAX_DELAY,
+    RECONNECT_PROBE_TIMEOUT,
+    RECONNECT_RESUME_STAGGER,
+)
+from .models import SessyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessyPauseReason(StrEnum):
+    RESTART = "restart"
+    OFFLINE = "offline"
+
+
+class SessySupervisor:
+    """Pauses all coordinators of a device and probes it until it answers again.
+
+    While restarting, coordinators keep their last data. While offline, they fail
+    without sending requests. Once the device answers, all endpoints are refreshed
+    one after another."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: SessyConfigEntry, device: SessyDevice):
+        self.hass = hass
+        self.config_entry = config_entry
+        self.device = device
+
+        self.pause_reason: SessyPauseReason = None
+        self._probe_task: asyncio.Task = None
+
+    @property
+    def paused(self) -> bool:
+        return self.pause_reason is not None
+
+    async def async_restart(self):
+        """Restart the device, pausing polling until it is back"""
+        await self.device.restart()
+        _LOGGER.info(f"Restarting {self.device.name}, pausing polling until it answers again")
+        self.async_pause(SessyPauseReason.RESTART)
+
+    @callback
+    def async_set_offline(self, endpoint: str):
+        """Called by a coordinator that failed to connect after its retries"""
+        if self.paused:
+            return
+        _LOGGER.warning(
+            f"{self.device.name} did not answer on {endpoint}, pausing polling until it answers again"
+        )
+        self.async_pause(SessyPauseReason.OFFLINE)
+
+    @callback
+    def async_pause(self, reason: SessyPauseReason):
+        self.pause_reason = reason
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_probe(), f"{self.device.name} reconnect"
+            )
+
+    async def _async_probe(self):
+        """Probe the device with backoff until it answers, then resume polling"""
+        delay = RECONNECT_PROBE_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                async with async_timeout.timeout(RECONNECT_PROBE_TIMEOUT):
+                    await self.device.get_system_info()
+                break
+            except Exception as e:
+                _LOGGER.debug(f"{self.device.name} not answering yet, next probe in {delay} seconds: {e}")
+                delay = min(delay * 2, RECONNECT_PROBE_MAX_DELAY)
+
+        _LOGGER.info(f"{self.device.name} is answering again, resuming polling")
+        self.pause_reason = None
+        await self._async_resume()
+
+    async def _async_resume(self):
+        """Refresh the endpoints one after another, to not flood the device"""
+        coordinators: dict[Callable, object] = self.config_entry.runtime_data.coordinators
+        for coordinator in coordinators.values():
+            if not coordinator.has_listeners:
+                continue
+            await coordinator.async_refresh()
+            await asyncio.sleep(RECONNECT_RESUME_STAGGER)
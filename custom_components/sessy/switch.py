@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
@@ -13,14 +14,27 @@ from sessypy.util import SessyNotSupportedException, SessyConnectionException
 from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Settings of the standard entity profile, removed in the minimal profile
+STANDARD_SWITCHES = (
+    "Eco NOM Charging Enabled",
+    "Temperature Limit Enabled",
+)
+
+
+@track_platform_setup(Platform.SWITCH)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -30,7 +44,10 @@ async def async_setup_entry(
     coordinators = config_entry.runtime_data.coordinators
     switches = []
 
-    if isinstance(device, SessyBattery):
+    # Settings are not part of the minimal entity profile
+    if isinstance(device, SessyBattery) and config_entry.runtime_data.entity_profile.includes(
+        SessyEntityProfile.STANDARD
+    ):
         # Firmware or hardware-revision specific settings
         try:
             system_settings_coordinator: SessyCoordinator = coordinators[
@@ -72,6 +89,10 @@ async def async_setup_entry(
             _LOGGER.warning(f"Error setting firmware specific settings: {e}")
 
     async_add_entities(switches)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.SWITCH, map(name_unique_id_suffix, STANDARD_SWITCHES)
+        )
 
 
 class SessySettingSwitchEntity(SessyCoordinatorEntity, SwitchEntity):
@@ -0,0 +1,228 @@
+"""In-memory ring buffers of recent high-rate Sessy telemetry"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from math import ceil, floor, isnan, nan
+from time import time
+from typing import Any, Callable
+
+from homeassistant.core import callback
+
+from .const import CONF_TELEMETRY_HOURS, DEFAULT_TELEMETRY_HOURS
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .util import get_nested_key
+
+# Numeric fields kept per coordinator function
+TELEMETRY_FIELDS: dict[str, list[str]] = {
+    "get_power_status": [
+        "sessy.power",
+        "sessy.state_of_charge",
+        "sessy.frequency",
+        "sessy.external_power",
+        *[f"renewable_energy_phase{phase_id}.power" for phase_id in range(1, 4)],
+    ],
+    "get_p1_details": [
+        "power_total",
+        *[
+            f"{field}_l{phase_id}"
+            for phase_id in range(1, 4)
+            for field in ("power_consumed", "power_produced", "voltage", "current")
+        ],
+    ],
+    "get_ct_details": [
+        "total_power",
+        *[
+            f"{field}_l{phase_id}"
+            for phase_id in range(1, 4)
+            for field in ("power", "voltage", "current")
+        ],
+    ],
+    "get_modbus_details": [
+        "total_power",
+        *[
+            f"phase_{phase_id}.{field}"
+            for phase_id in range(1, 4)
+            for field in ("power", "voltage", "current")
+        ],
+    ],
+}
+
+
+def async_setup_telemetry(config_entry: SessyConfigEntry) -> dict[str, SessyTelemetryBuffer] | None:
+    """Start buffering the telemetry of the polled coordinators with telemetry fields.
+
+    Returns None if no telemetry is kept. Endpoints whose entities are all disabled are
+    not buffered, so they stay idle."""
+    if config_entry.options.get(CONF_TELEMETRY_HOURS, DEFAULT_TELEMETRY_HOURS) == 0:
+        return None
+
+    buffers = dict()
+    coordinators: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+    for coordinator in coordinators.values():
+        fields = TELEMETRY_FIELDS.get(coordinator.name)
+        if fields is None or not coordinator.has_listeners:
+            continue
+
+        buffer = SessyTelemetryBuffer(fields, telemetry_capacity(config_entry, coordinator))
+        config_entry.async_on_unload(
+            coordinator.async_add_sample_listener(buffer.async_handle_sample)
+        )
+        buffers[coordinator.name] = buffer
+
+    return buffers
+
+
+def update_telemetry_options(config_entry: SessyConfigEntry):
+    """Resize the telemetry buffers to the configured retention and current sample rate"""
+    buffers = config_entry.runtime_data.telemetry
+    if buffers is None:
+        return
+
+    coordinators: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+    for coordinator in coordinators.values():
+        buffer = buffers.get(coordinator.name)
+        if buffer is not None:
+            buffer.resize(telemetry_capacity(config_entry, coordinator))
+
+
+def telemetry_capacity(config_entry: SessyConfigEntry, coordinator: SessyCoordinator) -> int:
+    """Number of samples needed to cover the configured retention"""
+    hours = config_entry.options.get(CONF_TELEMETRY_HOURS, DEFAULT_TELEMETRY_HOURS)
+    interval = coordinator.sample_interval or coordinator.update_interval
+    if hours == 0 or interval is None:
+        return 0
+    return ceil(hours * 3600 / interval.total_seconds())
+
+
+class SessyTelemetryBuffer:
+    """Fixed-size ring buffer of timestamped samples, stored as one array('d') per field
+
+    Missing values are stored as NaN. Timestamps are seconds since the epoch.
+    """
+
+    def __init__(self, fields: list[str], capacity: int):
+        self.fields = fields
+        self._capacity = 0
+        self._timestamps = array("d")
+        self._columns: dict[str, array] = {field: array("d") for field in fields}
+        # Physical index of the next sample and number of samples held
+        self._next = 0
+        self._count = 0
+        self.resize(capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @callback
+    def async_handle_sample(self, data: dict):
+        self.append(time(), data)
+
+    def append(self, timestamp: float, data: dict):
+        if self._capacity == 0:
+            return
+
+        index = self._next
+        self._timestamps[index] = timestamp
+        for field, column in self._columns.items():
+            value = get_nested_key(data, field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                value = nan
+            column[index] = value
+
+        self._next = (index + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def resize(self, capacity: int):
+        """Change the capacity, keeping the most recent samples that fit"""
+        if capacity == self._capacity:
+            return
+
+        keep = min(self._count, capacity)
+        self._timestamps = self._resized(self._timestamps, keep, capacity)
+        for field, column in self._columns.items():
+            self._columns[field] = self._resized(column, keep, capacity)
+
+        self._capacity = capacity
+        self._count = keep
+        self._next = keep % capacity if capacity > 0 else 0
+
+    def _resized(self, column: array, keep: int, capacity: int) -> array:
+        ordered = self._ordered(column)
+        resized = ordered[len(ordered) - keep :] if keep > 0 else array("d")
+        resized.extend(array("d", bytes(8 * (capacity - keep))))
+        return resized
+
+    def _ordered(self, column: array) -> array:
+        """Return the held samples of a column, oldest first"""
+        if self._count < self._capacity:
+            # The buffer has not wrapped yet, samples start at index 0
+            return column[: self._count]
+        return column[self._next :] + column[: self._next]
+
+    def query(
+        self,
+        start: float,
+        end: float,
+        fields: list[str] | None = None,
+        resolution: float | None = None,
+    ) -> dict[str, Any]:
+        """Return the samples between start and end in columnar form.
+
+        With a resolution (in seconds), samples are averaged per bucket of that size,
+        using the bucket start as timestamp."""
+        if fields is None:
+            fields = self.fields
+
+        timestamps = self._ordered(self._timestamps)
+        first = bisect_left(timestamps, start)
+        last = bisect_right(timestamps, end)
+        timestamps = timestamps[first:last]
+        columns = {
+            field: self._ordered(self._columns[field])[first:last]
+            for field in fields
+            if field in self._columns
+        }
+
+        if resolution:
+            timestamps, columns = downsample(timestamps, columns, resolution)
+
+        return {
+            "timestamps": list(timestamps),
+            "values": {
+                field: [None if isnan(value) else value for value in column]
+                for field, column in columns.items()
+            },
+        }
+
+
+def downsample(
+    timestamps: array, columns: dict[str, array], resolution: float
+) -> tuple[array, dict[str, array]]:
+    """Average samples per time bucket, ignoring missing values"""
+    bucket_timestamps = array("d")
+    bucket_columns = {field: array("d") for field in columns}
+
+    bucket_start = 0
+    while bucket_start < len(timestamps):
+        bucket = floor(timestamps[bucket_start] / resolution)
+        bucket_end = max(
+            bisect_left(timestamps, (bucket + 1) * resolution, bucket_start),
+            bucket_start + 1,
+        )
+
+        bucket_timestamps.append(bucket * resolution)
+        for field, column in columns.items():
+            values = [value for value in column[bucket_start:bucket_end] if not isnan(value)]
+            bucket_columns[field].append(sum(values) / len(values) if values else nan)
+
+        bucket_start = bucket_end
+
+    return bucket_timestamps, bucket_columns
@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import time
 
 from homeassistant.components.time import TimeEntity
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
@@ -14,8 +15,13 @@ from sessypy.util import SessyConnectionException, SessyNotSupportedException
 from typing import Callable, Optional
 
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
 from .util import start_time_from_string, stop_time_from_string, time_from_string
 
 import logging
@@ -23,6 +29,14 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+# Settings of the standard entity profile, removed in the minimal profile
+STANDARD_TIME_ENTITIES = (
+    "Start Time",
+    "Stop Time",
+)
+
+
+@track_platform_setup(Platform.TIME)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -32,7 +46,10 @@ async def async_setup_entry(
     coordinators = config_entry.runtime_data.coordinators
     time_entities = []
 
-    if isinstance(device, SessyBattery):
+    # Settings are not part of the minimal entity profile
+    if isinstance(device, SessyBattery) and config_entry.runtime_data.entity_profile.includes(
+        SessyEntityProfile.STANDARD
+    ):
         system_settings_coordinator: SessyCoordinator = coordinators[
             device.get_system_settings
         ]
@@ -91,6 +108,10 @@ async def async_setup_entry(
         )
 
     async_add_entities(time_entities)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.TIME, map(name_unique_id_suffix, STANDARD_TIME_ENTITIES)
+        )
 
 
 class SessyTimeEntity(SessyCoordinatorEntity, TimeEntity):
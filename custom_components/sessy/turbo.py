@@ -0,0 +1,123 @@
+"""Time-limited sub-second polling of the Sessy power endpoints"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from time import monotonic
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+TURBO_FUNCTIONS = ("get_power_status", "get_p1_details", "get_ct_details")
+
+
+class SessyTurbo:
+    """Polls the power endpoints of a device at a sub-second interval until it expires.
+
+    Records the successful requests and skipped ticks per endpoint, to compare the
+    achieved interval with the requested one."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: SessyConfigEntry,
+        interval: timedelta,
+        duration: timedelta,
+    ):
+        self.hass = hass
+        self.config_entry = config_entry
+        self.interval = interval
+        self.duration = duration
+
+        coordinators: dict[Callable, SessyCoordinator] = config_entry.runtime_data.coordinators
+        self.coordinators = [
+            coordinator
+            for coordinator in coordinators.values()
+            if coordinator.name in TURBO_FUNCTIONS
+        ]
+
+        self.expires: datetime = None
+        self._started: float = None
+        self._stopped: float = None
+        # Successful requests and skipped ticks per endpoint at the start and end
+        self._start_counts: dict[str, tuple[int, int]] = dict()
+        self._stop_counts: dict[str, tuple[int, int]] = dict()
+        self._unsub_expire: Callable[[], None] = None
+
+    @property
+    def active(self) -> bool:
+        return self._started is not None and self._stopped is None
+
+    @callback
+    def async_start(self):
+        self._started = monotonic()
+        self.expires = dt_util.utcnow() + self.duration
+        for coordinator in self.coordinators:
+            self._start_counts[coordinator.name] = self._counts(coordinator)
+            coordinator.async_set_turbo_interval(self.interval)
+        self._unsub_expire = async_call_later(self.hass, self.duration, self._async_expire)
+        _LOGGER.info(
+            f"Turbo mode of {self.config_entry.title} started at {self.interval.total_seconds()} seconds until {self.expires}"
+        )
+
+    @callback
+    def _async_expire(self, now=None):
+        self._unsub_expire = None
+        self.async_stop()
+
+    @callback
+    def async_stop(self):
+        if not self.active:
+            return
+        if self._unsub_expire is not None:
+            self._unsub_expire()
+            self._unsub_expire = None
+
+        self._stopped = monotonic()
+        for coordinator in self.coordinators:
+            coordinator.async_set_turbo_interval(None)
+            self._stop_counts[coordinator.name] = self._counts(coordinator)
+
+        _LOGGER.info(
+            f"Turbo mode of {self.config_entry.title} ended: "
+            + ", ".join(
+                f"{name} every {endpoint['achieved_interval']} seconds ({endpoint['ticks_skipped']} ticks skipped)"
+                for name, endpoint in self.as_dict()["endpoints"].items()
+            )
+        )
+
+    @staticmethod
+    def _counts(coordinator: SessyCoordinator) -> tuple[int, int]:
+        return coordinator.metrics.successful_requests, coordinator.metrics.ticks_skipped
+
+    def as_dict(self) -> dict[str, Any]:
+        """Requested and achieved interval per endpoint, so far or over the whole run"""
+        elapsed = (self._stopped or monotonic()) - self._started
+        endpoints = dict()
+        for coordinator in self.coordinators:
+            start_requests, start_skipped = self._start_counts[coordinator.name]
+            end_requests, end_skipped = self._stop_counts.get(
+                coordinator.name, self._counts(coordinator)
+            )
+            requests = end_requests - start_requests
+            endpoints[coordinator.name] = {
+                "requests": requests,
+                "ticks_skipped": end_skipped - start_skipped,
+                "achieved_interval": round(elapsed / requests, 3) if requests else None,
+            }
+
+        return {
+            "active": self.active,
+            "interval": self.interval.total_seconds(),
+            "expires": self.expires.isoformat(),
+            "elapsed": round(elapsed, 1),
+            "endpoints": endpoints,
+        }
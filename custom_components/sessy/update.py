@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any, Callable, Optional
 
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.components.update import (
     UpdateEntity,
@@ -12,20 +13,21 @@ from homeassistant.components.update import (
 )
 from homeassistant.exceptions import HomeAssistantError
 
-from sessypy.const import SessyOtaTarget, SessyOtaState
-from sessypy.devices import SessyDevice
+from sessypy.const import SessyOtaState
 from sessypy.util import SessyConnectionException, SessyNotSupportedException
 
 from custom_components.sessy.device import update_sw_version
 
-from .const import (
-    DEFAULT_SCAN_INTERVAL,
-    SCAN_INTERVAL_OTA_BUSY,
-    SESSY_RELEASE_NOTES_URL,
-)
+from .const import SESSY_RELEASE_NOTES_URL
 from .coordinator import SessyCoordinator
-from .entity import SessyCoordinatorEntity
-from .models import SessyConfigEntry, SessyConnectedDeviceType
+from .entity import (
+    SessyCoordinatorEntity,
+    async_remove_excluded_entities,
+    name_unique_id_suffix,
+)
+from .metrics import track_platform_setup
+from .models import SessyConfigEntry, SessyConnectedDeviceType, SessyEntityProfile
+from .ota import SessyOtaTracker
 from .util import unit_interval_to_percentage
 
 import logging
@@ -33,6 +35,13 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+# Update entities of the standard entity profile, removed in the minimal profile
+STANDARD_UPDATE_ENTITIES = (
+    "Firmware",
+)
+
+
+@track_platform_setup(Platform.UPDATE)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: SessyConfigEntry, async_add_entities
 ):
@@ -41,9 +50,14 @@ async def async_setup_entry(
     update_entities = []
 
     # Treat Sessy Dongle and serial device (AC board) as one unit
-    update_entities.append(SessyUpdate(hass, config_entry, "Firmware"))
+    if config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        update_entities.append(SessyUpdate(hass, config_entry, "Firmware"))
 
     async_add_entities(update_entities)
+    if not config_entry.runtime_data.entity_profile.includes(SessyEntityProfile.STANDARD):
+        async_remove_excluded_entities(
+            hass, config_entry, Platform.UPDATE, map(name_unique_id_suffix, STANDARD_UPDATE_ENTITIES)
+        )
 
 
 class SessyUpdate(SessyCoordinatorEntity, UpdateEntity):
@@ -154,19 +168,13 @@ class SessyUpdate(SessyCoordinatorEntity, UpdateEntity):
         else:
             self._attr_in_progress = False
 
-        # Poll more frequently if an update is in progress
-        if self._attr_in_progress:
-            self.coordinator.update_interval = SCAN_INTERVAL_OTA_BUSY
-        else:
-            # Restore scan interval
-            self.coordinator.update_interval = DEFAULT_SCAN_INTERVAL
-
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
     ) -> None:
-        device: SessyDevice = self.config_entry.runtime_data.device
+        ota_tracker: SessyOtaTracker = self.config_entry.runtime_data.ota_tracker
         try:
-            await device.install_ota(SessyOtaTarget.ALL)
+            # The OTA tracker polls the progress until the install is done
+            await ota_tracker.async_install(self.config_entry)
             self._attr_in_progress = True
         except SessyNotSupportedException as e:
             raise HomeAssistantError(
@@ -183,9 +191,4 @@ class SessyUpdate(SessyCoordinatorEntity, UpdateEntity):
                 f"Starting update for {self.name} failed: {e.__class__}"
             ) from e
 
-        _LOGGER.info(
-            "Setting OTA status update interval to lower interval (from install action)"
-        )
-
-        self.coordinator.update_interval = SCAN_INTERVAL_OTA_BUSY
-        await self.coordinator.async_request_refresh()
+        self.async_write_ha_state()
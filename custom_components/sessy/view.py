@@ -0,0 +1,82 @@
+"""HTTP view serving the latest Sessy payloads to other consumers"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from http import HTTPStatus
+import logging
+from math import inf
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView, require_admin
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN, PAYLOAD_VIEW_URL
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessyPayloadView(HomeAssistantView):
+    """Serves the latest payload of a Sessy endpoint, so other tools don't poll the device themselves.
+
+    The body is the payload as returned by the device. The Age header holds the seconds
+    since it was fetched, and requests with a matching If-None-Match get a 304 response.
+    A max_age query parameter requests the device if the payload is older. Payloads include
+    the device settings, so only administrators can read them."""
+
+    url = PAYLOAD_VIEW_URL
+    name = "api:sessy:payload"
+    requires_auth = True
+
+    @require_admin
+    async def get(self, request: web.Request, serial: str, endpoint: str) -> web.Response:
+        hass = request.app[KEY_HASS]
+
+        try:
+            max_age = float(request.query.get("max_age", inf))
+        except ValueError:
+            return self.json_message("max_age must be a number of seconds", HTTPStatus.BAD_REQUEST)
+
+        coordinator = get_endpoint_coordinator(
+            hass.config_entries.async_loaded_entries(DOMAIN), serial, endpoint
+        )
+        if coordinator is None:
+            return self.json_message(
+                f"No loaded Sessy device {serial} with endpoint {endpoint}", HTTPStatus.NOT_FOUND
+            )
+
+        try:
+            # Payloads are fetched only if cached from a previous start, or older than max_age
+            data, age = await coordinator.async_get_raw_data(max_age)
+        except Exception as e:
+            _LOGGER.debug(f"Serving {endpoint} of {serial} failed: {e}")
+            return self.json_message(
+                f"Fetching {endpoint} of {serial} failed", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        body = json_bytes(data)
+        headers = {
+            "ETag": f'"{blake2b(body, digest_size=8).hexdigest()}"',
+            "Age": str(int(age)),
+            "Cache-Control": "no-cache",
+        }
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+
+def get_endpoint_coordinator(
+    config_entries: list[SessyConfigEntry], serial: str, endpoint: str
+) -> SessyCoordinator | None:
+    """Find the coordinator of an endpoint by device serial, the get_ prefix of the endpoint is optional"""
+    name = endpoint if endpoint.startswith("get_") else f"get_{endpoint}"
+    for config_entry in config_entries:
+        if config_entry.runtime_data.device.serial_number.upper() != serial.upper():
+            continue
+        for coordinator in config_entry.runtime_data.coordinators.values():
+            if coordinator.name == name:
+                return coordinator
+    return None
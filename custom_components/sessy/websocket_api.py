@@ -0,0 +1,180 @@
+"""Websocket API streaming raw Sessy samples to subscribed clients"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from time import time
+from typing import Any, Callable
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    ATTR_BATCH_INTERVAL,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ENDPOINT,
+    ATTR_FIELDS,
+    ATTR_INTERVAL,
+    STREAM_MAX_BATCH_INTERVAL,
+    STREAM_MAX_INTERVAL,
+    STREAM_MIN_INTERVAL,
+    WS_TYPE_SUBSCRIBE,
+)
+from .coordinator import SessyCoordinator
+from .models import SessyConfigEntry
+from .services import get_loaded_config_entry
+from .telemetry import TELEMETRY_FIELDS
+from .util import get_nested_key
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant):
+    """Register the Sessy websocket commands"""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@callback
+def async_end_streams(config_entry: SessyConfigEntry):
+    """End the sample streams of a device that is unloaded"""
+    for end_stream in list(config_entry.runtime_data.streams):
+        end_stream()
+
+
+class SessySampleStream:
+    """Sends selected fields of every sample to a websocket subscriber.
+
+    Each event holds a list of samples, a sample being the timestamp followed by
+    the field values in the order of the first event."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        fields: list[str],
+        batch_interval: float,
+    ):
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.fields = fields
+        self.batch_interval = batch_interval
+
+        self._batch: list[list[Any]] = list()
+        self._unsub_flush: Callable[[], None] = None
+
+    @callback
+    def async_start(self, data: dict):
+        self._send({"fields": self.fields})
+        if data:
+            self.async_handle_sample(data)
+
+    @callback
+    def async_handle_sample(self, data: dict):
+        self._batch.append([round(time(), 3), *(get_nested_key(data, field) for field in self.fields)])
+        if self.batch_interval == 0:
+            self._async_flush()
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, self.batch_interval, self._async_flush)
+
+    @callback
+    def _async_flush(self, now=None):
+        self._unsub_flush = None
+        if self._batch:
+            self._send({"samples": self._batch})
+            self._batch = list()
+
+    @callback
+    def async_stop(self):
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._batch = list()
+
+    def _send(self, event: dict):
+        self.connection.send_message(websocket_api.event_message(self.msg_id, event))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ENDPOINT): vol.In(list(TELEMETRY_FIELDS)),
+        vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=STREAM_MIN_INTERVAL, max=STREAM_MAX_INTERVAL)
+        ),
+        vol.Optional(ATTR_BATCH_INTERVAL, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=STREAM_MAX_BATCH_INTERVAL)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+):
+    """Stream the samples of a coordinator, sampling at the requested interval while subscribed"""
+    try:
+        config_entry = get_loaded_config_entry(hass, msg[ATTR_CONFIG_ENTRY_ID])
+    except ServiceValidationError as e:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(e))
+        return
+
+    endpoint = msg[ATTR_ENDPOINT]
+    coordinator: SessyCoordinator = next(
+        (
+            coordinator
+            for coordinator in config_entry.runtime_data.coordinators.values()
+            if coordinator.name == endpoint
+        ),
+        None,
+    )
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{config_entry.title} has no {endpoint} endpoint"
+        )
+        return
+
+    stream = SessySampleStream(
+        hass,
+        connection,
+        msg["id"],
+        msg.get(ATTR_FIELDS, TELEMETRY_FIELDS[endpoint]),
+        msg[ATTR_BATCH_INTERVAL],
+    )
+    unsubscribers = [coordinator.async_add_sample_listener(stream.async_handle_sample)]
+    if ATTR_INTERVAL in msg:
+        unsubscribers.append(
+            coordinator.async_request_stream_interval(timedelta(seconds=msg[ATTR_INTERVAL]))
+        )
+
+    streams: set[Callable[[], None]] = config_entry.runtime_data.streams
+
+    @callback
+    def unsubscribe():
+        streams.discard(end_on_unload)
+        stream.async_stop()
+        while unsubscribers:
+            unsubscribers.pop()()
+
+    @callback
+    def end_on_unload():
+        # The device is unloaded or reloaded, the client has to subscribe again
+        if connection.subscriptions.pop(msg["id"], None) is not None:
+            unsubscribe()
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"{config_entry.title} was unloaded")
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    streams.add(end_on_unload)
+    _LOGGER.debug(f"Streaming {endpoint} of {config_entry.title} to websocket subscription {msg['id']}")
+
+    connection.send_result(msg["id"])
+    stream.async_start(coordinator.raw_data)